@@ -0,0 +1,145 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from django import forms
+from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest, JsonResponse
+from django.views.generic import View
+
+
+class AutocompleteWidgetMixin:
+    """
+    Select widget mixin which renders only the selected options. Other options are searched by select2 in the JSON
+    endpoint of AutocompleteView under the url, so the page does not grow with the number of rows in the queryset of
+    the field. Chosen values are still validated against the queryset of the field.
+    """
+
+    def __init__(self, attrs: Optional[Dict[str, Any]] = None, url: str = "") -> None:
+        """
+        Args:
+            attrs (Optional[Dict[str, Any]]): HTML attributes of the select.
+            url (str): Url of the autocomplete endpoint. It can be lazy or set later, e.g. in the form.
+        """
+        super().__init__(attrs=attrs)
+        self.url = url
+        self.exclude: List[int] = []
+
+    def build_attrs(self, base_attrs: Dict[str, Any], extra_attrs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        attrs = super().build_attrs(base_attrs, extra_attrs=extra_attrs)
+        attrs["class"] = f"{attrs.get('class', '')} js-autocomplete".strip()
+        attrs["data-autocomplete-url"] = str(self.url)
+        if self.exclude:
+            attrs["data-autocomplete-exclude"] = ",".join(str(pk) for pk in self.exclude)
+        if not self.is_required:
+            attrs["data-allow-clear"] = "true"
+            attrs["data-placeholder"] = ""
+        return attrs
+
+    def optgroups(self, name: str, value: List[str], attrs: Optional[Dict[str, Any]] = None) -> List[Tuple]:
+        """
+        Build options only from the selected rows of the queryset of the field.
+
+        Args:
+            name (str): Name of the field.
+            value (List[str]): Selected values.
+            attrs (Optional[Dict[str, Any]]): HTML attributes of the options.
+
+        Returns:
+            List[Tuple]: One group with the empty option, if the field has one, and the selected options.
+        """
+        selected_values = {str(selected_value) for selected_value in value if selected_value not in ("", None)}
+        options = []
+        if not self.allow_multiple_selected and self.choices.field.empty_label is not None:
+            options.append(
+                self.create_option(name, "", self.choices.field.empty_label, not selected_values, 0, attrs=attrs)
+            )
+        for obj in get_selected_objects(queryset=self.choices.queryset, selected_values=selected_values):
+            option_value, option_label = self.choices.choice(obj)
+            options.append(
+                self.create_option(name, option_value, option_label, selected=True, index=len(options), attrs=attrs)
+            )
+        return [(None, options, 0)]
+
+
+class AutocompleteSelect(AutocompleteWidgetMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteWidgetMixin, forms.SelectMultiple):
+    pass
+
+
+def get_selected_objects(queryset: QuerySet, selected_values: set) -> List[Model]:
+    """
+    Get rows of the queryset with the selected primary keys. Invalid values, e.g. from a bound form, are ignored.
+
+    Args:
+        queryset (QuerySet): Queryset of the field.
+        selected_values (set): Selected primary keys.
+
+    Returns:
+        List[Model]: The selected rows.
+    """
+    if not selected_values:
+        return []
+    try:
+        return list(queryset.filter(pk__in=selected_values))
+    except (ValueError, ValidationError):
+        return []
+
+
+class AutocompleteView(PermissionRequiredMixin, View, LoginRequiredMixin):
+    """
+    JSON endpoint which select2 queries as the user types. It returns
+    {"results": [{"id": ..., "text": ...}], "pagination": {"more": ...}} for the "term" and "page" parameters.
+
+    Subclasses set the model (or override get_queryset), the permission_required and the search_fields, which are
+    matched with icontains. Primary keys listed in the "exclude" parameter, set by the exclude attribute of the widget,
+    are left out of the results.
+    """
+
+    model: Optional[type[Model]] = None
+    search_fields: List[str] = []
+    ordering: List[str] = ["pk"]
+    paginate_by = 20
+
+    def get_queryset(self) -> QuerySet:
+        return self.model._default_manager.all()
+
+    def search(self, queryset: QuerySet, term: str) -> QuerySet:
+        """
+        Filter rows which contain every word of the term in any of the search fields.
+
+        Args:
+            queryset (QuerySet): Rows to search.
+            term (str): Text typed by the user.
+
+        Returns:
+            QuerySet: Matching rows.
+        """
+        for word in term.split():
+            word_filter = Q()
+            for field_name in self.search_fields:
+                word_filter |= Q(**{f"{field_name}__icontains": word})
+            queryset = queryset.filter(word_filter)
+        return queryset
+
+    def get_result_label(self, obj: Model) -> str:
+        return str(obj)
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        queryset = self.search(queryset=self.get_queryset(), term=request.GET.get("term", ""))
+        exclude = [pk for pk in request.GET.get("exclude", "").split(",") if pk.isdigit()]
+        if exclude:
+            queryset = queryset.exclude(pk__in=exclude)
+        page = request.GET.get("page", "1")
+        page = int(page) if page.isdigit() and int(page) > 0 else 1
+        offset = (page - 1) * self.paginate_by
+        rows = list(queryset.order_by(*self.ordering)[offset : offset + self.paginate_by + 1])
+        return JsonResponse(
+            {
+                "results": [{"id": obj.pk, "text": self.get_result_label(obj)} for obj in rows[: self.paginate_by]],
+                "pagination": {"more": len(rows) > self.paginate_by},
+            }
+        )
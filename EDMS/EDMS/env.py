@@ -14,4 +14,8 @@ env = environ.Env(
     EMAIL_HOST_USER=(str, "user@email.com"),
     EMAIL_HOST_PASSWORD=(str, "password"),
     EXAMPLE_PASSWORD=(str, "!example1"),
+    N_PLUS_ONE_SAMPLE_RATE=(float, 0.0),
+    N_PLUS_ONE_THRESHOLD=(int, 10),
+    METRICS_ALLOWED_IPS=(list, ["127.0.0.1"]),
+    PAGINATION_EXACT_COUNT_THRESHOLD=(int, 10000),
 )
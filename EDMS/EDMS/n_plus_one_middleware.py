@@ -0,0 +1,168 @@
+import logging
+import random
+import re
+import sys
+import traceback
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.template.base import Template
+
+logger = logging.getLogger(__name__)
+
+IN_CLAUSE_PATTERN = re.compile(r"\bIN \((?:%s, )*%s\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def get_query_fingerprint(sql: str) -> str:
+    """
+    Get the shape of the query, the same for queries which differ only in parameters.
+
+    Parameters are already separated from the SQL by the database backend, so only IN clauses which differ in the
+    number of parameters and whitespaces have to be unified.
+
+    Args:
+        sql (str): SQL of the query with %s placeholders.
+
+    Returns:
+        str: Fingerprint of the query.
+    """
+    sql = IN_CLAUSE_PATTERN.sub("IN (...)", sql)
+    return WHITESPACE_PATTERN.sub(" ", sql).strip()
+
+
+class QueryRepetition:
+    def __init__(self, fingerprint: str, template_name: Optional[str], stack: List[str]) -> None:
+        """
+        Query shape repeated in one request, with the place which executed the first repeated query.
+
+        Args:
+            fingerprint (str): Fingerprint of the query.
+            template_name (Optional[str]): Name of the template rendered while the query was executed.
+            stack (List[str]): Formatted frames of the project code which executed the query.
+        """
+        self.fingerprint = fingerprint
+        self.template_name = template_name
+        self.stack = stack
+        self.count = 0
+
+
+class QueryRepetitionCollector:
+    def __init__(self, threshold: int) -> None:
+        """
+        Database execute wrapper which counts queries by fingerprint. The call stack is inspected only once per
+        fingerprint, when the query is executed more than the threshold times.
+
+        Args:
+            threshold (int): Number of executions of the same query shape which is still accepted.
+        """
+        self.threshold = threshold
+        self.counts: Counter = Counter()
+        self.repetitions: Dict[str, QueryRepetition] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        fingerprint = get_query_fingerprint(sql=sql)
+        self.counts[fingerprint] += 1
+        if self.counts[fingerprint] == self.threshold + 1:
+            self.repetitions[fingerprint] = QueryRepetition(
+                fingerprint=fingerprint, template_name=get_rendered_template_name(), stack=get_project_stack()
+            )
+        return execute(sql, params, many, context)
+
+    def get_repetitions(self) -> List[QueryRepetition]:
+        """
+        Get query shapes executed more than the threshold times.
+
+        Returns:
+            List[QueryRepetition]: Repeated queries, the most repeated first.
+        """
+        for fingerprint, repetition in self.repetitions.items():
+            repetition.count = self.counts[fingerprint]
+        return sorted(self.repetitions.values(), key=lambda repetition: repetition.count, reverse=True)
+
+
+def get_rendered_template_name() -> Optional[str]:
+    """
+    Get the name of the innermost template which is being rendered in the current thread.
+
+    Returns:
+        Optional[str]: Name of the template or None if no template is rendered.
+    """
+    frame = sys._getframe(1)
+    while frame:
+        template = frame.f_locals.get("self")
+        if frame.f_code.co_name == "render" and isinstance(template, Template):
+            return template.origin.template_name or template.origin.name
+        frame = frame.f_back
+    return None
+
+
+def get_project_stack() -> List[str]:
+    """
+    Get the current call stack limited to the project code, without installed packages and the standard library.
+
+    Returns:
+        List[str]: Frames formatted as "path:line in function", the outermost first.
+    """
+    base_dir = str(settings.BASE_DIR)
+    return [
+        f"{frame.filename}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir) and "site-packages" not in frame.filename and frame.filename != __file__
+    ]
+
+
+class NPlusOneDetectorMiddleware:
+    """
+    Middleware which detects N+1 queries under real traffic.
+
+    A sample of requests (N_PLUS_ONE_SAMPLE_RATE, from 0 to 1) is inspected. When the same query shape is executed
+    more than N_PLUS_ONE_THRESHOLD times in one request, a warning with the view, the template and the call stack of
+    the first repeated query is logged. The middleware is not used if the sample rate is 0.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.sample_rate: float = settings.N_PLUS_ONE_SAMPLE_RATE
+        self.threshold: int = settings.N_PLUS_ONE_THRESHOLD
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
+        collector = QueryRepetitionCollector(threshold=self.threshold)
+        with connection.execute_wrapper(collector):
+            response = self.get_response(request)
+        for repetition in collector.get_repetitions():
+            self.log_repetition(request=request, repetition=repetition)
+        return response
+
+    def log_repetition(self, request: HttpRequest, repetition: QueryRepetition) -> None:
+        """
+        Log the repeated query with the view and the template which executed it.
+
+        Args:
+            request (HttpRequest): The request which executed the query.
+            repetition (QueryRepetition): The repeated query.
+        """
+        resolver_match = getattr(request, "resolver_match", None)
+        logger.warning(
+            "N+1 query: executed %s times in %s %s (view %s, template %s): %s\n%s",
+            repetition.count,
+            request.method,
+            request.path,
+            resolver_match.view_name if resolver_match else None,
+            repetition.template_name,
+            repetition.fingerprint,
+            "\n".join(repetition.stack),
+            extra={
+                "view_name": resolver_match.view_name if resolver_match else None,
+                "template_name": repetition.template_name,
+                "query_count": repetition.count,
+            },
+        )
@@ -0,0 +1,377 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import Field, Model, Q, QuerySet
+from django.http import Http404
+from django.utils.functional import cached_property
+
+PAGE_PARAMS = ("page", "after", "before")
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator which does not count large querysets. The number of rows is estimated from the table statistics of
+    Postgres for unfiltered querysets and from the query planner for filtered ones. Querysets estimated to have fewer
+    rows than PAGINATION_EXACT_COUNT_THRESHOLD are counted exactly, because such a count is cheap. The estimate is
+    also replaced by the exact count as soon as a page turns out to be the last one or past the end.
+    """
+
+    is_count_estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        estimated_count = get_estimated_count(queryset=self.object_list)
+        if estimated_count is None or estimated_count < settings.PAGINATION_EXACT_COUNT_THRESHOLD:
+            return super().count
+        self.is_count_estimated = True
+        return estimated_count
+
+    def page(self, number: Any) -> Page:
+        """
+        Get the page. A page with fewer rows than per_page is the last one, so its rows give the exact count, which
+        replaces the estimate. It matters mostly for filtered querysets, for which the planner can overestimate a lot.
+        If the estimate points at a page past the real end, the rows are counted exactly and the last real page is
+        returned instead of an empty page or 404.
+
+        Args:
+            number (Any): Number of the page.
+
+        Returns:
+            Page: The page.
+        """
+        try:
+            page = super().page(number)
+        except EmptyPage:
+            if not self.is_count_estimated or int(number) < 1:
+                raise
+            return self.get_page_with_exact_count(number=int(number))
+        if self.is_count_estimated:
+            rows_count = len(page.object_list)
+            if not rows_count and page.number > 1:
+                return self.get_page_with_exact_count(number=page.number)
+            if rows_count < self.per_page:
+                self.set_exact_count(count=(page.number - 1) * self.per_page + rows_count)
+        return page
+
+    def get_page_with_exact_count(self, number: int) -> Page:
+        """
+        Count the rows exactly and get the page, or the last page if the number is past the end.
+
+        Args:
+            number (int): Number of the page.
+
+        Returns:
+            Page: The page.
+        """
+        self.set_exact_count(count=self.object_list.count())
+        return super().page(min(number, self.num_pages))
+
+    def set_exact_count(self, count: int) -> None:
+        """
+        Replace the estimated count with the exact one.
+
+        Args:
+            count (int): Exact number of rows.
+        """
+        self.count = count
+        self.is_count_estimated = False
+        self.__dict__.pop("num_pages", None)
+
+
+def get_estimated_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Estimate the number of rows of the queryset without running it.
+
+    Args:
+        queryset (QuerySet): The queryset.
+
+    Returns:
+        Optional[int]: Estimated number of rows or None if Postgres has no statistics of the table yet.
+    """
+    if queryset.query.is_sliced or queryset.query.distinct or queryset.query.combinator:
+        return None
+    if not queryset.query.where:
+        return get_table_row_estimate(queryset=queryset)
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+def get_table_row_estimate(queryset: QuerySet) -> Optional[int]:
+    """
+    Get the number of rows of the table of the queryset, which Postgres keeps in pg_class since the last VACUUM or
+    ANALYZE.
+
+    Args:
+        queryset (QuerySet): Unfiltered queryset.
+
+    Returns:
+        Optional[int]: Number of rows or None if the table has not been analyzed yet.
+    """
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class KeysetPaginator:
+    def __init__(self, queryset: QuerySet, per_page: int) -> None:
+        """
+        Paginator which seeks pages by the values of the ordering columns of the last or the first row of the
+        neighbouring page, instead of skipping rows with OFFSET. The cost of a page does not depend on its depth.
+
+        The primary key is added to the ordering, so the order of rows is unique.
+
+        Args:
+            queryset (QuerySet): Ordered queryset to paginate. Ordering columns can not be null.
+            per_page (int): Number of rows on a page.
+        """
+        self.per_page = per_page
+        self.ordering = get_keyset_ordering(queryset=queryset)
+        self.queryset = queryset.order_by(*self.ordering)
+
+    def page(self, after: Optional[str] = None, before: Optional[str] = None) -> "KeysetPage":
+        """
+        Get the page after or before the row of the cursor. An empty cursor means the first page (after) or the last
+        page (before).
+
+        Args:
+            after (Optional[str]): Cursor of the last row of the previous page.
+            before (Optional[str]): Cursor of the first row of the next page.
+
+        Returns:
+            KeysetPage: The page of rows.
+
+        Raises:
+            Http404: If the cursor is invalid.
+        """
+        is_backward = before is not None
+        cursor = before if is_backward else after
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self.get_seek_filter(values=self.decode_cursor(cursor), is_backward=is_backward))
+        if is_backward:
+            queryset = queryset.reverse()
+        rows = list(queryset[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if is_backward:
+            rows.reverse()
+            return KeysetPage(object_list=rows, paginator=self, has_next=bool(cursor), has_previous=has_more)
+        return KeysetPage(object_list=rows, paginator=self, has_next=has_more, has_previous=bool(cursor))
+
+    def get_seek_filter(self, values: List[Any], is_backward: bool) -> Q:
+        """
+        Build the condition of rows placed after (or before) the row with the given values of the ordering columns,
+        e.g. (a > x) OR (a = x AND b > y) for ordering by a, b.
+
+        Args:
+            values (List[Any]): Values of the ordering columns.
+            is_backward (bool): If True, rows placed before the values are filtered.
+
+        Returns:
+            Q: The condition.
+        """
+        seek_filter = Q()
+        for position, field_name in enumerate(self.ordering):
+            is_descending = field_name.startswith("-")
+            lookup = "lt" if is_descending != is_backward else "gt"
+            condition = Q(**{f"{field_name.lstrip('-')}__{lookup}": values[position]})
+            for previous_field_name, previous_value in zip(self.ordering[:position], values):
+                condition &= Q(**{previous_field_name.lstrip("-"): previous_value})
+            seek_filter |= condition
+        return seek_filter
+
+    def encode_cursor(self, obj: Model) -> str:
+        """
+        Encode the values of the ordering columns of the row.
+
+        Args:
+            obj (Model): Row of the queryset.
+
+        Returns:
+            str: Cursor which can be used in a url.
+        """
+        values = [get_lookup_value(obj=obj, lookup=field_name.lstrip("-")) for field_name in self.ordering]
+        return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        """
+        Decode values of the ordering columns and convert them to the types of the columns.
+
+        Args:
+            cursor (str): Cursor made by encode_cursor.
+
+        Returns:
+            List[Any]: Values of the ordering columns.
+
+        Raises:
+            Http404: If the cursor is invalid.
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError("Wrong number of cursor values.")
+            return [
+                get_lookup_field(queryset=self.queryset, lookup=field_name.lstrip("-")).to_python(value)
+                for field_name, value in zip(self.ordering, values)
+            ]
+        except (binascii.Error, ValueError, ValidationError):
+            raise Http404("Invalid cursor.")
+
+
+class KeysetPage:
+    def __init__(self, object_list: List[Model], paginator: KeysetPaginator, has_next: bool, has_previous: bool):
+        """
+        Page of KeysetPaginator. It does not know its number nor the number of all rows.
+
+        Args:
+            object_list (List[Model]): Rows on the page.
+            paginator (KeysetPaginator): Paginator of the page.
+            has_next (bool): If there are rows after the page.
+            has_previous (bool): If there are rows before the page.
+        """
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor = paginator.encode_cursor(object_list[-1]) if object_list else ""
+        self.previous_cursor = paginator.encode_cursor(object_list[0]) if object_list else ""
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+
+def get_keyset_ordering(queryset: QuerySet) -> List[str]:
+    """
+    Get the ordering of the queryset with the primary key as the last column.
+
+    Args:
+        queryset (QuerySet): The queryset.
+
+    Returns:
+        List[str]: Names of the ordering columns, prefixed with "-" if descending.
+    """
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+    if not all(isinstance(field_name, str) for field_name in ordering):
+        raise ValueError("Keyset pagination supports only ordering by field names.")
+    pk_names = {"pk", queryset.model._meta.pk.name}
+    if not any(field_name.lstrip("-") in pk_names for field_name in ordering):
+        ordering.append("pk")
+    return ordering
+
+
+def get_lookup_field(queryset: QuerySet, lookup: str) -> Field:
+    """
+    Get the model field or the output field of the annotation of the lookup, e.g. "company__name".
+
+    Args:
+        queryset (QuerySet): Queryset with the model and annotations.
+        lookup (str): Name of the field, the annotation or the related field.
+
+    Returns:
+        Field: The field.
+    """
+    if lookup in queryset.query.annotations:
+        return queryset.query.annotations[lookup].output_field
+    model = queryset.model
+    *relation_names, field_name = lookup.split("__")
+    for relation_name in relation_names:
+        model = model._meta.get_field(relation_name).related_model
+    return model._meta.pk if field_name == "pk" else model._meta.get_field(field_name)
+
+
+def get_lookup_value(obj: Model, lookup: str) -> Any:
+    """
+    Get the value of the lookup, e.g. "company__name", from the row.
+
+    Args:
+        obj (Model): The row.
+        lookup (str): Name of the field, the annotation or the related field.
+
+    Returns:
+        Any: The value.
+    """
+    value = obj
+    for attribute in lookup.split("__"):
+        value = getattr(value, attribute)
+    return value
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin which adds keyset pagination to the OFFSET pagination of Django.
+
+    Numbered pages (?page=N) are paginated with OFFSET and show an elided page range. Next and previous links carry
+    cursors (?after=... or ?before=...), so browsing page by page uses keyset pagination on the ordering of the
+    queryset, however deep the page is. Filter parameters are kept in the pagination links. Large querysets are not
+    counted, see EstimatedCountPaginator.
+    """
+
+    paginator_class = EstimatedCountPaginator
+    page_range_on_each_side = 2
+    page_range_on_ends = 1
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> Tuple[Any, Any, List[Model], bool]:
+        after = self.request.GET.get("after")
+        before = self.request.GET.get("before")
+        if after is None and before is None:
+            queryset = queryset.order_by(*get_keyset_ordering(queryset=queryset))
+            paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+            self.set_page_cursors(page=page, queryset=queryset, page_size=page_size)
+            return paginator, page, object_list, is_paginated
+        paginator = KeysetPaginator(queryset=queryset, per_page=page_size)
+        page = paginator.page(after=after, before=before)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    @staticmethod
+    def set_page_cursors(page: Page, queryset: QuerySet, page_size: int) -> None:
+        """
+        Set cursors of the first and the last row of the numbered page, which lead to the neighbouring pages.
+
+        Args:
+            page (Page): The numbered page.
+            queryset (QuerySet): The paginated queryset.
+            page_size (int): Number of rows on a page.
+        """
+        keyset_paginator = KeysetPaginator(queryset=queryset, per_page=page_size)
+        object_list = list(page.object_list)
+        page.next_cursor = keyset_paginator.encode_cursor(object_list[-1]) if object_list else ""
+        page.previous_cursor = keyset_paginator.encode_cursor(object_list[0]) if object_list else ""
+
+    def get_context_data(self, **kwargs) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        page = context.get("page_obj")
+        context["is_keyset_page"] = isinstance(page, KeysetPage)
+        if page is not None and not context["is_keyset_page"]:
+            context["page_range"] = list(
+                page.paginator.get_elided_page_range(
+                    page.number, on_each_side=self.page_range_on_each_side, on_ends=self.page_range_on_ends
+                )
+            )
+        filter_params = self.request.GET.copy()
+        for param in PAGE_PARAMS:
+            filter_params.pop(param, None)
+        context["filter_params"] = filter_params.urlencode()
+        return context
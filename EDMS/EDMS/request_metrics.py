@@ -0,0 +1,227 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNRESOLVED_VIEW_NAME = "unresolved"
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        """
+        Prometheus histogram with cumulative buckets.
+
+        Args:
+            buckets (Tuple[float, ...]): Increasing upper bounds of the buckets, without +Inf.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def get_cumulative_counts(self) -> List[Tuple[str, int]]:
+        """
+        Get the number of observations less than or equal to the upper bound of each bucket.
+
+        Returns:
+            List[Tuple[str, int]]: Upper bounds formatted as Prometheus labels with cumulative counts.
+        """
+        cumulative_counts = []
+        total = 0
+        for upper_bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            total += count
+            cumulative_counts.append((upper_bound, total))
+        return cumulative_counts
+
+
+class RequestMetrics:
+    """
+    In-process registry of request metrics labelled by view name and method. Each worker process keeps its own
+    registry, so Prometheus should scrape every worker or sum the series by instance.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.requests: Dict[Tuple[str, str, str], int] = defaultdict(int)
+            self.durations: Dict[Tuple[str, str], Histogram] = {}
+            self.queries: Dict[Tuple[str, str], int] = defaultdict(int)
+            self.query_seconds: Dict[Tuple[str, str], float] = defaultdict(float)
+            self.response_bytes: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def record(
+        self,
+        view_name: str,
+        method: str,
+        status: int,
+        duration: float,
+        queries: int,
+        query_seconds: float,
+        response_bytes: int,
+    ) -> None:
+        """
+        Record one handled request.
+
+        Args:
+            view_name (str): Name of the url which handled the request.
+            method (str): HTTP method of the request.
+            status (int): Status code of the response.
+            duration (float): Time of handling the request in seconds.
+            queries (int): Number of executed SQL queries.
+            query_seconds (float): Time of executing SQL queries in seconds.
+            response_bytes (int): Size of the response content.
+        """
+        labels = (view_name, method)
+        with self.lock:
+            self.requests[(view_name, method, str(status))] += 1
+            if labels not in self.durations:
+                self.durations[labels] = Histogram(buckets=LATENCY_BUCKETS)
+            self.durations[labels].observe(duration)
+            self.queries[labels] += queries
+            self.query_seconds[labels] += query_seconds
+            self.response_bytes[labels] += response_bytes
+
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics with HELP and TYPE comments.
+        """
+        lines = []
+        with self.lock:
+            lines += self.render_counter(
+                name="edms_requests_total",
+                help_text="Number of handled requests.",
+                values=self.requests,
+                label_names=("view", "method", "status"),
+            )
+            lines += [
+                "# HELP edms_request_duration_seconds Time of handling requests.",
+                "# TYPE edms_request_duration_seconds histogram",
+            ]
+            for (view_name, method), histogram in sorted(self.durations.items()):
+                labels = f'view="{view_name}",method="{method}"'
+                for upper_bound, count in histogram.get_cumulative_counts():
+                    lines.append(f'edms_request_duration_seconds_bucket{{{labels},le="{upper_bound}"}} {count}')
+                lines.append(f"edms_request_duration_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"edms_request_duration_seconds_count{{{labels}}} {sum(histogram.counts)}")
+            lines += self.render_counter(
+                name="edms_request_queries_total",
+                help_text="Number of SQL queries executed by requests.",
+                values=self.queries,
+                label_names=("view", "method"),
+            )
+            lines += self.render_counter(
+                name="edms_request_query_seconds_total",
+                help_text="Time of executing SQL queries by requests.",
+                values=self.query_seconds,
+                label_names=("view", "method"),
+            )
+            lines += self.render_counter(
+                name="edms_response_bytes_total",
+                help_text="Size of response contents.",
+                values=self.response_bytes,
+                label_names=("view", "method"),
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def render_counter(
+        name: str, help_text: str, values: Dict[tuple, float], label_names: Tuple[str, ...]
+    ) -> List[str]:
+        """
+        Render a counter in the Prometheus text exposition format.
+
+        Args:
+            name (str): Name of the metric.
+            help_text (str): Description of the metric.
+            values (Dict[tuple, float]): Values of the counter by label values.
+            label_names (Tuple[str, ...]): Names of the labels in the order of label values.
+
+        Returns:
+            List[str]: Lines of the metric.
+        """
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for label_values, value in sorted(values.items()):
+            labels = ",".join(
+                f'{label_name}="{label_value}"' for label_name, label_value in zip(label_names, label_values)
+            )
+            lines.append(f"{name}{{{labels}}} {value}")
+        return lines
+
+
+request_metrics = RequestMetrics()
+
+
+class QueryTimer:
+    """
+    Database execute wrapper which counts queries and sums their execution time.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started_at
+            self.count += 1
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware which records latency, SQL queries and response size of every request in request_metrics.
+    Requests are labelled by the url name, so the number of series does not grow with object ids.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        query_timer = QueryTimer()
+        started_at = time.perf_counter()
+        with connection.execute_wrapper(query_timer):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started_at
+        resolver_match = getattr(request, "resolver_match", None)
+        request_metrics.record(
+            view_name=resolver_match.view_name if resolver_match and resolver_match.view_name else UNRESOLVED_VIEW_NAME,
+            method=request.method,
+            status=response.status_code,
+            duration=duration,
+            queries=query_timer.count,
+            query_seconds=query_timer.seconds,
+            response_bytes=0 if response.streaming else len(response.content),
+        )
+        return response
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Expose request metrics for Prometheus. Only clients from METRICS_ALLOWED_IPS can read them.
+
+    Args:
+        request (HttpRequest): The request object.
+
+    Returns:
+        HttpResponse | HttpResponseForbidden: Metrics in the Prometheus text format or a forbidden response.
+    """
+    if request.META.get("REMOTE_ADDR") not in settings.METRICS_ALLOWED_IPS:
+        return HttpResponseForbidden()
+    return HttpResponse(request_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
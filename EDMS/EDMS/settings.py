@@ -46,6 +46,7 @@ INSTALLED_EXTENSIONS = [
 INSTALLED_APPS += INSTALLED_EXTENSIONS
 
 MIDDLEWARE = [
+    "EDMS.request_metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django_session_timeout.middleware.SessionTimeoutMiddleware",
@@ -54,11 +55,19 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "EDMS.n_plus_one_middleware.NPlusOneDetectorMiddleware",
 ]
 
 if DEBUG:
     MIDDLEWARE.append("silk.middleware.SilkyMiddleware")
 
+N_PLUS_ONE_SAMPLE_RATE = env("N_PLUS_ONE_SAMPLE_RATE")
+N_PLUS_ONE_THRESHOLD = env("N_PLUS_ONE_THRESHOLD")
+
+METRICS_ALLOWED_IPS = env("METRICS_ALLOWED_IPS")
+
+PAGINATION_EXACT_COUNT_THRESHOLD = env("PAGINATION_EXACT_COUNT_THRESHOLD")
+
 AUTH_USER_MODEL = "users.User"
 
 ROOT_URLCONF = "EDMS.urls"
@@ -109,6 +118,15 @@ CHANNEL_LAYERS = {
     },
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/1",
+    },
+}
+
+TEST_RUNNER = "EDMS.test_runner.EDMSTestRunner"
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
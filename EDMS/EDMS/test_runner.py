@@ -0,0 +1,25 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+TEST_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+
+class EDMSTestRunner(DiscoverRunner):
+    """
+    Test runner which replaces the Redis cache of the application with a cache in the memory of the test process,
+    so tests neither read nor flush data cached by the application or by another test run. EDMSTestCase clears the
+    cache before every test.
+    """
+
+    def setup_test_environment(self, **kwargs) -> None:
+        super().setup_test_environment(**kwargs)
+        self.caches_override = override_settings(CACHES=TEST_CACHES)
+        self.caches_override.enable()
+
+    def teardown_test_environment(self, **kwargs) -> None:
+        self.caches_override.disable()
+        super().teardown_test_environment(**kwargs)
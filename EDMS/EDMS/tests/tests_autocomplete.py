@@ -0,0 +1,99 @@
+from http import HTTPStatus
+
+from common_tests.EDMSTestCase import EDMSTestCase
+from companies.factories import CompanyFactory
+from companies.models import Company
+from contracts.factories import ContractFactory
+from django import forms
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
+from invoices.factories import InvoiceFactory
+from invoices.forms import InvoiceForm
+from users.factories import UserFactory
+
+from EDMS.autocomplete import AutocompleteSelectMultiple
+
+User = get_user_model()
+
+
+class AutocompleteWidgetTests(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.invoice = InvoiceFactory.create()
+        self.other_invoice = InvoiceFactory.create()
+
+    def test_render_only_empty_and_selected_options(self):
+        form = InvoiceForm(instance=self.invoice)
+        rendered_seller = str(form["seller"])
+        rendered_linked_invoice = str(form["linked_invoice"])
+        self.assertEqual(rendered_seller.count("<option"), 2)
+        self.assertIn(f'value="{self.invoice.seller.pk}" selected', rendered_seller)
+        self.assertNotIn(f'value="{self.invoice.buyer.pk}"', rendered_seller)
+        self.assertIn('data-autocomplete-url="/companies/autocomplete/"', rendered_seller)
+        self.assertEqual(rendered_linked_invoice.count("<option"), 1)
+        self.assertIn(f'data-autocomplete-exclude="{self.invoice.pk}"', rendered_linked_invoice)
+        self.assertIn('data-allow-clear="true"', rendered_linked_invoice)
+
+    def test_ignore_invalid_selected_values(self):
+        field = forms.ModelMultipleChoiceField(queryset=Company.objects.all(), widget=AutocompleteSelectMultiple())
+        self.assertNotIn("<option", field.widget.render(name="companies", value=["invalid"]))
+
+    def test_validate_chosen_value_against_queryset(self):
+        form = InvoiceForm(instance=self.invoice)
+        with self.assertRaises(ValidationError):
+            form.fields["linked_invoice"].clean(self.invoice.pk)
+        self.assertEqual(form.fields["linked_invoice"].clean(self.other_invoice.pk), self.other_invoice)
+
+
+class AutocompleteViewTests(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.company = CompanyFactory.create(name="Acme Logistics")
+        self.other_company = CompanyFactory.create(name="Acme Software")
+        self.contract = ContractFactory.create(name="Framework agreement")
+        self.invoice = InvoiceFactory.create(name="FV/7/2024")
+        self.user = UserFactory.create(first_name="Zenon", last_name="Zawadzki")
+
+    def test_redirect_to_login_page_when_not_authenticated_user_execute_get_method(self):
+        url = reverse_lazy("autocomplete-company")
+        response = self.client.get(url)
+        self.assertRedirects(response, f"{reverse_lazy('login')}?next={url}")
+
+    def test_deny_search_without_view_permission(self):
+        self.client.force_login(self.hr)
+        for url_name in ["autocomplete-invoice", "autocomplete-contract"]:
+            with self.subTest(url_name=url_name):
+                response = self.client.get(reverse_lazy(url_name))
+                self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_search_every_word_in_search_fields(self):
+        self.client.force_login(self.ceo)
+        searches = [
+            ("autocomplete-company", "acme soft", self.other_company),
+            ("autocomplete-contract", "framework", self.contract),
+            ("autocomplete-invoice", "fv/7", self.invoice),
+            ("autocomplete-user", "zenon zawadzki", self.user),
+        ]
+        for url_name, term, expected_object in searches:
+            with self.subTest(url_name=url_name):
+                response = self.client.get(reverse_lazy(url_name), data={"term": term})
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                self.assertEqual(response.json()["results"], [{"id": expected_object.pk, "text": str(expected_object)}])
+
+    def test_exclude_primary_keys(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(
+            reverse_lazy("autocomplete-company"), data={"term": "acme", "exclude": f"{self.company.pk},invalid"}
+        )
+        self.assertEqual(response.json()["results"], [{"id": self.other_company.pk, "text": self.other_company.name}])
+
+    def test_paginate_results(self):
+        self.client.force_login(self.ceo)
+        CompanyFactory.create_batch(20, name="Acme")
+        first_page = self.client.get(reverse_lazy("autocomplete-company"), data={"term": "acme"}).json()
+        second_page = self.client.get(reverse_lazy("autocomplete-company"), data={"term": "acme", "page": 2}).json()
+        self.assertEqual(len(first_page["results"]), 20)
+        self.assertTrue(first_page["pagination"]["more"])
+        self.assertEqual(len(second_page["results"]), 2)
+        self.assertFalse(second_page["pagination"]["more"])
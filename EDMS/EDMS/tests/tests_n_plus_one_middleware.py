@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from users.factories import UserFactory
+
+from EDMS.n_plus_one_middleware import NPlusOneDetectorMiddleware, get_query_fingerprint
+
+User = get_user_model()
+
+
+def render_users_with_groups(request: HttpRequest) -> HttpResponse:
+    template = Template("{% for user in users %}{{ user.groups.all|length }}{% endfor %}")
+    return HttpResponse(template.render(Context({"users": User.objects.all()})))
+
+
+@override_settings(N_PLUS_ONE_SAMPLE_RATE=1, N_PLUS_ONE_THRESHOLD=3)
+class NPlusOneDetectorMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get("/employees/")
+        self.middleware = NPlusOneDetectorMiddleware(get_response=render_users_with_groups)
+
+    def test_log_query_repeated_more_than_threshold_times(self):
+        UserFactory.create_batch(5)
+        with self.assertLogs("EDMS.n_plus_one_middleware", level="WARNING") as logs:
+            response = self.middleware(self.request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(logs.records), 1)
+        record = logs.records[0]
+        self.assertEqual(record.query_count, 5)
+        self.assertIn("users_user_groups", record.getMessage())
+        self.assertIn("GET /employees/", record.getMessage())
+        self.assertIn("tests_n_plus_one_middleware.py", record.getMessage())
+
+    def test_do_not_log_query_repeated_up_to_threshold_times(self):
+        UserFactory.create_batch(3)
+        with self.assertNoLogs("EDMS.n_plus_one_middleware", level="WARNING"):
+            self.middleware(self.request)
+
+    @override_settings(N_PLUS_ONE_SAMPLE_RATE=0)
+    def test_middleware_is_not_used_without_sample_rate(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            NPlusOneDetectorMiddleware(get_response=render_users_with_groups)
+
+    def test_fingerprint_ignores_number_of_in_clause_parameters(self):
+        self.assertEqual(
+            get_query_fingerprint("SELECT * FROM users_user WHERE id IN (%s, %s)"),
+            get_query_fingerprint("SELECT *  FROM users_user\nWHERE id IN (%s)"),
+        )
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.http import Http404
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from users.factories import UserFactory
+
+from EDMS.pagination import (
+    EstimatedCountPaginator,
+    KeysetPaginator,
+    get_keyset_ordering,
+)
+
+User = get_user_model()
+
+
+class KeysetPaginatorTests(TestCase):
+    def setUp(self) -> None:
+        for index in range(7):
+            UserFactory(first_name=f"Name{index % 3}")
+        self.queryset = User.objects.order_by("-first_name")
+        self.expected_users = list(User.objects.order_by("-first_name", "pk"))
+        self.paginator = KeysetPaginator(queryset=self.queryset, per_page=3)
+
+    def test_add_primary_key_to_ordering(self):
+        self.assertEqual(get_keyset_ordering(queryset=self.queryset), ["-first_name", "pk"])
+        self.assertEqual(get_keyset_ordering(queryset=User.objects.order_by("-id")), ["-id"])
+
+    def test_browse_forward_through_all_rows(self):
+        page = self.paginator.page()
+        users = list(page)
+        self.assertFalse(page.has_previous())
+        while page.has_next():
+            page = self.paginator.page(after=page.next_cursor)
+            users.extend(page)
+        self.assertEqual(users, self.expected_users)
+
+    def test_browse_backward_through_all_rows(self):
+        page = self.paginator.page(before="")
+        users = list(page)
+        self.assertFalse(page.has_next())
+        while page.has_previous():
+            page = self.paginator.page(before=page.previous_cursor)
+            users = list(page) + users
+        self.assertEqual(users, self.expected_users)
+
+    def test_seek_page_without_offset(self):
+        first_page = self.paginator.page()
+        with CaptureQueriesContext(connection) as queries:
+            self.paginator.page(after=first_page.next_cursor)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("OFFSET", queries[0]["sql"])
+
+    def test_raise_404_for_invalid_cursor(self):
+        for cursor in ["not-base64!", "W10=", "WyJhIiwgImIiXQ=="]:
+            with self.subTest(cursor=cursor), self.assertRaises(Http404):
+                self.paginator.page(after=cursor)
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self) -> None:
+        UserFactory.create_batch(5)
+        self.queryset = User.objects.order_by("pk")
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_estimate_count_of_unfiltered_queryset_from_table_statistics(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {User._meta.db_table}")
+        paginator = EstimatedCountPaginator(object_list=self.queryset, per_page=2)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(paginator.count, User.objects.count())
+        self.assertTrue(paginator.is_count_estimated)
+        self.assertIn("pg_class", queries[0]["sql"])
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_estimate_count_of_filtered_queryset_with_query_planner(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset.filter(first_name__icontains="a"), per_page=2)
+        with CaptureQueriesContext(connection) as queries:
+            paginator.count
+        self.assertTrue(paginator.is_count_estimated)
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("EXPLAIN"))
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=1000)
+    def test_count_exactly_when_estimate_is_below_threshold(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset.filter(is_active=True), per_page=2)
+        self.assertEqual(paginator.count, User.objects.filter(is_active=True).count())
+        self.assertFalse(paginator.is_count_estimated)
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_count_exactly_when_page_is_not_full(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset.filter(first_name__icontains="a"), per_page=100)
+        paginator.count
+        self.assertTrue(paginator.is_count_estimated)
+        page = paginator.page(1)
+        expected_count = User.objects.filter(first_name__icontains="a").count()
+        self.assertEqual(len(page), expected_count)
+        self.assertEqual(paginator.count, expected_count)
+        self.assertEqual(paginator.num_pages, 1)
+        self.assertFalse(paginator.is_count_estimated)
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_keep_estimate_when_page_is_full(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset.filter(is_active=True), per_page=1)
+        estimated_count = paginator.count
+        paginator.page(1)
+        self.assertTrue(paginator.is_count_estimated)
+        self.assertEqual(paginator.count, estimated_count)
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_return_last_page_when_estimated_page_is_empty(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset, per_page=2)
+        with patch("EDMS.pagination.get_estimated_count", return_value=100):
+            page = paginator.page(10)
+        self.assertFalse(paginator.is_count_estimated)
+        self.assertEqual(paginator.count, User.objects.count())
+        self.assertEqual(page.number, paginator.num_pages)
+        self.assertEqual(list(page), list(self.queryset)[(page.number - 1) * 2 :])
+        self.assertFalse(page.has_next())
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_count_exactly_when_page_is_past_estimated_end(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset, per_page=2)
+        with patch("EDMS.pagination.get_estimated_count", return_value=1):
+            page = paginator.page(2)
+        self.assertFalse(paginator.is_count_estimated)
+        self.assertEqual(page.number, 2)
+        self.assertEqual(list(page), list(self.queryset)[2:4])
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_raise_empty_page_for_number_below_one_with_estimate(self):
+        paginator = EstimatedCountPaginator(object_list=self.queryset, per_page=2)
+        with patch("EDMS.pagination.get_estimated_count", return_value=100):
+            paginator.count
+            with self.assertRaises(EmptyPage):
+                paginator.page(0)
@@ -0,0 +1,61 @@
+from common_tests.EDMSTestCase import EDMSTestCase
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from EDMS.request_metrics import Histogram, RequestMetrics, request_metrics
+
+
+class RequestMetricsTests(TestCase):
+    def test_histogram_counts_are_cumulative(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.get_cumulative_counts(), [("0.1", 2), ("1.0", 3), ("+Inf", 4)])
+        self.assertAlmostEqual(histogram.sum, 2.65)
+
+    def test_render_prometheus_text_format(self):
+        metrics = RequestMetrics()
+        metrics.record(
+            view_name="list-invoice",
+            method="GET",
+            status=200,
+            duration=0.2,
+            queries=6,
+            query_seconds=0.01,
+            response_bytes=1000,
+        )
+        text = metrics.render()
+        self.assertIn("# TYPE edms_request_duration_seconds histogram", text)
+        self.assertIn('edms_requests_total{view="list-invoice",method="GET",status="200"} 1', text)
+        self.assertIn('edms_request_duration_seconds_bucket{view="list-invoice",method="GET",le="0.1"} 0', text)
+        self.assertIn('edms_request_duration_seconds_bucket{view="list-invoice",method="GET",le="0.25"} 1', text)
+        self.assertIn('edms_request_duration_seconds_count{view="list-invoice",method="GET"} 1', text)
+        self.assertIn('edms_request_queries_total{view="list-invoice",method="GET"} 6', text)
+        self.assertIn('edms_response_bytes_total{view="list-invoice",method="GET"} 1000', text)
+
+
+class RequestMetricsMiddlewareTests(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        request_metrics.reset()
+
+    def test_record_requests_by_url_name(self):
+        self.client.force_login(self.accountant)
+        response = self.client.get(reverse_lazy("list-invoice"))
+        labels = ("list-invoice", "GET")
+        self.assertEqual(request_metrics.requests[("list-invoice", "GET", "200")], 1)
+        self.assertGreater(request_metrics.queries[labels], 0)
+        self.assertEqual(request_metrics.response_bytes[labels], len(response.content))
+        self.assertEqual(sum(request_metrics.durations[labels].counts), 1)
+
+    def test_metrics_endpoint_returns_recorded_metrics(self):
+        self.client.get(reverse_lazy("login"))
+        response = self.client.get(reverse_lazy("metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('edms_requests_total{view="login",method="GET",status="200"} 1', response.content.decode())
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"])
+    def test_metrics_endpoint_is_forbidden_for_other_clients(self):
+        response = self.client.get(reverse_lazy("metrics"))
+        self.assertEqual(response.status_code, 403)
@@ -1,8 +1,13 @@
+from typing import Callable, Dict, Iterable, Optional
+
 from common_tests.consts import group_names_with_permission_codenames
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
 from django.shortcuts import get_object_or_404
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from users.factories import UserFactory
 
 from EDMS.group_utils import create_group_with_permissions
@@ -41,6 +46,13 @@ class EDMSTestCase(TestCase):
         cls.hr: User = cls.create_user_with_group(group_name="hrs")
         cls.manager: User = cls.create_user_with_group(group_name="managers")
 
+    def setUp(self) -> None:
+        """
+        Clear the cache, so the test does not read data cached by the previous tests.
+        """
+        super().setUp()
+        cache.clear()
+
     @classmethod
     def create_user_with_group(cls, group_name: str) -> User:
         """
@@ -56,3 +68,48 @@ class EDMSTestCase(TestCase):
         user: User = UserFactory(is_active=True, password=cls.password)
         user.groups.add(group)
         return user
+
+    def assertQueryBudget(
+        self,
+        url: str,
+        user: User,
+        create_rows: Callable[[int], None],
+        sizes: Iterable[int] = (1, 5),
+        max_queries: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """
+        Assert that the view runs the same number of SQL queries regardless of how many rows it displays.
+
+        The view is requested once before counting, so the first request of the user does not affect the result.
+        Before each request the dataset is grown to the next size with create_rows.
+
+        Args:
+            url (str): Url of the view.
+            user (User): User who requests the view.
+            create_rows (Callable[[int], None]): Function which creates the given number of rows shown by the view.
+            sizes (Iterable[int]): Increasing numbers of created rows which the view is requested with.
+            max_queries (Optional[int]): The maximum number of queries the view may run, not checked if None.
+
+        Returns:
+            Dict[int, int]: Numbers of queries per dataset size.
+        """
+        self.client.force_login(user)
+        self.client.get(url)
+        query_counts = {}
+        created_rows = 0
+        for size in sizes:
+            create_rows(size - created_rows)
+            created_rows = size
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            query_counts[size] = len(context.captured_queries)
+        self.assertEqual(
+            len(set(query_counts.values())),
+            1,
+            msg=f"Number of queries of {url} grows with number of rows: {query_counts}.\n"
+            + "\n".join(query["sql"] for query in context.captured_queries),
+        )
+        if max_queries is not None:
+            self.assertLessEqual(max(query_counts.values()), max_queries, msg=f"Query budget of {url} exceeded.")
+        return query_counts
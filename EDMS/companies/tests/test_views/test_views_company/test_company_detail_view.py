@@ -1,7 +1,7 @@
 from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
-from companies.factories import CompanyFactory
+from companies.factories import CompanyFactory, ContactFactory
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
 
@@ -50,3 +50,10 @@ class CompanyDetailViewTests(EDMSTestCase):
         response = self.client.get(reverse_lazy("detail-company", kwargs={"pk": self.company.pk}))
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, self.template_name)
+
+    def test_number_of_queries_does_not_grow_with_contacts(self):
+        self.assertQueryBudget(
+            url=reverse_lazy("detail-company", kwargs={"pk": self.company.pk}),
+            user=self.ceo,
+            create_rows=lambda count: ContactFactory.create_batch(count, company=self.company),
+        )
@@ -2,6 +2,7 @@ from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
 from companies.factories import CompanyFactory
+from companies.models import Company
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
 
@@ -138,3 +139,11 @@ class CompanyListTestCase(EDMSTestCase):
         self.assertTemplateUsed(response, self.template_name)
         self.assertEqual(len(response.context["companies"]), 1)
         self.assertEqual(str(response.context["page_obj"]), "<Page 1 of 1>")
+
+    def test_number_of_queries_does_not_grow_with_companies(self):
+        Company.objects.all().delete()
+        self.assertQueryBudget(
+            url=reverse_lazy("list-company"),
+            user=self.ceo,
+            create_rows=lambda count: CompanyFactory.create_batch(count),
+        )
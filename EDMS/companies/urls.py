@@ -6,6 +6,7 @@ from .api.views.views_api_company import CompanyModelViewSet
 from .api.views.views_api_contact import ContactModelViewSet
 from .views.views_company import (
     CompanyAddressUpdateView,
+    CompanyAutocompleteView,
     CompanyCreateView,
     CompanyDetailView,
     CompanyFindView,
@@ -30,6 +31,7 @@ urlpatterns = [
         name="create-company-done",
     ),
     path("companies/", CompanyListView.as_view(), name="list-company"),
+    path("companies/autocomplete/", CompanyAutocompleteView.as_view(), name="autocomplete-company"),
     path("companies/<int:pk>/", CompanyDetailView.as_view(), name="detail-company"),
     path(
         "companies/<int:pk>/update-identifiers/",
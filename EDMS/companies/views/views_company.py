@@ -26,6 +26,9 @@ from django.views.generic import (
     UpdateView,
 )
 
+from EDMS.autocomplete import AutocompleteView
+from EDMS.pagination import KeysetPaginationMixin
+
 
 class CompanyFindView(LoginRequiredMixin, PermissionRequiredMixin, FormView):
     permission_required = "companies.add_company"
@@ -201,7 +204,7 @@ class CreateCompanyDoneView(LoginRequiredMixin, PermissionRequiredMixin, Templat
     template_name = "companies/companies/create_company_done.html"
 
 
-class CompanyListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+class CompanyListView(LoginRequiredMixin, PermissionRequiredMixin, KeysetPaginationMixin, ListView):
     permission_required = "companies.view_company"
     queryset = Company.objects.all()
     template_name = "companies/companies/list_company.html"
@@ -259,3 +262,10 @@ class CompanyAddressUpdateView(LoginRequiredMixin, PermissionRequiredMixin, Upda
 
     def get_success_url(self):
         return reverse_lazy("detail-company", kwargs={"pk": self.kwargs["company_pk"]})
+
+
+class CompanyAutocompleteView(AutocompleteView):
+    permission_required = "companies.view_company"
+    model = Company
+    search_fields = ["name"]
+    ordering = ["name", "pk"]
@@ -8,4 +8,4 @@ from EDMS.custom_django_model_permissions import CustomDjangoModelPermissions
 class ContractModelViewSet(ModelViewSet):
     permission_classes = (CustomDjangoModelPermissions,)
     serializer_class = ContractSerializer
-    queryset = Contract.objects.all()
+    queryset = Contract.objects.prefetch_related("employee")
@@ -7,6 +7,9 @@ from contracts.validators import ContractValidator
 from django import forms
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import UploadedFile
+from django.urls import reverse_lazy
+
+from EDMS.autocomplete import AutocompleteSelectMultiple
 
 from .models import Contract
 
@@ -23,7 +26,9 @@ class ContractForm(forms.ModelForm):
             "start_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "end_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "company": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
-            "employee": forms.SelectMultiple(attrs={"class": "form-control js-example-basic-multiple"}),
+            "employee": AutocompleteSelectMultiple(
+                attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-user")
+            ),
             "price": forms.NumberInput(attrs={"class": "form-control"}),
             "scan": forms.FileInput(attrs={"class": "form-input"}),
         }
@@ -204,3 +204,10 @@ class ContractModelViewSetTestCase(EDMSTestCase):
         )
         self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
         self.assertEqual(Contract.objects.count(), 9)
+
+    def test_number_of_queries_of_contract_list_does_not_grow_with_contracts(self):
+        self.assertQueryBudget(
+            url=reverse_lazy("contract-list"),
+            user=self.ceo,
+            create_rows=lambda count: ContractFactory.create_batch(count, employee=UserFactory.create_batch(2)),
+        )
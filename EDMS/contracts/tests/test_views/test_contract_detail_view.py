@@ -4,6 +4,8 @@ from common_tests.EDMSTestCase import EDMSTestCase
 from contracts.factories import ContractFactory
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
+from orders.factories import OrderFactory
+from users.factories import UserFactory
 
 User = get_user_model()
 
@@ -49,3 +51,14 @@ class ContractDetailViewTests(EDMSTestCase):
         response = self.client.get(reverse_lazy("detail-contract", kwargs={"pk": self.contract.pk}))
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, self.template_name)
+
+    def test_number_of_queries_does_not_grow_with_employees_and_orders(self):
+        contract = ContractFactory.create()
+
+        def create_rows(count: int) -> None:
+            contract.employee.add(*UserFactory.create_batch(count))
+            OrderFactory.create_batch(count, contract=contract, company=contract.company)
+
+        self.assertQueryBudget(
+            url=reverse_lazy("detail-contract", kwargs={"pk": contract.pk}), user=self.ceo, create_rows=create_rows
+        )
@@ -2,6 +2,7 @@ from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
 from contracts.factories import ContractFactory
+from contracts.models import Contract
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
 
@@ -121,3 +122,11 @@ class ContractListTestCase(EDMSTestCase):
         self.assertTemplateUsed(response, self.template_name)
         self.assertEqual(len(response.context["contracts"]), 1)
         self.assertEqual(str(response.context["page_obj"]), "<Page 1 of 1>")
+
+    def test_number_of_queries_does_not_grow_with_contracts(self):
+        Contract.objects.all().delete()
+        self.assertQueryBudget(
+            url=reverse_lazy("list-contract"),
+            user=self.ceo,
+            create_rows=lambda count: ContractFactory.create_batch(count),
+        )
@@ -1,5 +1,6 @@
 from contracts.api.views_api_contract import ContractModelViewSet
 from contracts.views import (
+    ContractAutocompleteView,
     ContractCreateView,
     ContractDeleteView,
     ContractDetailView,
@@ -26,5 +27,6 @@ urlpatterns = [
         name="delete-contract",
     ),
     path("contracts/", ContractListView.as_view(), name="list-contract"),
+    path("contracts/autocomplete/", ContractAutocompleteView.as_view(), name="autocomplete-contract"),
     path("", include(router.urls)),
 ]
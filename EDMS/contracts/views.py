@@ -14,6 +14,9 @@ from django.views.generic import (
     UpdateView,
 )
 
+from EDMS.autocomplete import AutocompleteView
+from EDMS.pagination import KeysetPaginationMixin
+
 
 class ContractCreateView(PermissionRequiredMixin, CreateView, LoginRequiredMixin):
     permission_required = "contracts.add_contract"
@@ -50,7 +53,7 @@ class ContractDeleteView(PermissionRequiredMixin, DeleteView, LoginRequiredMixin
         return reverse("list-contract")
 
 
-class ContractListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
+class ContractListView(PermissionRequiredMixin, KeysetPaginationMixin, ListView, LoginRequiredMixin):
     permission_required = "contracts.view_contract"
     model = Contract
     template_name = "contracts/contract_list.html"
@@ -76,3 +79,10 @@ class ContractListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
         context = super().get_context_data(*args, **kwargs)
         context["filter_form"] = self.filter_set.form
         return context
+
+
+class ContractAutocompleteView(AutocompleteView):
+    permission_required = "contracts.view_contract"
+    model = Contract
+    search_fields = ["name"]
+    ordering = ["-create_date", "-pk"]
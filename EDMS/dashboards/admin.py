@@ -0,0 +1,9 @@
+from dashboards.models import MonthlyLedger
+from django.contrib import admin
+
+
+class CustomMonthlyLedgerAdmin(admin.ModelAdmin):
+    list_display = ("month", "user", "income_net", "cost_net", "salaries", "balance")
+
+
+admin.site.register(MonthlyLedger, CustomMonthlyLedgerAdmin)
@@ -0,0 +1,59 @@
+from datetime import date
+from typing import Any, Dict
+
+from dashboards.time_series import GRANULARITY_STEPS, MAX_PERIODS, MONTH, count_periods
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import serializers
+
+User = get_user_model()
+
+
+class BalanceTimeSeriesQuerySerializer(serializers.Serializer):
+    ME = "me"
+    USER = "user"
+    COMPANY = "company"
+    SCOPE_CHOICES = [ME, USER, COMPANY]
+
+    date_from = serializers.DateField(required=False, help_text="First day of the range, default a year ago.")
+    date_to = serializers.DateField(required=False, help_text="Last day of the range, default today.")
+    granularity = serializers.ChoiceField(choices=list(GRANULARITY_STEPS), default=MONTH)
+    scope = serializers.ChoiceField(choices=SCOPE_CHOICES, default=ME)
+    user = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(), required=False, help_text="Employee required by the user scope."
+    )
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Set default range and check if the range, its number of periods and the scope are correct.
+
+        Args:
+            attrs (Dict[str, Any]): Query parameters.
+
+        Returns:
+            Dict[str, Any]: Validated query parameters.
+        """
+        default_range = timezone.timedelta(days=365)
+        attrs.setdefault("date_to", timezone.now().date())
+        attrs.setdefault("date_from", max(attrs["date_to"], date.min + default_range) - default_range)
+        if attrs["date_from"] > attrs["date_to"]:
+            raise serializers.ValidationError({"date_from": "The date must not be after date_to."})
+        granularity = attrs["granularity"]
+        if (
+            count_periods(granularity=granularity, date_from=attrs["date_from"], date_to=attrs["date_to"])
+            > MAX_PERIODS[granularity]
+        ):
+            raise serializers.ValidationError(
+                {"date_from": f"The range must not have more than {MAX_PERIODS[granularity]} periods of {granularity}."}
+            )
+        if attrs["scope"] == self.USER and not attrs.get("user"):
+            raise serializers.ValidationError({"user": "The field is required for the user scope."})
+        return attrs
+
+
+class BalanceTimeSeriesSerializer(serializers.Serializer):
+    period = serializers.DateField()
+    income_net = serializers.DecimalField(max_digits=14, decimal_places=2)
+    cost_net = serializers.DecimalField(max_digits=14, decimal_places=2)
+    salaries = serializers.DecimalField(max_digits=14, decimal_places=2)
+    balance = serializers.DecimalField(max_digits=14, decimal_places=2)
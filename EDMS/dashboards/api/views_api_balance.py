@@ -0,0 +1,60 @@
+from dashboards.api.serializers import (
+    BalanceTimeSeriesQuerySerializer,
+    BalanceTimeSeriesSerializer,
+)
+from dashboards.time_series import get_balance_time_series
+from django.contrib.auth import get_user_model
+from employees.models.models_salaries import Salary
+from orders.models import Order
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+User = get_user_model()
+
+
+class BalanceTimeSeriesAPIView(APIView):
+    """
+    Income, cost, salaries and balance per week, month, quarter or year - data behind the dashboard plot.
+
+    Managers can read only their own data (scope "me"),
+    ceos can read also data of any employee (scope "user") and of the whole company (scope "company").
+    """
+
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        user_groups = set(request.user.groups.values_list("name", flat=True))
+        if not user_groups & {"ceos", "managers"}:
+            raise PermissionDenied()
+        query_serializer = BalanceTimeSeriesQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        query = query_serializer.validated_data
+        if query["scope"] != BalanceTimeSeriesQuerySerializer.ME and "ceos" not in user_groups:
+            raise PermissionDenied("Only ceos can read data of other employees and of the company.")
+
+        orders = Order.objects.all()
+        salaries = Salary.objects.all()
+        if query["scope"] != BalanceTimeSeriesQuerySerializer.COMPANY:
+            user = query["user"] if query["scope"] == BalanceTimeSeriesQuerySerializer.USER else request.user
+            orders = orders.filter(user=user)
+            salaries = salaries.filter(user=user)
+
+        time_series = get_balance_time_series(
+            orders=orders,
+            salaries=salaries,
+            granularity=query["granularity"],
+            date_from=query["date_from"],
+            date_to=query["date_to"],
+        )
+        return Response(
+            {
+                "scope": query["scope"],
+                "granularity": query["granularity"],
+                "date_from": query["date_from"],
+                "date_to": query["date_to"],
+                "results": BalanceTimeSeriesSerializer(time_series, many=True).data,
+            }
+        )
@@ -4,3 +4,26 @@ from django.apps import AppConfig
 class DashboardConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dashboards"
+
+    def ready(self):
+        from dashboards import signals
+        from django.db.models.signals import (
+            m2m_changed,
+            post_delete,
+            post_save,
+            pre_delete,
+            pre_save,
+        )
+        from employees.models.models_salaries import Salary
+        from invoices.models import Invoice
+        from orders.models import Order
+
+        for sender in [Order, Salary]:
+            pre_save.connect(signals.remember_previous_bucket, sender=sender)
+            post_save.connect(signals.refresh_ledger_for_user_object, sender=sender)
+            post_delete.connect(signals.refresh_ledger_for_user_object, sender=sender)
+        for through in [Order.income_invoice.through, Order.cost_invoice.through]:
+            m2m_changed.connect(signals.refresh_ledger_for_order_invoices, sender=through)
+        post_save.connect(signals.refresh_ledger_for_invoice, sender=Invoice)
+        pre_delete.connect(signals.remember_invoice_orders, sender=Invoice)
+        post_delete.connect(signals.refresh_ledger_for_invoice, sender=Invoice)
@@ -0,0 +1,264 @@
+import json
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from companies.models import Company
+from contracts.models import Contract
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Model
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from employees.models.models_addendum import Addendum
+from employees.models.models_agreement import Agreement
+from employees.models.models_salaries import Salary
+from employees.models.models_termination import Termination
+from employees.models.models_vacation import Vacation
+from invoices.models import Invoice
+from orders.models import Order, Protocol
+
+User = get_user_model()
+
+SKIPPED_URL_NAMES = {"logout", "api-root"}
+URL_PREFIX_MODELS = {
+    "addenda/": Addendum,
+    "agreements/": Agreement,
+    "companies/": Company,
+    "contracts/": Contract,
+    "employees/": User,
+    "invoices/": Invoice,
+    "orders/protocols/": Protocol,
+    "orders/": Order,
+    "salaries/": Salary,
+    "terminations/": Termination,
+    "vacations/": Vacation,
+}
+
+
+class BenchmarkUrl:
+    def __init__(self, name: str, route: str, model: Optional[type[Model]]) -> None:
+        """
+        Named url which can be requested with the GET method by the benchmark.
+
+        Args:
+            name (str): Name of the url.
+            route (str): Route of the url, e.g. orders/<int:pk>/.
+            model (Optional[type[Model]]): Model of the object given as the pk argument, None if the url has no
+                arguments.
+        """
+        self.name = name
+        self.route = route
+        self.model = model
+
+    def get_path(self) -> Optional[str]:
+        """
+        Reverse the url. The pk argument is the primary key of the first object of the model.
+
+        Returns:
+            Optional[str]: Path of the url or None if there is no object to request.
+        """
+        if not self.model:
+            return reverse(self.name)
+        pk = self.model.objects.order_by("pk").values_list("pk", flat=True).first()
+        if pk is None:
+            return None
+        return reverse(self.name, kwargs={"pk": pk})
+
+
+def get_benchmark_urls(url_names: Optional[Iterable[str]] = None) -> List[BenchmarkUrl]:
+    """
+    Get named urls of the project without namespace, which have no arguments or only the pk argument.
+
+    Args:
+        url_names (Optional[Iterable[str]]): Names of the urls to benchmark, all urls if None.
+
+    Returns:
+        List[BenchmarkUrl]: Urls sorted by name.
+    """
+    urls = {}
+    for name, route, callback, kwarg_names in iterate_url_patterns(patterns=get_resolver().url_patterns):
+        if name in urls or name in SKIPPED_URL_NAMES or (url_names and name not in url_names):
+            continue
+        if not kwarg_names:
+            urls[name] = BenchmarkUrl(name=name, route=route, model=None)
+        elif kwarg_names == {"pk"}:
+            model = get_url_model(route=route, callback=callback)
+            if model:
+                urls[name] = BenchmarkUrl(name=name, route=route, model=model)
+    return sorted(urls.values(), key=lambda url: url.name)
+
+
+def iterate_url_patterns(patterns: List, prefix: str = "") -> Iterable[tuple]:
+    """
+    Iterate over named url patterns, including patterns of included url configurations without namespace.
+
+    Args:
+        patterns (List): Url patterns and resolvers.
+        prefix (str): Route of the including resolver.
+
+    Yields:
+        tuple: Name, route, view callback and argument names of the pattern.
+    """
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            if not pattern.namespace:
+                yield from iterate_url_patterns(patterns=pattern.url_patterns, prefix=route)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            kwarg_names = set(getattr(pattern.pattern, "converters", {})) | set(pattern.pattern.regex.groupindex)
+            yield pattern.name, route, pattern.callback, kwarg_names
+
+
+def get_url_model(route: str, callback) -> Optional[type[Model]]:
+    """
+    Get the model of the object given as the pk argument of the url.
+
+    Args:
+        route (str): Route of the url.
+        callback: View function of the url.
+
+    Returns:
+        Optional[type[Model]]: Model of the object or None if it is unknown.
+    """
+    for prefix, model in URL_PREFIX_MODELS.items():
+        if route.startswith(prefix):
+            return model
+    view_class = getattr(callback, "cls", None) or getattr(callback, "view_class", None)
+    queryset = getattr(view_class, "queryset", None)
+    if queryset is not None:
+        return queryset.model
+    return getattr(view_class, "model", None)
+
+
+def get_group_user(group_name: str) -> Optional[User]:
+    """
+    Get the first active user of the group.
+
+    Args:
+        group_name (str): Name of the group.
+
+    Returns:
+        Optional[User]: User of the group or None if there is no active user in the group.
+    """
+    return User.objects.filter(groups__name=group_name, is_active=True).order_by("pk").first()
+
+
+class QueryCounter:
+    """
+    Database execute wrapper which counts executed queries. Unlike the query log it has no size limit.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def benchmark_url(client: Client, path: str, repeat: int) -> Dict[str, Any]:
+    """
+    Request the url with the GET method after a warm-up request and measure every request.
+
+    Args:
+        client (Client): Client with a logged-in user.
+        path (str): Path of the url.
+        repeat (int): Number of measured requests.
+
+    Returns:
+        Dict[str, Any]: Path, status code, p50 and p95 latency in milliseconds, number of SQL queries and response
+        size in bytes.
+    """
+    client.get(path)
+    latencies = []
+    query_counter = QueryCounter()
+    with connection.execute_wrapper(query_counter):
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            response = client.get(path)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+    return {
+        "path": path,
+        "status": response.status_code,
+        "p50_ms": round(get_percentile(values=latencies, percent=50), 2),
+        "p95_ms": round(get_percentile(values=latencies, percent=95), 2),
+        "queries": query_counter.count // repeat,
+        "size": len(response.content),
+    }
+
+
+def get_percentile(values: List[float], percent: float) -> float:
+    """
+    Get the percentile of the values with the nearest-rank method.
+
+    Args:
+        values (List[float]): Measured values.
+        percent (float): Percentile, e.g. 95.
+
+    Returns:
+        float: The smallest value greater than or equal to the given percent of values.
+    """
+    ordered_values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered_values)), 1)
+    return ordered_values[rank - 1]
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Dict[str, Any]]],
+    baseline: Dict[str, Dict[str, Dict[str, Any]]],
+    latency_threshold: float,
+) -> List[str]:
+    """
+    Compare the results with the baseline. A view regressed if it runs more queries, its p95 latency grew by more
+    than the threshold or its status code changed.
+
+    Args:
+        results (Dict[str, Dict[str, Dict[str, Any]]]): Results per group and url name.
+        baseline (Dict[str, Dict[str, Dict[str, Any]]]): Baseline results per group and url name.
+        latency_threshold (float): Accepted p95 latency growth, e.g. 0.2 for 20%.
+
+    Returns:
+        List[str]: Descriptions of the regressions.
+    """
+    regressions = []
+    for group_name, group_results in results.items():
+        for url_name, result in group_results.items():
+            expected = baseline.get(group_name, {}).get(url_name)
+            if not expected:
+                continue
+            label = f"{group_name} {url_name}"
+            if result["status"] != expected["status"]:
+                regressions.append(f"{label}: status {expected['status']} -> {result['status']}")
+            if result["queries"] > expected["queries"]:
+                regressions.append(f"{label}: queries {expected['queries']} -> {result['queries']}")
+            if result["p95_ms"] > expected["p95_ms"] * (1 + latency_threshold):
+                regressions.append(f"{label}: p95 {expected['p95_ms']} ms -> {result['p95_ms']} ms")
+    return regressions
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Dict[str, Any]]], repeat: int) -> None:
+    """
+    Save the results as a JSON baseline.
+
+    Args:
+        path (str): Path of the JSON file.
+        results (Dict[str, Dict[str, Dict[str, Any]]]): Results per group and url name.
+        repeat (int): Number of measured requests per url.
+    """
+    with open(path, "w") as baseline_file:
+        json.dump({"repeat": repeat, "results": results}, baseline_file, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Load results saved with save_baseline.
+
+    Args:
+        path (str): Path of the JSON file.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, Any]]]: Baseline results per group and url name.
+    """
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["results"]
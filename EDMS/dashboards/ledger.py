@@ -0,0 +1,140 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from dashboards.models import MonthlyLedger
+from dashboards.plot_cache import invalidate_plot_data
+from dateutil.relativedelta import relativedelta
+from django.db import transaction
+from django.db.models import F, QuerySet, Sum
+from django.db.models.functions import Coalesce, TruncMonth
+from employees.models.models_salaries import Salary
+from orders.models import Order
+
+LedgerBucket = Tuple[date, Optional[int]]
+
+
+def get_month(day: date) -> date:
+    """
+    Get the first day of the month of the given day.
+
+    Args:
+        day (date): Any day of the month.
+
+    Returns:
+        date: First day of the month.
+    """
+    return day.replace(day=1)
+
+
+def refresh_monthly_ledgers(buckets: Iterable[LedgerBucket]) -> None:
+    """
+    Count again the ledger rows of the given months and employees, together with the company rows of these months.
+    Plot data cached for the employees and the company is invalidated afterwards.
+
+    Args:
+        buckets (Iterable[LedgerBucket]): Pairs of the first day of the month and the employee ID.
+    """
+    buckets = set(buckets)
+    buckets |= {(month, None) for month, _ in buckets}
+    for month, user_id in sorted(buckets, key=lambda bucket: (bucket[0], bucket[1] or 0)):
+        refresh_monthly_ledger(month=month, user_id=user_id)
+    invalidate_plot_data(user_ids={user_id for _, user_id in buckets})
+
+
+def refresh_monthly_ledger(month: date, user_id: Optional[int]) -> Optional[MonthlyLedger]:
+    """
+    Count again a single ledger row from orders, invoices and salaries.
+    The row is locked while counting, so concurrent refreshes of the same month are serialized.
+    The row is removed if there is neither an order nor a salary in the month.
+
+    Args:
+        month (date): First day of the month.
+        user_id (Optional[int]): ID of the employee or None for the whole company.
+
+    Returns:
+        Optional[MonthlyLedger]: Refreshed ledger row or None if it was removed.
+    """
+    next_month = month + relativedelta(months=1)
+    orders = Order.objects.filter(end_date__gte=month, end_date__lt=next_month)
+    salaries = Salary.objects.filter(date__gte=month, date__lt=next_month)
+    if user_id:
+        orders = orders.filter(user_id=user_id)
+        salaries = salaries.filter(user_id=user_id)
+
+    with transaction.atomic():
+        ledger, _ = MonthlyLedger.objects.select_for_update().get_or_create(month=month, user_id=user_id)
+        if not (orders.exists() or salaries.exists()):
+            ledger.delete()
+            return None
+        order_totals = orders.aggregate(income_total=Sum("income_net"), cost_total=Sum("cost_net"))
+        ledger.income_net = order_totals["income_total"] or Decimal(0)
+        ledger.cost_net = order_totals["cost_total"] or Decimal(0)
+        ledger.salaries = Decimal(salaries.aggregate(total=Coalesce(Sum("fee"), 0))["total"])
+        ledger.balance = ledger.income_net - ledger.cost_net - ledger.salaries
+        ledger.save()
+    return ledger
+
+
+@transaction.atomic
+def rebuild_monthly_ledger() -> int:
+    """
+    Count stored balances of all orders and then all ledger rows again from scratch.
+
+    Returns:
+        int: Number of created ledger rows.
+    """
+    Order.objects.all().refresh_balances()
+    totals: Dict[LedgerBucket, Dict[str, Decimal]] = defaultdict(
+        lambda: {"income_net": Decimal(0), "cost_net": Decimal(0), "salaries": Decimal(0)}
+    )
+    for field in ["income_net", "cost_net"]:
+        for bucket, total in get_monthly_totals(
+            queryset=Order.objects.all(), date_lookup="end_date", user_lookup="user", value_field=field
+        ):
+            totals[bucket][field] += total
+    for bucket, total in get_monthly_totals(
+        queryset=Salary.objects.all(), date_lookup="date", user_lookup="user", value_field="fee"
+    ):
+        totals[bucket]["salaries"] += Decimal(total)
+
+    MonthlyLedger.objects.all().delete()
+    ledgers = [
+        MonthlyLedger(
+            month=month,
+            user_id=user_id,
+            balance=values["income_net"] - values["cost_net"] - values["salaries"],
+            **values,
+        )
+        for (month, user_id), values in totals.items()
+    ]
+    MonthlyLedger.objects.bulk_create(ledgers, batch_size=1000)
+    return len(ledgers)
+
+
+def get_monthly_totals(
+    queryset: QuerySet, date_lookup: str, user_lookup: str, value_field: str
+) -> Iterable[Tuple[LedgerBucket, Decimal]]:
+    """
+    Sum the value field per month and employee, and per month for the whole company.
+
+    Args:
+        queryset (QuerySet): Rows to sum.
+        date_lookup (str): Lookup to the date deciding about the month.
+        user_lookup (str): Lookup to the employee.
+        value_field (str): Field to sum.
+
+    Yields:
+        Tuple[LedgerBucket, Decimal]: Bucket and its sum.
+    """
+    rows = (
+        queryset.annotate(month=TruncMonth(date_lookup), ledger_user=F(user_lookup))
+        .values("month", "ledger_user")
+        .annotate(total=Sum(value_field))
+        .order_by()
+    )
+    for row in rows:
+        yield (row["month"], None), row["total"]
+        if row["ledger_user"]:
+            yield (row["month"], row["ledger_user"]), row["total"]
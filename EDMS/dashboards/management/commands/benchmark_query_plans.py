@@ -0,0 +1,23 @@
+from dashboards.query_plans import compare_query_plans, get_indexed_lookups
+from django.core.management import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = (
+        "Show query plans of the filter, ledger and task lookups without and with their indexes. Indexes are dropped "
+        "in rolled back transactions, so run it against a generated dataset, not the production database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--plans", action="store_true", help="Print full query plans, not only summaries.")
+
+    def handle(self, *args, **options) -> None:
+        """
+        Explain every indexed lookup and print the execution time and the used indexes before and after indexing.
+        """
+        for lookup_name, plans in compare_query_plans(lookups=get_indexed_lookups()).items():
+            self.stdout.write(self.style.MIGRATE_HEADING(lookup_name))
+            for label, plan in plans.items():
+                self.stdout.write(f"  {label.replace('_', ' ')}: {plan.summarize()}")
+                if options["plans"]:
+                    self.stdout.write("\n".join(f"    {line}" for line in plan.plan.splitlines()))
@@ -0,0 +1,84 @@
+from typing import Any, Dict
+
+from common_tests.consts import group_names_with_permission_codenames
+from dashboards.benchmark import (
+    benchmark_url,
+    find_regressions,
+    get_benchmark_urls,
+    get_group_user,
+    load_baseline,
+    save_baseline,
+)
+from django.core.management import BaseCommand, CommandError, CommandParser
+from django.test import Client
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every named url as a user of each group and report p50/p95 latency, SQL queries and response size. "
+        "Run it against a seeded database, e.g. after generate_example_data --scale."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=5, help="Number of measured requests per url.")
+        parser.add_argument(
+            "--groups",
+            nargs="+",
+            choices=list(group_names_with_permission_codenames),
+            default=list(group_names_with_permission_codenames),
+            help="Groups whose users request the urls.",
+        )
+        parser.add_argument("--url-names", nargs="+", default=None, help="Names of the urls to benchmark.")
+        parser.add_argument("--save", default=None, help="Path of the JSON file to save the results as a baseline.")
+        parser.add_argument("--compare", default=None, help="Path of the JSON baseline to compare the results with.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=20,
+            help="Accepted p95 latency growth in percent when comparing with the baseline.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Benchmark the urls for each group, save the results and fail if they regressed against the baseline.
+        """
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be greater than 0.")
+        urls = get_benchmark_urls(url_names=options["url_names"])
+        results = {}
+        for group_name in options["groups"]:
+            user = get_group_user(group_name=group_name)
+            if not user:
+                self.stdout.write(self.style.WARNING(f"Skipped {group_name}: no active user in the group."))
+                continue
+            client = Client()
+            client.force_login(user)
+            results[group_name] = {}
+            for url in urls:
+                path = url.get_path()
+                if not path:
+                    continue
+                result = benchmark_url(client=client, path=path, repeat=options["repeat"])
+                results[group_name][url.name] = result
+                self.write_result(group_name=group_name, url_name=url.name, result=result)
+        if options["save"]:
+            save_baseline(path=options["save"], results=results, repeat=options["repeat"])
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {options['save']}."))
+        if options["compare"]:
+            regressions = find_regressions(
+                results=results,
+                baseline=load_baseline(path=options["compare"]),
+                latency_threshold=options["threshold"] / 100,
+            )
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            if regressions:
+                raise CommandError(f"Found {len(regressions)} regressions against {options['compare']}.")
+            self.stdout.write(self.style.SUCCESS(f"No regressions against {options['compare']}."))
+
+    def write_result(self, group_name: str, url_name: str, result: Dict[str, Any]) -> None:
+        self.stdout.write(
+            f"{group_name:<12} {url_name:<32} {result['status']:>4} "
+            f"p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+            f"{result['queries']:>4} queries  {result['size']:>9} B"
+        )
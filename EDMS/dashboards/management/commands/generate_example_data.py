@@ -5,10 +5,11 @@ from decimal import Decimal
 from common_tests.consts import group_names_with_permission_codenames
 from companies.factories import AddressFactory, CompanyFactory, ContactFactory
 from contracts.factories import ContractFactory
+from dashboards.scaled_example_data import ScaledExampleData
 from dateutil.relativedelta import relativedelta
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.core.management import BaseCommand
+from django.core.management import BaseCommand, CommandParser
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from employees.factories.factories_addendum import AddendumFactory
@@ -37,10 +38,25 @@ class Command(BaseCommand):
     yesterday = today - timezone.timedelta(days=1)
     tomorrow = today + timezone.timedelta(days=1)
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--scale",
+            action="store_true",
+            help="Generate a large dataset with bulk inserts instead of a few presentation records.",
+        )
+        parser.add_argument("--companies", type=int, default=100, help="Number of companies in the scale mode.")
+        parser.add_argument("--years", type=int, default=3, help="Number of past years in the scale mode.")
+        parser.add_argument("--employees", type=int, default=50, help="Number of employees in the scale mode.")
+        parser.add_argument("--seed", type=int, default=None, help="Random seed to generate the same dataset again.")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Number of rows inserted in one query.")
+
     def handle(self, *args, **options) -> None:
         """
         The main handler method that orchestrates the generation of example data by calling other methods.
         """
+        if options.get("scale"):
+            self.generate_scaled_data(**options)
+            return
         self.create_users_with_groups()
         self.create_companies()
         self.create_contacts_to_companies()
@@ -52,6 +68,30 @@ class Command(BaseCommand):
         self.create_orders_and_protocols()
         self.create_invoices()
 
+    def generate_scaled_data(self, companies: int, years: int, employees: int, seed: int, batch_size: int, **_) -> None:
+        """
+        Generate a production-sized dataset for profiling and benchmarks.
+
+        Args:
+            companies (int): Number of companies.
+            years (int): Number of past years.
+            employees (int): Number of employees.
+            seed (int): Random seed, None to generate a different dataset on every run.
+            batch_size (int): Number of rows inserted in one query.
+        """
+        started_at = timezone.now()
+        counts = ScaledExampleData(
+            companies=companies,
+            years=years,
+            employees=employees,
+            seed=seed,
+            batch_size=batch_size,
+            log=lambda message: self.stdout.write(self.style.SUCCESS(message)),
+        ).generate()
+        for name, count in counts.items():
+            self.stdout.write(f"{name}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Successfully generated scaled data in {timezone.now() - started_at}."))
+
     def create_invoices(self) -> None:
         """
         Create example invoices based on existing orders in the database.
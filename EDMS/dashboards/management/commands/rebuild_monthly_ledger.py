@@ -0,0 +1,13 @@
+from dashboards.ledger import rebuild_monthly_ledger
+from django.core.management import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Count the monthly ledger again from orders, invoices and salaries."
+
+    def handle(self, *args, **options) -> None:
+        """
+        Count stored balances of orders and all ledger rows again from scratch.
+        """
+        created_rows = rebuild_monthly_ledger()
+        self.stdout.write(self.style.SUCCESS(f"Successfully rebuilt monthly ledger ({created_rows} rows)."))
@@ -0,0 +1,89 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:43
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyLedger",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("month", models.DateField(help_text="First day of the month.")),
+                (
+                    "income_net",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0"),
+                        help_text="Sum of income invoices net price of orders ended in the month.",
+                        max_digits=14,
+                    ),
+                ),
+                (
+                    "cost_net",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0"),
+                        help_text="Sum of cost invoices net price of orders ended in the month.",
+                        max_digits=14,
+                    ),
+                ),
+                (
+                    "salaries",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0"),
+                        help_text="Sum of salaries paid in the month.",
+                        max_digits=14,
+                    ),
+                ),
+                (
+                    "balance",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0"),
+                        help_text="Income net minus cost net and salaries.",
+                        max_digits=14,
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Employee of the orders and salaries, empty for the whole company row.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_ledgers",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="monthlyledger",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("user__isnull", False)),
+                fields=("user", "month"),
+                name="unique_monthly_ledger_user_month",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="monthlyledger",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("user__isnull", True)),
+                fields=("month",),
+                name="unique_monthly_ledger_company_month",
+            ),
+        ),
+    ]
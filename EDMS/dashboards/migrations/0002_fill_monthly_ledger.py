@@ -0,0 +1,71 @@
+from django.db import migrations
+
+FILL_MONTHLY_LEDGER_SQL = [
+    """
+    WITH invoice_value AS (
+        SELECT
+            invoice.id,
+            CASE
+                WHEN invoice.type IN ('original', 'duplicate') AND invoice.linked_invoice_id IS NULL
+                    THEN invoice.net_price
+                WHEN invoice.type = 'correcting' THEN invoice.net_price - COALESCE(linked_invoice.net_price, 0)
+                ELSE 0
+            END AS value
+        FROM invoices_invoice invoice
+        LEFT JOIN invoices_invoice linked_invoice ON linked_invoice.id = invoice.linked_invoice_id
+    ),
+    entries AS (
+        SELECT
+            date_trunc('month', ord.end_date)::date AS month,
+            ord.user_id,
+            COALESCE(
+                (
+                    SELECT SUM(invoice_value.value)
+                    FROM orders_order_income_invoice link
+                    JOIN invoice_value ON invoice_value.id = link.invoice_id
+                    WHERE link.order_id = ord.id
+                ),
+                0
+            ) AS income_net,
+            COALESCE(
+                (
+                    SELECT SUM(invoice_value.value)
+                    FROM orders_order_cost_invoice link
+                    JOIN invoice_value ON invoice_value.id = link.invoice_id
+                    WHERE link.order_id = ord.id
+                ),
+                0
+            ) AS cost_net,
+            0 AS salaries
+        FROM orders_order ord
+        UNION ALL
+        SELECT date_trunc('month', salary.date)::date, salary.user_id, 0, 0, salary.fee
+        FROM employees_salary salary
+    )
+    INSERT INTO dashboards_monthlyledger (month, user_id, income_net, cost_net, salaries, balance)
+    SELECT
+        month,
+        user_id,
+        SUM(income_net),
+        SUM(cost_net),
+        SUM(salaries),
+        SUM(income_net) - SUM(cost_net) - SUM(salaries)
+    FROM entries
+    GROUP BY GROUPING SETS ((month, user_id), (month))
+    HAVING GROUPING(user_id) = 1 OR user_id IS NOT NULL
+    """,
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboards", "0001_initial"),
+        ("employees", "0002_initial"),
+        ("invoices", "0001_initial"),
+        ("orders", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=FILL_MONTHLY_LEDGER_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+User = get_user_model()
+
+
+class MonthlyLedger(models.Model):
+    month = models.DateField(help_text="First day of the month.")
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="monthly_ledgers",
+        help_text="Employee of the orders and salaries, empty for the whole company row.",
+    )
+    income_net = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal(0),
+        help_text="Sum of income invoices net price of orders ended in the month.",
+    )
+    cost_net = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal(0),
+        help_text="Sum of cost invoices net price of orders ended in the month.",
+    )
+    salaries = models.DecimalField(
+        max_digits=14, decimal_places=2, default=Decimal(0), help_text="Sum of salaries paid in the month."
+    )
+    balance = models.DecimalField(
+        max_digits=14, decimal_places=2, default=Decimal(0), help_text="Income net minus cost net and salaries."
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month"],
+                condition=models.Q(user__isnull=False),
+                name="unique_monthly_ledger_user_month",
+            ),
+            models.UniqueConstraint(
+                fields=["month"],
+                condition=models.Q(user__isnull=True),
+                name="unique_monthly_ledger_company_month",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.month.month}/{self.month.year} - {self.user or 'company'}"
@@ -0,0 +1,68 @@
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+from django.utils import timezone
+
+PLOT_DATA_CACHE_TIMEOUT = 60 * 60 * 24
+COMPANY_SCOPE = "company"
+
+
+def get_user_scope(user_id: int) -> str:
+    """
+    Get the plot scope of a single employee.
+
+    Args:
+        user_id (int): ID of the employee.
+
+    Returns:
+        str: Scope name used in the cache key.
+    """
+    return f"user_{user_id}"
+
+
+def get_plot_data_cache_key(scope: str) -> str:
+    """
+    Get the cache key of the plot data for the given scope.
+    The key contains the current month, because the plot series ends at the current month.
+
+    Args:
+        scope (str): Scope of the plot, the company or a single employee.
+
+    Returns:
+        str: Cache key.
+    """
+    today = timezone.now().date()
+    return f"plot_data_{scope}_{today.year}_{today.month}"
+
+
+def get_cached_plot_data(
+    scope: str, count_plot_data: Callable[[], Dict[Tuple[int, int], Decimal]]
+) -> Dict[Tuple[int, int], Decimal]:
+    """
+    Get the plot data for the given scope from the cache or count and cache it.
+
+    Args:
+        scope (str): Scope of the plot, the company or a single employee.
+        count_plot_data (Callable[[], Dict[Tuple[int, int], Decimal]]): Function counting the plot data.
+
+    Returns:
+        Dict[Tuple[int, int], Decimal]: Data for the plot, with month/year as keys and balance as values.
+    """
+    cache_key = get_plot_data_cache_key(scope=scope)
+    plot_data = cache.get(cache_key)
+    if plot_data is None:
+        plot_data = count_plot_data()
+        cache.set(cache_key, plot_data, PLOT_DATA_CACHE_TIMEOUT)
+    return plot_data
+
+
+def invalidate_plot_data(user_ids: Iterable[Optional[int]]) -> None:
+    """
+    Remove cached plot data of the company and of the given employees.
+
+    Args:
+        user_ids (Iterable[Optional[int]]): IDs of the employees whose data changed.
+    """
+    scopes = {COMPANY_SCOPE} | {get_user_scope(user_id=user_id) for user_id in user_ids if user_id}
+    cache.delete_many([get_plot_data_cache_key(scope=scope) for scope in scopes])
@@ -0,0 +1,153 @@
+import re
+from typing import Callable, Dict, List, Optional
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from employees.models.models_agreement import Agreement
+from employees.models.models_salaries import Salary
+from employees.models.models_vacation import Vacation
+from invoices.models import Invoice
+from orders.models import Order
+
+User = get_user_model()
+
+EXECUTION_TIME_PATTERN = re.compile(r"Execution Time: ([\d.]+) ms")
+INDEX_NAME_PATTERN = re.compile(r"(?:Index Scan|Index Only Scan) (?:Backward )?using (\w+)|Bitmap Index Scan on (\w+)")
+
+
+class IndexedLookup:
+    def __init__(self, name: str, get_queryset: Callable[[], QuerySet], index_names: List[str]) -> None:
+        """
+        Query run by a filter or a scheduled task together with the indexes created for it.
+
+        Args:
+            name (str): Name of the lookup.
+            get_queryset (Callable[[], QuerySet]): Function which builds the queryset of the lookup.
+            index_names (List[str]): Names of the indexes created for the lookup.
+        """
+        self.name = name
+        self.get_queryset = get_queryset
+        self.index_names = index_names
+
+
+class QueryPlan:
+    def __init__(self, plan: str) -> None:
+        """
+        Result of EXPLAIN ANALYZE.
+
+        Args:
+            plan (str): Text of the query plan.
+        """
+        self.plan = plan
+        match = EXECUTION_TIME_PATTERN.search(plan)
+        self.execution_ms: Optional[float] = float(match.group(1)) if match else None
+        self.index_names = sorted({name for names in INDEX_NAME_PATTERN.findall(plan) for name in names if name})
+        self.top_node = plan.splitlines()[0].split("  (cost=")[0].strip() if plan else ""
+
+    def summarize(self) -> str:
+        indexes = ", ".join(self.index_names) if self.index_names else "no index"
+        return f"{self.execution_ms} ms, {self.top_node} ({indexes})"
+
+
+def get_indexed_lookups() -> List[IndexedLookup]:
+    """
+    Get the lookups of the invoice filter, the ledger, the plots and the midnight tasks which have indexes.
+
+    Returns:
+        List[IndexedLookup]: Lookups with the indexes created for them.
+    """
+    today = timezone.now().date()
+    month = today.replace(day=1) - relativedelta(months=1)
+    next_month = month + relativedelta(months=1)
+    user_id = Salary.objects.order_by("user_id").values_list("user_id", flat=True).first()
+    return [
+        IndexedLookup(
+            name="unpaid postponed invoices",
+            get_queryset=lambda: Invoice.objects.filter(is_paid=False, payment_date__lt=today),
+            index_names=["invoice_unpaid_payment_idx"],
+        ),
+        IndexedLookup(
+            name="monthly ledger orders",
+            get_queryset=lambda: Order.objects.filter(end_date__gte=month, end_date__lt=next_month),
+            index_names=["order_end_date_idx", "order_user_end_date_idx"],
+        ),
+        IndexedLookup(
+            name="monthly ledger orders of user",
+            get_queryset=lambda: Order.objects.filter(user_id=user_id, end_date__gte=month, end_date__lt=next_month),
+            index_names=["order_end_date_idx", "order_user_end_date_idx"],
+        ),
+        IndexedLookup(
+            name="monthly salaries",
+            get_queryset=lambda: Salary.objects.filter(date__gte=month, date__lt=next_month),
+            index_names=["salary_date_idx", "salary_user_date_idx"],
+        ),
+        IndexedLookup(
+            name="monthly salaries of user",
+            get_queryset=lambda: Salary.objects.filter(user_id=user_id, date__gte=month, date__lt=next_month),
+            index_names=["salary_date_idx", "salary_user_date_idx"],
+        ),
+        IndexedLookup(
+            name="starting agreements",
+            get_queryset=lambda: Agreement.objects.filter(start_date=today),
+            index_names=["agreement_start_date_idx"],
+        ),
+        IndexedLookup(
+            name="ending agreements",
+            get_queryset=lambda: Agreement.objects.filter(end_date_actual=today - timezone.timedelta(days=1)),
+            index_names=["agreement_end_date_actual_idx"],
+        ),
+        IndexedLookup(
+            name="expiring agreements reminder",
+            get_queryset=lambda: Agreement.objects.filter(end_date=today + timezone.timedelta(days=7)),
+            index_names=["agreement_end_date_idx"],
+        ),
+        IndexedLookup(
+            name="vacations reminder",
+            get_queryset=lambda: Vacation.objects.filter(start_date=today + timezone.timedelta(days=7)),
+            index_names=["vacation_start_date_idx"],
+        ),
+    ]
+
+
+def explain_lookup(lookup: IndexedLookup, with_indexes: bool) -> QueryPlan:
+    """
+    Run EXPLAIN ANALYZE of the lookup. Without indexes, the indexes of the lookup are dropped in a transaction which
+    is rolled back afterwards, so the table is locked for the time of the query.
+
+    Args:
+        lookup (IndexedLookup): The lookup to explain.
+        with_indexes (bool): If False, the query is planned without the indexes of the lookup.
+
+    Returns:
+        QueryPlan: Plan and execution time of the query.
+    """
+    with transaction.atomic():
+        if not with_indexes:
+            with connection.cursor() as cursor:
+                for index_name in lookup.index_names:
+                    cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(index_name)}")
+        plan = QueryPlan(plan=lookup.get_queryset().explain(analyze=True))
+        transaction.set_rollback(True)
+    return plan
+
+
+def compare_query_plans(lookups: List[IndexedLookup]) -> Dict[str, Dict[str, QueryPlan]]:
+    """
+    Explain each lookup without and with its indexes.
+
+    Args:
+        lookups (List[IndexedLookup]): Lookups to explain.
+
+    Returns:
+        Dict[str, Dict[str, QueryPlan]]: Plans by lookup name, under "without_indexes" and "with_indexes" keys.
+    """
+    return {
+        lookup.name: {
+            "without_indexes": explain_lookup(lookup=lookup, with_indexes=False),
+            "with_indexes": explain_lookup(lookup=lookup, with_indexes=True),
+        }
+        for lookup in lookups
+    }
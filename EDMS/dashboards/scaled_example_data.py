@@ -0,0 +1,617 @@
+import calendar
+import random
+from collections import Counter
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from math import ceil
+from typing import Callable, Dict, Iterable, List, Optional
+
+from common_tests.consts import group_names_with_permission_codenames
+from companies.models import Address, Company
+from contracts.models import Contract
+from dashboards.ledger import rebuild_monthly_ledger
+from dashboards.plot_cache import invalidate_plot_data
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Max
+from django.utils import timezone
+from employees.models.models_agreement import Agreement
+from employees.models.models_salaries import Salary
+from employees.models.models_vacation import Vacation
+from employees.models.models_vacation_ledger import VacationLedger
+from faker import Faker
+from invoices.models import Invoice
+from orders.models import Order
+
+from EDMS.env import env
+from EDMS.group_utils import create_group_with_permissions
+
+User = get_user_model()
+
+COMPANIES_PER_CHUNK = 200
+SHORTCUT_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+EXAMPLE_SCAN_CONTENT = b"%PDF-1.4\n% Example document generated by generate_example_data.\n"
+
+
+class ScaledExampleData:
+    def __init__(
+        self,
+        companies: int,
+        years: int,
+        employees: int,
+        seed: Optional[int] = None,
+        batch_size: int = 5000,
+        log: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Prepare generation of a large and internally consistent dataset inserted with bulk queries.
+
+        Args:
+            companies (int): Number of customer companies, each with one contract and its monthly orders.
+            years (int): Number of past years covered by contracts, agreements, salaries and vacations.
+            employees (int): Number of employees (one ceo, some accountants and hrs, managers).
+            seed (Optional[int]): Seed of the random generator, the same seed generates the same dataset.
+            batch_size (int): Number of rows inserted in a single query.
+            log (Optional[Callable[[str], None]]): Function writing progress messages, e.g. stdout.write of the
+                management command. Messages are not written if it is None.
+        """
+        self.companies = companies
+        self.years = years
+        self.employees = employees
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.random = random.Random(seed)
+        self.faker = Faker()
+        self.faker.seed_instance(seed)
+        self.today = timezone.now().date()
+        self.first_day = (self.today - relativedelta(years=years)).replace(day=1)
+        self.run_id = f"{self.random.getrandbits(24):06x}"
+        self.counts = Counter()
+        self.invoice_number = 0
+
+    def generate(self) -> Dict[str, int]:
+        """
+        Generate employees with agreements, salaries and vacations, then companies with contracts, orders and invoices.
+        The monthly ledger is rebuilt at the end, because bulk inserts do not send signals.
+
+        Returns:
+            Dict[str, int]: Number of created rows per model name.
+        """
+        users_per_group = self.create_employees()
+        agreements = self.create_agreements(users=[user for users in users_per_group.values() for user in users])
+        self.create_salaries(agreements=agreements)
+        self.create_vacations(agreements=agreements)
+        self.set_vacation_left(agreements=agreements)
+        self.log(f"Successfully generated {self.counts['users']} employees with agreements, salaries and vacations.")
+
+        my_company = self.get_my_company()
+        managers = users_per_group["managers"]
+        for chunk_start in range(0, self.companies, COMPANIES_PER_CHUNK):
+            companies = self.create_companies(count=min(COMPANIES_PER_CHUNK, self.companies - chunk_start))
+            contracts = self.create_contracts(companies=companies, managers=managers)
+            orders = self.create_orders(contracts=contracts)
+            self.create_invoices(orders=orders, my_company=my_company, suppliers=companies)
+            self.log(f"Successfully generated {chunk_start + len(companies)}/{self.companies} companies with orders.")
+
+        self.counts["monthly ledgers"] = rebuild_monthly_ledger()
+        invalidate_plot_data(user_ids=[user.pk for user in managers])
+        return dict(self.counts)
+
+    def create_employees(self) -> Dict[str, List[User]]:
+        """
+        Create employees with addresses and groups. About 5% of them are inactive (fired).
+
+        Returns:
+            Dict[str, List[User]]: Group names as keys and employees of the group as values.
+        """
+        groups = {
+            group_name: create_group_with_permissions(group_name=group_name, permission_codenames=permission_codenames)
+            for group_name, permission_codenames in group_names_with_permission_codenames.items()
+        }
+        office_workers = max(1, self.employees // 20)
+        group_names = ["ceos"] + ["accountants"] * office_workers + ["hrs"] * office_workers
+        group_names += ["managers"] * max(1, self.employees - len(group_names))
+
+        addresses = self.bulk_create(Address, [self.build_address() for _ in group_names])
+        password = make_password(env("EXAMPLE_PASSWORD"))
+        users = [
+            User(
+                first_name=self.faker.first_name(),
+                last_name=self.faker.last_name(),
+                email=f"employee{number}.{self.run_id}@example.com",
+                password=password,
+                is_active=self.random.random() > 0.05 or group_name == "ceos",
+                phone_number=self.faker.msisdn(),
+                position=group_name[:-1],
+                vacation_days_per_year=self.random.choice([20, 26]),
+                address=address,
+            )
+            for number, (group_name, address) in enumerate(zip(group_names, addresses), start=1)
+        ]
+        self.bulk_create(User, users)
+        self.bulk_create(
+            User.groups.through,
+            [User.groups.through(user_id=user.pk, group_id=groups[name].pk) for user, name in zip(users, group_names)],
+        )
+        users_per_group = {group_name: [] for group_name in groups}
+        for user, group_name in zip(users, group_names):
+            users_per_group[group_name].append(user)
+        return users_per_group
+
+    def create_agreements(self, users: List[User]) -> List[Agreement]:
+        """
+        Create one agreement per employee. Agreements of inactive employees end before today.
+
+        Args:
+            users (List[User]): Employees.
+
+        Returns:
+            List[Agreement]: Created agreements.
+        """
+        agreement_types = [Agreement.EMPLOYMENT] * 7 + [Agreement.COMMISSION, Agreement.MANDATE, Agreement.B2B]
+        scan = self.get_example_scan(upload_to="agreements")
+        agreements = []
+        for number, user in enumerate(users, start=1):
+            start_date = self.random_date(self.first_day, self.today - relativedelta(months=1))
+            if user.is_active:
+                end_date = max(
+                    start_date + relativedelta(years=self.random.randint(1, 5)),
+                    self.today + relativedelta(days=self.random.randint(30, 365)),
+                )
+            else:
+                end_date = self.random_date(start_date + relativedelta(days=1), self.today - relativedelta(days=1))
+            agreements.append(
+                Agreement(
+                    name=f"Agreement #{self.run_id}-{number}",
+                    type=self.random.choice(agreement_types),
+                    salary_gross=self.random.randrange(5000, 20000, 100),
+                    create_date=start_date - relativedelta(days=7),
+                    start_date=start_date,
+                    end_date=end_date,
+                    end_date_actual=end_date,
+                    user=user,
+                    scan=scan,
+                    is_current=start_date <= self.today <= end_date,
+                )
+            )
+        return self.bulk_create(Agreement, agreements)
+
+    def create_salaries(self, agreements: List[Agreement]) -> None:
+        """
+        Create a salary on the 10th day of every month of the agreements up to today.
+
+        Args:
+            agreements (List[Agreement]): Agreements of the employees.
+        """
+        self.bulk_create(
+            Salary,
+            (
+                Salary(date=month.replace(day=10), user_id=agreement.user_id, fee=agreement.salary_gross)
+                for agreement in agreements
+                for month in self.get_months(agreement.start_date, min(agreement.end_date_actual, self.today))
+                if month.replace(day=10) <= self.today
+            ),
+        )
+
+    def create_vacations(self, agreements: List[Agreement]) -> None:
+        """
+        Create two annual vacations per year of every employment agreement, substituted by another employee.
+
+        Args:
+            agreements (List[Agreement]): Agreements of the employees.
+        """
+        user_ids = [agreement.user_id for agreement in agreements]
+        if len(user_ids) < 2:
+            return
+        scan = self.get_example_scan(upload_to="vacations")
+        vacations = []
+        for agreement in agreements:
+            if agreement.type != Agreement.EMPLOYMENT:
+                continue
+            last_day = min(agreement.end_date_actual, self.today)
+            for year in range(agreement.start_date.year, last_day.year + 1):
+                for _ in range(2):
+                    first_day = max(agreement.start_date, date(year, 1, 1))
+                    start_date = self.random_date(first_day, date(year, 12, 31))
+                    end_date = start_date + relativedelta(days=self.random.randint(0, 9))
+                    if end_date > last_day:
+                        continue
+                    vacations.append(
+                        Vacation(
+                            type=Vacation.ANNUAL,
+                            start_date=start_date,
+                            end_date=end_date,
+                            leave_user_id=agreement.user_id,
+                            scan=scan,
+                            included_days_off=self.count_days_off(start_date=start_date, end_date=end_date),
+                        )
+                    )
+        self.bulk_create(Vacation, vacations)
+        substitutes = []
+        for vacation in vacations:
+            substitute_id = self.random.choice(user_ids)
+            while substitute_id == vacation.leave_user_id:
+                substitute_id = self.random.choice(user_ids)
+            substitutes.append(Vacation.substitute_users.through(vacation_id=vacation.pk, user_id=substitute_id))
+        self.bulk_create(Vacation.substitute_users.through, substitutes)
+
+    def set_vacation_left(self, agreements: List[Agreement]) -> None:
+        """
+        Create vacation ledgers of the employees for every year of their agreements up to today, with days of their
+        annual vacations and vacation granted by employment agreements, then set vacation left of the employees from
+        the ledgers of the current year. Days left at the end of a year are carried over to the next year, a negative
+        balance is not.
+
+        Args:
+            agreements (List[Agreement]): Agreements of the employees.
+        """
+        used_days = Counter()
+        for vacation in Vacation.objects.filter(
+            leave_user__in=[agreement.user_id for agreement in agreements], type=Vacation.ANNUAL
+        ).only("type", "leave_user_id", "start_date", "end_date", "included_days_off"):
+            used_days[(vacation.leave_user_id, vacation.start_date.year)] += vacation.count_used_days()
+        ledgers = []
+        users = []
+        for agreement in agreements:
+            carried_over = 0
+            last_year = min(agreement.end_date_actual.year, self.today.year)
+            for year in range(agreement.start_date.year, last_year + 1):
+                ledger = VacationLedger(
+                    user_id=agreement.user_id,
+                    year=year,
+                    granted=self.count_granted_vacation(agreement=agreement, year=year),
+                    used=used_days[(agreement.user_id, year)],
+                    carried_over=carried_over,
+                )
+                carried_over = ledger.carry_over
+                ledgers.append(ledger)
+            agreement.user.vacation_left = ledger.balance if last_year == self.today.year else 0
+            users.append(agreement.user)
+        self.bulk_create(VacationLedger, ledgers)
+        User.objects.bulk_update(users, ["vacation_left"], batch_size=self.batch_size)
+
+    def count_granted_vacation(self, agreement: Agreement, year: int) -> int:
+        """
+        Count vacation days granted by the agreement in the year, in proportion to the months of the agreement in the
+        year. The current year is counted like by the agreement itself, so only the current agreement grants days.
+
+        Args:
+            agreement (Agreement): Agreement of the employee.
+            year (int): The counted year.
+
+        Returns:
+            int: Granted vacation days, 0 for other agreements than employment.
+        """
+        if year == self.today.year:
+            return agreement.count_granted_vacation_from_agreement()
+        if agreement.type != Agreement.EMPLOYMENT:
+            return 0
+        months_in_year = 12
+        first_day = max(agreement.start_date, date(year, 1, 1))
+        last_day = min(agreement.end_date_actual, date(year, 12, 31))
+        work_months = sum(1 for _ in self.get_months(first_day, last_day))
+        return ceil(work_months * agreement.user.vacation_days_per_year / months_in_year)
+
+    def get_my_company(self) -> Company:
+        """
+        Get the company marked as mine or create it.
+
+        Returns:
+            Company: The company selling the orders.
+        """
+        my_company = Company.objects.filter(is_mine=True).first()
+        if my_company:
+            return my_company
+        return self.create_companies(count=1, is_mine=True)[0]
+
+    def create_companies(self, count: int, is_mine: bool = False) -> List[Company]:
+        """
+        Create companies with addresses and unique identifiers and shortcuts.
+
+        Args:
+            count (int): Number of companies.
+            is_mine (bool): Flag to create the company marked as mine.
+
+        Returns:
+            List[Company]: Created companies.
+        """
+        identifiers = Company.objects.aggregate(krs=Max("krs"), regon=Max("regon"), nip=Max("nip"))
+        first_krs = max(identifiers["krs"] or 0, 10_000_000_000_000) + 1
+        first_regon = max(identifiers["regon"] or 0, 100_000_000) + 1
+        first_nip = max(identifiers["nip"] or 0, 1_000_000_000) + 1
+        shortcuts = self.get_free_shortcuts(count=count)
+        addresses = self.bulk_create(Address, [self.build_address() for _ in range(count)])
+        companies = [
+            Company(
+                name=self.faker.company()[:100],
+                krs=first_krs + number,
+                regon=first_regon + number,
+                nip=first_nip + number,
+                address=address,
+                is_mine=is_mine,
+                shortcut=shortcut,
+            )
+            for number, (address, shortcut) in enumerate(zip(addresses, shortcuts))
+        ]
+        return self.bulk_create(Company, companies)
+
+    def create_contracts(self, companies: List[Company], managers: List[User]) -> List[Contract]:
+        """
+        Create one contract per company, handled by one to three managers.
+
+        Args:
+            companies (List[Company]): Customer companies.
+            managers (List[User]): Managers responsible for the contracts.
+
+        Returns:
+            List[Contract]: Created contracts.
+        """
+        scan = self.get_example_scan(upload_to="contracts")
+        contracts = []
+        for company in companies:
+            start_date = self.random_date(self.first_day, self.today).replace(day=1)
+            end_date = start_date + relativedelta(months=self.random.randint(6, 36), days=-1)
+            contracts.append(
+                Contract(
+                    name=f"Contract #{company.shortcut}-{start_date.year}",
+                    create_date=start_date - relativedelta(days=self.random.randint(1, 30)),
+                    start_date=start_date,
+                    end_date=end_date,
+                    company=company,
+                    price=self.random.randrange(100_000, 3_000_000, 1000),
+                    scan=scan,
+                )
+            )
+        self.bulk_create(Contract, contracts)
+        employees = []
+        for contract in contracts:
+            contract.managers = self.random.sample(managers, k=min(len(managers), self.random.randint(1, 3)))
+            employees += [
+                Contract.employee.through(contract_id=contract.pk, user_id=user.pk) for user in contract.managers
+            ]
+        self.bulk_create(Contract.employee.through, employees)
+        return contracts
+
+    def create_orders(self, contracts: List[Contract]) -> List[Order]:
+        """
+        Create an order for every started month of the contracts. The payment is split equally between the months.
+
+        Args:
+            contracts (List[Contract]): Contracts of the companies.
+
+        Returns:
+            List[Order]: Created orders.
+        """
+        orders = []
+        for contract in contracts:
+            months = list(self.get_months(contract.start_date, contract.end_date))
+            payment = (Decimal(contract.price) / len(months)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            for month in months:
+                if month > self.today:
+                    break
+                end_date = month.replace(day=calendar.monthrange(month.year, month.month)[1])
+                orders.append(
+                    Order(
+                        payment=payment,
+                        status=Order.CLOSED if end_date < self.today else Order.OPEN,
+                        company=contract.company,
+                        user=self.random.choice(contract.managers),
+                        contract=contract,
+                        create_date=month,
+                        start_date=month,
+                        end_date=end_date,
+                    )
+                )
+        return self.bulk_create(Order, orders)
+
+    def create_invoices(self, orders: List[Order], my_company: Company, suppliers: List[Company]) -> None:
+        """
+        Create an income invoice and one to three cost invoices for every finished order.
+        About 3% of income invoices are corrected by a correcting invoice.
+
+        Args:
+            orders (List[Order]): Orders of the companies.
+            my_company (Company): The company selling the orders.
+            suppliers (List[Company]): Companies selling the costs.
+        """
+        scan = self.get_example_scan(upload_to="invoices")
+        income_invoices, cost_invoices = [], []
+        for order in orders:
+            if order.end_date > self.today:
+                continue
+            income_invoice = self.build_invoice(
+                seller=my_company, buyer=order.company, net_price=order.payment, create_date=order.end_date, scan=scan
+            )
+            income_invoices.append((order, income_invoice))
+            for _ in range(self.random.randint(1, 3)):
+                net_price = Decimal(self.random.uniform(1000, float(order.payment) * 0.3)).quantize(Decimal("0.01"))
+                cost_invoices.append(
+                    (
+                        order,
+                        self.build_invoice(
+                            seller=self.random.choice(suppliers),
+                            buyer=my_company,
+                            net_price=net_price,
+                            create_date=order.end_date,
+                            scan=scan,
+                        ),
+                    )
+                )
+        self.bulk_create(Invoice, [invoice for _, invoice in income_invoices + cost_invoices])
+
+        correcting_invoices = []
+        for order, invoice in income_invoices:
+            if self.random.random() < 0.03:
+                correcting_invoice = self.build_invoice(
+                    seller=my_company,
+                    buyer=order.company,
+                    net_price=(invoice.net_price * Decimal("0.9")).quantize(Decimal("0.01")),
+                    create_date=invoice.create_date + relativedelta(days=14),
+                    scan=scan,
+                )
+                correcting_invoice.type = Invoice.CORRECTING
+                correcting_invoice.linked_invoice = invoice
+                correcting_invoice.root_invoice = invoice
+                correcting_invoices.append((order, correcting_invoice))
+        self.bulk_create(Invoice, [invoice for _, invoice in correcting_invoices])
+
+        self.bulk_create(
+            Order.income_invoice.through,
+            [
+                Order.income_invoice.through(order_id=order.pk, invoice_id=invoice.pk)
+                for order, invoice in income_invoices + correcting_invoices
+            ],
+        )
+        self.bulk_create(
+            Order.cost_invoice.through,
+            [Order.cost_invoice.through(order_id=order.pk, invoice_id=invoice.pk) for order, invoice in cost_invoices],
+        )
+        Order.objects.filter(pk__in=[order.pk for order in orders]).refresh_balances()
+
+    def build_invoice(
+        self, seller: Company, buyer: Company, net_price: Decimal, create_date: date, scan: str
+    ) -> Invoice:
+        """
+        Build an original invoice.
+
+        Args:
+            seller (Company): Seller of the invoice.
+            buyer (Company): Buyer of the invoice.
+            net_price (Decimal): Net price of the invoice.
+            create_date (date): Creation and service date of the invoice.
+            scan (str): Name of the example scan file.
+
+        Returns:
+            Invoice: Not saved invoice.
+        """
+        self.invoice_number += 1
+        vat = (net_price * Decimal("0.23")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        payment_date = create_date + relativedelta(days=30)
+        return Invoice(
+            name=f"Invoice #{self.run_id}-{self.invoice_number}",
+            seller=seller,
+            buyer=buyer,
+            net_price=net_price,
+            vat=vat,
+            gross=net_price + vat,
+            create_date=create_date,
+            service_date=create_date,
+            payment_date=payment_date,
+            type=Invoice.ORIGINAL,
+            scan=scan,
+            is_paid=payment_date < self.today or self.random.random() < 0.5,
+        )
+
+    def build_address(self) -> Address:
+        """
+        Build a random address.
+
+        Returns:
+            Address: Not saved address.
+        """
+        return Address(
+            street_name=self.faker.street_name()[:100],
+            street_number=str(self.random.randint(1, 200)),
+            city=self.faker.city()[:100],
+            postcode=self.faker.postcode()[:10],
+            country=self.faker.country()[:100],
+        )
+
+    def get_free_shortcuts(self, count: int) -> List[str]:
+        """
+        Get company shortcuts which are not used yet.
+
+        Args:
+            count (int): Number of shortcuts.
+
+        Returns:
+            List[str]: Unique five characters shortcuts.
+        """
+        used_shortcuts = set(Company.objects.values_list("shortcut", flat=True))
+        shortcuts = []
+        while len(shortcuts) < count:
+            shortcut = "".join(self.random.choices(SHORTCUT_ALPHABET, k=5))
+            if shortcut not in used_shortcuts:
+                used_shortcuts.add(shortcut)
+                shortcuts.append(shortcut)
+        return shortcuts
+
+    def bulk_create(self, model, objs: Iterable) -> List:
+        """
+        Insert the objects in batches and count them.
+
+        Args:
+            model: Model of the objects.
+            objs (Iterable): Objects to insert.
+
+        Returns:
+            List: Inserted objects with primary keys.
+        """
+        objs = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.counts[model._meta.verbose_name_plural.lower()] += len(objs)
+        return objs
+
+    def random_date(self, start_date: date, end_date: date) -> date:
+        """
+        Get a random day between the given days.
+
+        Args:
+            start_date (date): First possible day.
+            end_date (date): Last possible day.
+
+        Returns:
+            date: Random day, the start date if the end date is earlier.
+        """
+        days = max((end_date - start_date).days, 0)
+        return start_date + relativedelta(days=self.random.randint(0, days))
+
+    @staticmethod
+    def get_months(start_date: date, end_date: date) -> Iterable[date]:
+        """
+        Get the first days of the months between the given days.
+
+        Args:
+            start_date (date): Any day of the first month.
+            end_date (date): Any day of the last month.
+
+        Yields:
+            date: First day of the month.
+        """
+        month = start_date.replace(day=1)
+        while month <= end_date:
+            yield month
+            month += relativedelta(months=1)
+
+    @staticmethod
+    def count_days_off(start_date: date, end_date: date) -> int:
+        """
+        Count Saturdays and Sundays between the given days.
+
+        Args:
+            start_date (date): First day of the vacation.
+            end_date (date): Last day of the vacation.
+
+        Returns:
+            int: Number of days off included in the vacation.
+        """
+        days = (end_date - start_date).days + 1
+        return sum(1 for day in range(days) if (start_date + relativedelta(days=day)).weekday() >= 5)
+
+    @staticmethod
+    def get_example_scan(upload_to: str) -> str:
+        """
+        Get the name of an example scan shared by all generated documents, saving the file if it does not exist.
+
+        Args:
+            upload_to (str): Directory of the documents.
+
+        Returns:
+            str: Name of the file in the storage.
+        """
+        name = f"{upload_to}/example_scan.pdf"
+        if not default_storage.exists(name):
+            name = default_storage.save(name, ContentFile(EXAMPLE_SCAN_CONTENT))
+        return name
@@ -0,0 +1,125 @@
+from typing import Any, Iterable, List, Optional
+
+from dashboards.ledger import LedgerBucket, get_month, refresh_monthly_ledgers
+from django.db import transaction
+from django.db.models import Q
+from employees.models.models_salaries import Salary
+from invoices.models import Invoice
+from orders.models import Order
+
+
+def refresh_monthly_ledgers_on_commit(buckets: Iterable[Optional[LedgerBucket]]) -> None:
+    """
+    Refresh ledger rows and invalidate cached plot data after the current transaction is committed,
+    so the ledger is counted from committed data and no request can cache the old data again.
+
+    Args:
+        buckets (Iterable[Optional[LedgerBucket]]): Months and employees whose data changed.
+    """
+    buckets = {bucket for bucket in buckets if bucket}
+    if buckets:
+        transaction.on_commit(lambda: refresh_monthly_ledgers(buckets=buckets))
+
+
+def get_ledger_bucket(instance: Order | Salary) -> LedgerBucket:
+    """
+    Get the month and the employee of the order or salary.
+
+    Args:
+        instance (Order | Salary): Order (counted in the month of its end date) or salary.
+
+    Returns:
+        LedgerBucket: First day of the month and the employee ID.
+    """
+    day = instance.end_date if isinstance(instance, Order) else instance.date
+    return get_month(day=day), instance.user_id
+
+
+def remember_previous_bucket(sender: Any, instance: Order | Salary, **kwargs) -> None:
+    """
+    Remember the month and the employee of the order or salary before saving, because both can be changed.
+    """
+    instance._previous_bucket = None
+    if instance.pk and not kwargs.get("raw"):
+        previous = sender.objects.filter(pk=instance.pk).first()
+        instance._previous_bucket = get_ledger_bucket(instance=previous) if previous else None
+
+
+def refresh_ledger_for_user_object(sender: Any, instance: Order | Salary, **kwargs) -> None:
+    """
+    Refresh the ledger of the month and the employee of the saved or deleted order or salary.
+    """
+    refresh_monthly_ledgers_on_commit(
+        buckets=[get_ledger_bucket(instance=instance), getattr(instance, "_previous_bucket", None)]
+    )
+
+
+def refresh_ledger_for_order_invoices(
+    sender: Any, instance: Order | Invoice, action: str, reverse: bool, pk_set: Optional[set], **kwargs
+) -> None:
+    """
+    Refresh balances of orders and the ledger when invoices are added to or removed from an order.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_order_ids = list(sender.objects.filter(invoice=instance).values_list("order_id", flat=True))
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if not reverse:
+        orders = [instance]
+    else:
+        order_ids = getattr(instance, "_cleared_order_ids", []) if action == "post_clear" else pk_set
+        orders = list(Order.objects.filter(pk__in=order_ids).only("end_date", "user_id"))
+    refresh_order_balances_and_ledger(orders=orders)
+
+
+def remember_invoice_orders(sender: Any, instance: Invoice, **kwargs) -> None:
+    """
+    Remember orders linked with the invoice, because links are removed together with it.
+    """
+    instance._orders = get_invoice_orders(invoice=instance)
+
+
+def refresh_ledger_for_invoice(sender: Any, instance: Invoice, **kwargs) -> None:
+    """
+    Refresh balances of orders linked with the saved or deleted invoice and their ledger.
+    Invoices not linked with any order are not taken into account in the ledger.
+    """
+    orders = getattr(instance, "_orders", None)
+    if orders is None:
+        orders = get_invoice_orders(invoice=instance)
+    refresh_order_balances_and_ledger(orders=orders)
+
+
+def refresh_order_balances_and_ledger(orders: List[Order]) -> None:
+    """
+    Store counted balances of the orders at once, so they are committed together with the invoice change, and
+    refresh the ledger of their months and employees after the commit.
+
+    Args:
+        orders (List[Order]): Orders whose invoices changed.
+    """
+    if not orders:
+        return
+    Order.objects.filter(pk__in=[order.pk for order in orders]).refresh_balances()
+    refresh_monthly_ledgers_on_commit(buckets=[get_ledger_bucket(instance=order) for order in orders])
+
+
+def get_invoice_orders(invoice: Invoice) -> List[Order]:
+    """
+    Get orders linked with the invoice or with the invoices correcting it.
+
+    Args:
+        invoice (Invoice): Income or cost invoice.
+
+    Returns:
+        List[Order]: The linked orders with their end dates and employees.
+    """
+    if not invoice.pk:
+        return []
+    orders = Order.objects.filter(
+        Q(income_invoice=invoice)
+        | Q(cost_invoice=invoice)
+        | Q(income_invoice__linked_invoice=invoice)
+        | Q(cost_invoice__linked_invoice=invoice)
+    ).distinct()
+    return list(orders.only("end_date", "user_id"))
@@ -1,6 +1,7 @@
 from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
+from dashboards.plots import get_plotlyjs_bundle
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
 
@@ -32,6 +33,13 @@ class ContractDetailViewTests(EDMSTestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, self.template_name)
 
+    def test_plotly_js_is_not_inlined_in_dashboard(self):
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(reverse_lazy("dashboard"))
+        self.assertContains(response, reverse_lazy("plotly-js"))
+        self.assertNotContains(response, get_plotlyjs_bundle()[:100])
+
     def test_access_for_hrs(self):
         login = self.client.login(email=self.hr.email, password=self.password)
         self.assertTrue(login)
@@ -44,3 +52,12 @@ class ContractDetailViewTests(EDMSTestCase):
         response = self.client.get(reverse_lazy("dashboard"))
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, self.template_name)
+
+
+class PlotlyJsViewTests(EDMSTestCase):
+    def test_plotly_js_is_served_as_cached_script(self):
+        response = self.client.get(reverse_lazy("plotly-js"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response["Content-Type"], "application/javascript")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(response.content.decode(), get_plotlyjs_bundle())
@@ -0,0 +1,121 @@
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+from common_tests.EDMSTestCase import EDMSTestCase
+from companies.factories import CompanyFactory
+from django.urls import reverse_lazy
+from employees.factories.factories_salary import SalaryFactory
+from invoices.factories import InvoiceFactory
+from orders.factories import OrderFactory
+from rest_framework.test import APIClient
+
+
+class BalanceTimeSeriesApiTestCase(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = APIClient()
+        self.url = reverse_lazy("dashboard-balance-api")
+        self.my_company = CompanyFactory.create(is_mine=True)
+        order_date = date(2024, 2, 15)
+        self.order = OrderFactory.create(
+            user=self.manager, create_date=order_date, start_date=order_date, end_date=order_date
+        )
+        self.order.income_invoice.add(
+            InvoiceFactory.create(seller=self.my_company, buyer=self.order.company, net_price=Decimal(10000))
+        )
+        self.order.cost_invoice.add(
+            InvoiceFactory.create(seller=self.order.company, buyer=self.my_company, net_price=Decimal(3000))
+        )
+        SalaryFactory.create(user=self.manager, date=date(2024, 4, 10), fee=Decimal(2000))
+        SalaryFactory.create(user=self.hr, date=date(2024, 5, 10), fee=Decimal(5000))
+        self.query = {"date_from": "2024-01-01", "date_to": "2024-12-31"}
+
+    def test_unauthenticated_user_cannot_view_data(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_accountant_and_hr_cannot_view_data(self):
+        for user in [self.accountant, self.hr]:
+            self.client.force_authenticate(user=user)
+            response = self.client.get(self.url, self.query)
+            self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_manager_can_view_own_data_per_quarter(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(self.url, {**self.query, "granularity": "quarter"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        results = response.json()["results"]
+        self.assertEqual(
+            [result["period"] for result in results], ["2024-01-01", "2024-04-01", "2024-07-01", "2024-10-01"]
+        )
+        self.assertEqual(results[0]["balance"], "7000.00")
+        self.assertEqual(results[1]["balance"], "-2000.00")
+
+    def test_manager_cannot_view_company_data(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(self.url, {**self.query, "scope": "company"})
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_ceo_can_view_company_data_per_year(self):
+        self.client.force_authenticate(user=self.ceo)
+        response = self.client.get(self.url, {**self.query, "scope": "company", "granularity": "year"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["income_net"], "10000.00")
+        self.assertEqual(results[0]["salaries"], "7000.00")
+        self.assertEqual(results[0]["balance"], "0.00")
+
+    def test_ceo_can_view_manager_data_per_week(self):
+        self.client.force_authenticate(user=self.ceo)
+        query = {"date_from": "2024-02-01", "date_to": "2024-02-29", "granularity": "week"}
+        response = self.client.get(self.url, {**query, "scope": "user", "user": self.manager.pk})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        results = response.json()["results"]
+        self.assertEqual(results[0]["period"], "2024-01-29")
+        self.assertEqual([result["balance"] for result in results if result["period"] == "2024-02-12"], ["7000.00"])
+
+    def test_user_scope_requires_user(self):
+        self.client.force_authenticate(user=self.ceo)
+        response = self.client.get(self.url, {**self.query, "scope": "user"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_date_from_after_date_to_is_invalid(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(self.url, {"date_from": "2024-12-31", "date_to": "2024-01-01"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_number_of_queries_not_depend_on_range(self):
+        self.client.force_authenticate(user=self.ceo)
+        with self.assertNumQueries(4):
+            self.client.get(self.url, {**self.query, "scope": "company", "granularity": "week"})
+        with self.assertNumQueries(4):
+            self.client.get(
+                self.url,
+                {"date_from": "2006-01-01", "date_to": "2024-12-31", "scope": "company", "granularity": "week"},
+            )
+
+    def test_range_with_too_many_periods_is_invalid(self):
+        self.client.force_authenticate(user=self.manager)
+        for granularity, date_from in [("week", "2000-01-01"), ("month", "1950-01-01"), ("year", "1900-01-01")]:
+            response = self.client.get(
+                self.url, {"date_from": date_from, "date_to": "2024-12-31", "granularity": granularity}
+            )
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+            self.assertIn("date_from", response.data)
+
+    def test_range_at_the_end_of_the_calendar(self):
+        self.client.force_authenticate(user=self.manager)
+        for granularity in ["week", "month", "quarter", "year"]:
+            response = self.client.get(
+                self.url, {"date_from": "9999-01-01", "date_to": "9999-12-31", "granularity": granularity}
+            )
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertEqual(response.data["results"][-1]["period"][:4], "9999")
+
+    def test_default_range_at_the_beginning_of_the_calendar(self):
+        self.client.force_authenticate(user=self.manager)
+        response = self.client.get(self.url, {"date_to": "0001-03-01"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.data["date_from"], date.min)
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from common_tests.EDMSTestCase import EDMSTestCase
+from dashboards.benchmark import find_regressions, get_benchmark_urls, get_percentile
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from orders.models import Order
+
+
+class BenchmarkHelpersTest(TestCase):
+    def test_get_percentile_uses_nearest_rank(self):
+        values = [5.0, 1.0, 4.0, 2.0, 3.0]
+        self.assertEqual(get_percentile(values=values, percent=50), 3.0)
+        self.assertEqual(get_percentile(values=values, percent=95), 5.0)
+        self.assertEqual(get_percentile(values=[7.0], percent=95), 7.0)
+
+    def test_get_benchmark_urls_resolves_pk_models(self):
+        urls = {url.name: url for url in get_benchmark_urls()}
+        self.assertIsNone(urls["dashboard"].model)
+        self.assertEqual(urls["detail-order"].model, Order)
+        self.assertNotIn("logout", urls)
+        self.assertNotIn("admin:index", urls)
+
+    def test_find_regressions(self):
+        baseline = {"ceos": {"dashboard": {"status": 200, "queries": 4, "p95_ms": 10.0}}}
+        results = {
+            "ceos": {
+                "dashboard": {"status": 200, "queries": 5, "p95_ms": 13.0},
+                "list-order": {"status": 200, "queries": 7, "p95_ms": 100.0},
+            }
+        }
+        regressions = find_regressions(results=results, baseline=baseline, latency_threshold=0.2)
+        self.assertEqual(regressions, ["ceos dashboard: queries 4 -> 5", "ceos dashboard: p95 10.0 ms -> 13.0 ms"])
+        self.assertEqual(find_regressions(results=results, baseline=baseline, latency_threshold=0.5)[1:], [])
+
+
+class BenchmarkViewsCommandTest(EDMSTestCase):
+    def setUp(self):
+        super().setUp()
+        handle, self.baseline_path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, self.baseline_path)
+
+    def test_save_and_compare_baseline(self):
+        out = StringIO()
+        call_command(
+            "benchmark_views",
+            "--repeat=1",
+            "--groups",
+            "ceos",
+            "--url-names",
+            "dashboard",
+            "detail-employee",
+            f"--save={self.baseline_path}",
+            stdout=out,
+        )
+        with open(self.baseline_path) as baseline_file:
+            results = json.load(baseline_file)["results"]
+        self.assertEqual(set(results["ceos"]), {"dashboard", "detail-employee"})
+        self.assertEqual(results["ceos"]["dashboard"]["status"], 200)
+        self.assertGreater(results["ceos"]["dashboard"]["queries"], 0)
+
+        results["ceos"]["dashboard"]["queries"] = 0
+        with open(self.baseline_path, "w") as baseline_file:
+            json.dump({"results": results}, baseline_file)
+        with self.assertRaises(CommandError):
+            call_command(
+                "benchmark_views",
+                "--repeat=1",
+                "--groups",
+                "ceos",
+                "--url-names",
+                "dashboard",
+                f"--compare={self.baseline_path}",
+                stdout=StringIO(),
+            )
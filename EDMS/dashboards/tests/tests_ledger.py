@@ -0,0 +1,137 @@
+from decimal import Decimal
+from io import StringIO
+
+from companies.factories import CompanyFactory
+from dashboards.ledger import get_month, rebuild_monthly_ledger, refresh_monthly_ledger
+from dashboards.models import MonthlyLedger
+from dashboards.plots import Plot
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from employees.factories.factories_salary import SalaryFactory
+from invoices.factories import InvoiceFactory
+from invoices.models import Invoice
+from orders.factories import OrderFactory
+from users.factories import UserFactory
+
+
+class MonthlyLedgerTest(TestCase):
+    def setUp(self) -> None:
+        self.plot = Plot()
+        self.user = UserFactory.create()
+        self.my_company = CompanyFactory.create(is_mine=True)
+        self.end_date = timezone.now().date() - timezone.timedelta(days=100)
+        self.month = get_month(day=self.end_date)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order = OrderFactory.create(
+                user=self.user, create_date=self.end_date, start_date=self.end_date, end_date=self.end_date
+            )
+            self.income_invoice = InvoiceFactory.create(
+                seller=self.my_company, buyer=self.order.company, net_price=Decimal(10000)
+            )
+            self.cost_invoice = InvoiceFactory.create(
+                seller=self.order.company, buyer=self.my_company, net_price=Decimal(3000)
+            )
+            self.order.income_invoice.add(self.income_invoice)
+            self.order.cost_invoice.add(self.cost_invoice)
+            self.salary = SalaryFactory.create(user=self.user, date=self.end_date, fee=Decimal(2000))
+
+    def test_ledger_is_maintained_after_changes(self):
+        for user in [self.user, None]:
+            ledger = MonthlyLedger.objects.get(month=self.month, user=user)
+            self.assertEqual(ledger.income_net, Decimal(10000))
+            self.assertEqual(ledger.cost_net, Decimal(3000))
+            self.assertEqual(ledger.salaries, Decimal(2000))
+            self.assertEqual(ledger.balance, Decimal(5000))
+
+    def test_invoice_change_updates_ledger(self):
+        self.cost_invoice.net_price = Decimal(4000)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cost_invoice.save()
+        ledger = MonthlyLedger.objects.get(month=self.month, user=self.user)
+        self.assertEqual(ledger.cost_net, Decimal(4000))
+        self.assertEqual(ledger.balance, Decimal(4000))
+
+    def test_correcting_invoice_replaces_corrected_invoice_in_ledger(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            correcting_invoice = InvoiceFactory.create(
+                seller=self.my_company,
+                buyer=self.order.company,
+                type=Invoice.CORRECTING,
+                linked_invoice=self.income_invoice,
+                net_price=Decimal(8000),
+            )
+            self.order.income_invoice.add(correcting_invoice)
+        ledger = MonthlyLedger.objects.get(month=self.month, user=self.user)
+        self.assertEqual(ledger.income_net, Decimal(8000))
+        self.assertEqual(ledger.balance, Decimal(3000))
+
+    def test_invoice_delete_updates_ledger(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.income_invoice.delete()
+        ledger = MonthlyLedger.objects.get(month=self.month, user__isnull=True)
+        self.assertEqual(ledger.income_net, Decimal(0))
+        self.assertEqual(ledger.balance, Decimal(-5000))
+
+    def test_invoice_change_updates_order_balance(self):
+        self.cost_invoice.net_price = Decimal(4000)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cost_invoice.save()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.cost_net, Decimal(4000))
+        self.assertEqual(self.order.balance, Decimal(6000))
+
+    def test_invoice_delete_updates_order_balance(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.income_invoice.delete()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.income_net, Decimal(0))
+        self.assertEqual(self.order.balance, Decimal(-3000))
+
+    def test_clearing_invoice_orders_updates_order_balance(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cost_invoice.order_from_cost_invoice.clear()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.cost_net, Decimal(0))
+        self.assertEqual(self.order.balance, Decimal(10000))
+        ledger = MonthlyLedger.objects.get(month=self.month, user=self.user)
+        self.assertEqual(ledger.cost_net, Decimal(0))
+
+    def test_order_end_date_change_moves_order_to_another_month(self):
+        new_end_date = self.end_date - timezone.timedelta(days=62)
+        self.order.create_date = new_end_date
+        self.order.start_date = new_end_date
+        self.order.end_date = new_end_date
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.save()
+        old_ledger = MonthlyLedger.objects.get(month=self.month, user=self.user)
+        new_ledger = MonthlyLedger.objects.get(month=get_month(day=new_end_date), user=self.user)
+        self.assertEqual(old_ledger.balance, Decimal(-2000))
+        self.assertEqual(new_ledger.balance, Decimal(7000))
+
+    def test_ledger_row_is_removed_when_month_is_empty(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.delete()
+            self.salary.delete()
+        self.assertFalse(MonthlyLedger.objects.filter(month=self.month).exists())
+
+    def test_refresh_monthly_ledger_returns_none_for_empty_month(self):
+        result = refresh_monthly_ledger(month=get_month(day=timezone.now().date()), user_id=self.user.pk)
+        self.assertIsNone(result)
+
+    def test_rebuild_monthly_ledger_is_equal_to_maintained_ledger(self):
+        expected_value = set(MonthlyLedger.objects.values_list("month", "user", "income_net", "cost_net", "balance"))
+        rebuild_monthly_ledger()
+        result = set(MonthlyLedger.objects.values_list("month", "user", "income_net", "cost_net", "balance"))
+        self.assertEqual(result, expected_value)
+
+    def test_set_plot_data_from_ledger(self):
+        expected_value = {(self.month.month, self.month.year): Decimal(5000)}
+        with self.assertNumQueries(1):
+            result = self.plot.set_plot_data_from_ledger(ledgers=MonthlyLedger.objects.filter(user=self.user))
+        self.assertEqual({key: value for key, value in result.items() if value}, expected_value)
+
+    def test_rebuild_monthly_ledger_command(self):
+        MonthlyLedger.objects.all().delete()
+        call_command("rebuild_monthly_ledger", stdout=StringIO())
+        self.assertEqual(MonthlyLedger.objects.filter(month=self.month).count(), 2)
@@ -0,0 +1,115 @@
+from common_tests.EDMSTestCase import EDMSTestCase
+from companies.factories import CompanyFactory
+from dashboards.plot_cache import (
+    COMPANY_SCOPE,
+    get_cached_plot_data,
+    get_plot_data_cache_key,
+    get_user_scope,
+)
+from dashboards.plots import render_plot_for_user_group
+from django.core.cache import cache, caches
+from employees.factories.factories_salary import SalaryFactory
+from invoices.factories import InvoiceFactory
+from orders.factories import OrderFactory
+from users.factories import UserFactory
+
+from EDMS.group_utils import create_group_with_permissions
+
+
+class PlotCacheTest(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = UserFactory.create()
+        self.my_company = CompanyFactory.create(is_mine=True)
+        self.order = OrderFactory.create(user=self.user)
+        self.invoice = InvoiceFactory.create(seller=self.my_company, buyer=self.order.company)
+        self.user_cache_key = get_plot_data_cache_key(scope=get_user_scope(user_id=self.user.pk))
+        self.company_cache_key = get_plot_data_cache_key(scope=COMPANY_SCOPE)
+
+    def fill_cache(self) -> None:
+        cache.set(self.user_cache_key, {})
+        cache.set(self.company_cache_key, {})
+
+    def assert_cache_invalidated(self) -> None:
+        self.assertIsNone(cache.get(self.user_cache_key))
+        self.assertIsNone(cache.get(self.company_cache_key))
+
+    def test_get_cached_plot_data_counts_data_once(self):
+        calls = []
+
+        def count_plot_data():
+            calls.append(1)
+            return {(1, 2024): 1}
+
+        get_cached_plot_data(scope=COMPANY_SCOPE, count_plot_data=count_plot_data)
+        result = get_cached_plot_data(scope=COMPANY_SCOPE, count_plot_data=count_plot_data)
+        self.assertEqual(result, {(1, 2024): 1})
+        self.assertEqual(len(calls), 1)
+
+    def test_order_save_invalidates_cache(self):
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.save()
+        self.assert_cache_invalidated()
+
+    def test_invalidation_is_shared_between_cache_connections(self):
+        other_worker_cache = caches.create_connection("default")
+        other_worker_cache.set(self.user_cache_key, {})
+        other_worker_cache.set(self.company_cache_key, {})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.save()
+        self.assertIsNone(other_worker_cache.get(self.user_cache_key))
+        self.assertIsNone(other_worker_cache.get(self.company_cache_key))
+
+    def test_order_user_change_invalidates_previous_user_cache(self):
+        self.fill_cache()
+        self.order.user = UserFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.save()
+        self.assert_cache_invalidated()
+
+    def test_adding_invoice_to_order_invalidates_cache(self):
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.income_invoice.add(self.invoice)
+        self.assert_cache_invalidated()
+
+    def test_adding_order_to_invoice_invalidates_cache(self):
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.invoice.order_from_cost_invoice.add(self.order)
+        self.assert_cache_invalidated()
+
+    def test_linked_invoice_change_invalidates_cache(self):
+        self.order.income_invoice.add(self.invoice)
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.invoice.save()
+        self.assert_cache_invalidated()
+
+    def test_linked_invoice_delete_invalidates_cache(self):
+        self.order.cost_invoice.add(self.invoice)
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.invoice.delete()
+        self.assert_cache_invalidated()
+
+    def test_not_linked_invoice_change_not_invalidates_cache(self):
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.invoice.save()
+        self.assertEqual(cache.get(self.company_cache_key), {})
+
+    def test_salary_delete_invalidates_cache(self):
+        salary = SalaryFactory.create(user=self.user)
+        self.fill_cache()
+        with self.captureOnCommitCallbacks(execute=True):
+            salary.delete()
+        self.assert_cache_invalidated()
+
+    def test_render_plot_for_user_group_uses_cached_data(self):
+        managers_group = create_group_with_permissions(group_name="managers", permission_codenames=[])
+        self.user.groups.add(managers_group)
+        render_plot_for_user_group(self.user)
+        with self.assertNumQueries(1):
+            render_plot_for_user_group(self.user)
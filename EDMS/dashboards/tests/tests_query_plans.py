@@ -0,0 +1,45 @@
+from io import StringIO
+
+from dashboards.query_plans import QueryPlan, explain_lookup, get_indexed_lookups
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+
+class QueryPlansTest(TestCase):
+    def test_indexes_of_lookups_exist(self):
+        index_names = set()
+        for table_name in (
+            "invoices_invoice",
+            "orders_order",
+            "employees_agreement",
+            "employees_salary",
+            "employees_vacation",
+        ):
+            index_names |= set(connection.introspection.get_constraints(connection.cursor(), table_name))
+        for lookup in get_indexed_lookups():
+            self.assertTrue(set(lookup.index_names) <= index_names, msg=lookup.name)
+
+    def test_explain_without_indexes_restores_indexes(self):
+        lookup = get_indexed_lookups()[0]
+        plan = explain_lookup(lookup=lookup, with_indexes=False)
+        self.assertIsNotNone(plan.execution_ms)
+        self.assertNotIn("invoice_unpaid_payment_idx", plan.index_names)
+        constraints = connection.introspection.get_constraints(connection.cursor(), "invoices_invoice")
+        self.assertIn("invoice_unpaid_payment_idx", constraints)
+
+    def test_query_plan_finds_used_indexes(self):
+        plan = QueryPlan(
+            plan="Bitmap Heap Scan on invoices_invoice  (cost=4.17..11.28 rows=3 width=200)\n"
+            "  ->  Bitmap Index Scan on invoice_unpaid_payment_idx  (cost=0.00..4.17 rows=3 width=0)\n"
+            "Execution Time: 0.039 ms"
+        )
+        self.assertEqual(plan.execution_ms, 0.039)
+        self.assertEqual(plan.index_names, ["invoice_unpaid_payment_idx"])
+        self.assertEqual(plan.top_node, "Bitmap Heap Scan on invoices_invoice")
+
+    def test_command_prints_plans_of_every_lookup(self):
+        out = StringIO()
+        call_command("benchmark_query_plans", stdout=out)
+        for lookup in get_indexed_lookups():
+            self.assertIn(lookup.name, out.getvalue())
@@ -0,0 +1,68 @@
+from io import StringIO
+
+from companies.models import Company
+from contracts.models import Contract
+from dashboards.models import MonthlyLedger
+from dashboards.scaled_example_data import ScaledExampleData
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import F
+from django.test import TestCase
+from django.utils import timezone
+from employees.models.models_agreement import Agreement
+from employees.models.models_salaries import Salary
+from employees.models.models_vacation import Vacation
+from employees.models.models_vacation_ledger import VacationLedger
+from invoices.models import Invoice
+from orders.models import Order
+
+User = get_user_model()
+
+
+class ScaledExampleDataTest(TestCase):
+    def test_generate_creates_consistent_data(self):
+        counts = ScaledExampleData(companies=3, years=2, employees=10, seed=1).generate()
+        self.assertEqual(User.objects.count(), 10)
+        self.assertEqual(Company.objects.filter(is_mine=False).count(), 3)
+        self.assertEqual(Company.objects.filter(is_mine=True).count(), 1)
+        self.assertEqual(Contract.objects.count(), 3)
+        self.assertEqual(Agreement.objects.count(), 10)
+        self.assertEqual(counts["orders"], Order.objects.count())
+        self.assertEqual(counts["invoices"], Invoice.objects.count())
+        self.assertTrue(Salary.objects.exists())
+        self.assertTrue(Vacation.objects.exists())
+        self.assertFalse(Vacation.objects.filter(substitute_users__isnull=True).exists())
+        for order in Order.objects.select_related("company"):
+            self.assertTrue(order.name.startswith(f"{order.company.shortcut}-1/"))
+        self.assertFalse(Order.objects.filter(contract__employee__isnull=True).exists())
+        self.assertFalse(Invoice.objects.filter(order_from_income_invoice__isnull=True, buyer__is_mine=False).exists())
+        for user in User.objects.filter(groups__name="managers"):
+            self.assertEqual(user.agreements.count(), 1)
+
+    def test_generate_grants_vacation_in_past_years(self):
+        ScaledExampleData(companies=1, years=3, employees=10, seed=4).generate()
+        employment_agreements = Agreement.objects.filter(type=Agreement.EMPLOYMENT)
+        past_ledgers = VacationLedger.objects.filter(
+            user__agreements__in=employment_agreements, year__lt=timezone.now().year
+        )
+        self.assertTrue(past_ledgers.exists())
+        self.assertFalse(past_ledgers.filter(granted=0).exists())
+        self.assertFalse(VacationLedger.objects.filter(carried_over__lt=0).exists())
+        for ledger in VacationLedger.objects.filter(year__gt=F("user__agreements__start_date__year")):
+            previous_ledger = VacationLedger.objects.get(user=ledger.user, year=ledger.year - 1)
+            self.assertEqual(ledger.carried_over, max(previous_ledger.balance, 0))
+
+    def test_generate_builds_monthly_ledger(self):
+        ScaledExampleData(companies=2, years=1, employees=5, seed=2).generate()
+        company_ledgers = MonthlyLedger.objects.filter(user__isnull=True)
+        orders_balance = sum(order.balance for order in Order.objects.all())
+        salaries = sum(Salary.objects.values_list("fee", flat=True))
+        self.assertEqual(sum(company_ledgers.values_list("balance", flat=True)), orders_balance - salaries)
+
+    def test_generate_example_data_command_with_scale_option(self):
+        out = StringIO()
+        call_command(
+            "generate_example_data", "--scale", "--companies=2", "--years=1", "--employees=4", "--seed=3", stdout=out
+        )
+        self.assertIn("Successfully generated scaled data", out.getvalue())
+        self.assertEqual(User.objects.count(), 4)
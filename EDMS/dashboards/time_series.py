@@ -0,0 +1,138 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List
+
+from dateutil.relativedelta import relativedelta
+from django.db.models import DateField, QuerySet, Sum
+from django.db.models.functions import Trunc
+from employees.models.models_salaries import Salary
+from orders.models import Order
+
+WEEK = "week"
+MONTH = "month"
+QUARTER = "quarter"
+YEAR = "year"
+GRANULARITY_STEPS = {
+    WEEK: relativedelta(weeks=1),
+    MONTH: relativedelta(months=1),
+    QUARTER: relativedelta(months=3),
+    YEAR: relativedelta(years=1),
+}
+MAX_PERIODS = {
+    WEEK: 1040,
+    MONTH: 600,
+    QUARTER: 400,
+    YEAR: 100,
+}
+
+
+def truncate_date(day: date, granularity: str) -> date:
+    """
+    Get the first day of the period (week starts on Monday) containing the given day.
+
+    Args:
+        day (date): Any day of the period.
+        granularity (str): One of week, month, quarter, year.
+
+    Returns:
+        date: First day of the period.
+    """
+    if granularity == WEEK:
+        return day - relativedelta(days=day.weekday())
+    if granularity == MONTH:
+        return day.replace(day=1)
+    if granularity == QUARTER:
+        return day.replace(day=1, month=(day.month - 1) // 3 * 3 + 1)
+    return day.replace(day=1, month=1)
+
+
+def count_periods(granularity: str, date_from: date, date_to: date) -> int:
+    """
+    Count periods of the range without building them, so any range of valid dates can be checked.
+
+    Args:
+        granularity (str): One of week, month, quarter, year.
+        date_from (date): First day of the range.
+        date_to (date): Last day of the range.
+
+    Returns:
+        int: Number of periods, including the partial first and last period.
+    """
+    if granularity == WEEK:
+        first_week = truncate_date(day=date_from, granularity=WEEK)
+        return (truncate_date(day=date_to, granularity=WEEK) - first_week).days // 7 + 1
+    if granularity == MONTH:
+        return (date_to.year - date_from.year) * 12 + date_to.month - date_from.month + 1
+    if granularity == QUARTER:
+        return (date_to.year - date_from.year) * 4 + (date_to.month - 1) // 3 - (date_from.month - 1) // 3 + 1
+    return date_to.year - date_from.year + 1
+
+
+def get_balance_time_series(
+    orders: QuerySet[Order], salaries: QuerySet[Salary], granularity: str, date_from: date, date_to: date
+) -> List[Dict[str, date | Decimal]]:
+    """
+    Count income, cost, salaries and balance per period in the database.
+    Orders are counted in the period of their end date, salaries in the period of their date.
+    Only rows between date_from and date_to are read, so a narrow range is cheap regardless of the history length.
+    The number of periods is limited by MAX_PERIODS, which the caller has to check with count_periods.
+
+    Args:
+        orders (QuerySet[Order]): Orders taken into account.
+        salaries (QuerySet[Salary]): Salaries taken into account.
+        granularity (str): One of week, month, quarter, year.
+        date_from (date): First day of the range.
+        date_to (date): Last day of the range.
+
+    Returns:
+        List[Dict[str, date | Decimal]]: Every period of the range with its first day and sums, ordered by period.
+    """
+    orders = orders.filter(end_date__range=(date_from, date_to))
+    salaries = salaries.filter(date__range=(date_from, date_to))
+    totals = defaultdict(lambda: {"income_net": Decimal(0), "cost_net": Decimal(0), "salaries": Decimal(0)})
+    for field in ["income_net", "cost_net"]:
+        for period, total in sum_per_period(
+            queryset=orders, date_lookup="end_date", value_field=field, granularity=granularity
+        ).items():
+            totals[period][field] = total
+    for period, total in sum_per_period(
+        queryset=salaries, date_lookup="date", value_field="fee", granularity=granularity
+    ).items():
+        totals[period]["salaries"] = Decimal(total)
+
+    time_series = []
+    first_period = truncate_date(day=date_from, granularity=granularity)
+    for index in range(count_periods(granularity=granularity, date_from=date_from, date_to=date_to)):
+        period = first_period + GRANULARITY_STEPS[granularity] * index
+        values = totals[period]
+        time_series.append(
+            {
+                "period": period,
+                **values,
+                "balance": values["income_net"] - values["cost_net"] - values["salaries"],
+            }
+        )
+    return time_series
+
+
+def sum_per_period(queryset: QuerySet, date_lookup: str, value_field: str, granularity: str) -> Dict[date, Decimal]:
+    """
+    Sum the value field per period in the database.
+
+    Args:
+        queryset (QuerySet): Rows to sum.
+        date_lookup (str): Lookup to the date deciding about the period.
+        value_field (str): Field to sum.
+        granularity (str): One of week, month, quarter, year.
+
+    Returns:
+        Dict[date, Decimal]: First day of the period as keys and sums as values.
+    """
+    rows = (
+        queryset.annotate(period=Trunc(date_lookup, granularity, output_field=DateField()))
+        .values("period")
+        .annotate(total=Sum(value_field))
+        .order_by()
+    )
+    return {row["period"]: row["total"] for row in rows}
@@ -1,8 +1,12 @@
 # ruff: noqa: F401
+from dashboards.api.views_api_balance import BalanceTimeSeriesAPIView
 from django.urls import path
+from plotly.offline import get_plotlyjs_version
 
-from .views import DashboardView
+from .views import DashboardView, PlotlyJsView
 
 urlpatterns = [
     path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("api/dashboard/balance/", BalanceTimeSeriesAPIView.as_view(), name="dashboard-balance-api"),
+    path(f"dashboard/plotly-{get_plotlyjs_version()}.min.js", PlotlyJsView.as_view(), name="plotly-js"),
 ]
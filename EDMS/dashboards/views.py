@@ -1,9 +1,11 @@
 # ruff: noqa: F401
-from dashboards.plots import render_plot_for_user_group
+from dashboards.plots import get_plotlyjs_bundle, render_plot_for_user_group
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponseForbidden
-from django.views.generic import TemplateView
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.generic import TemplateView, View
 
 User = get_user_model()
 
@@ -35,3 +37,16 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         context["plot"] = render_plot_for_user_group(user=self.request.user)
         return context
+
+
+@method_decorator(cache_control(public=True, max_age=60 * 60 * 24 * 365, immutable=True), name="dispatch")
+class PlotlyJsView(View):
+    """
+    Serve the plotly.js bundle as a separate, browser cached script.
+
+    The url contains the plotly.js version, so the response can be cached forever
+    and a new url is used after upgrading plotly.
+    """
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        return HttpResponse(get_plotlyjs_bundle(), content_type="application/javascript")
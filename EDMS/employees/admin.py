@@ -4,6 +4,7 @@ from .models.models_addendum import Addendum, Agreement
 from .models.models_salaries import Salary
 from .models.models_termination import Termination
 from .models.models_vacation import Vacation
+from .models.models_vacation_ledger import VacationLedger
 
 
 class CustomAgreementAdmin(admin.ModelAdmin):
@@ -37,6 +38,10 @@ class CustomVacationAdmin(admin.ModelAdmin):
     )
 
 
+class CustomVacationLedgerAdmin(admin.ModelAdmin):
+    list_display = ("user", "year", "granted", "used", "carried_over")
+
+
 class CustomAddendumAdmin(admin.ModelAdmin):
     list_display = ("name", "agreement", "create_date", "end_date", "salary_gross")
 
@@ -50,3 +55,4 @@ admin.site.register(Agreement, CustomAgreementAdmin)
 admin.site.register(Termination, CustomTerminationAdmin)
 admin.site.register(Addendum, CustomAddendumAdmin)
 admin.site.register(Salary, CustomSalaryAdmin)
+admin.site.register(VacationLedger, CustomVacationLedgerAdmin)
@@ -8,4 +8,4 @@ from EDMS.custom_django_model_permissions import CustomDjangoModelPermissions
 class VacationModelViewSet(ModelViewSet):
     permission_classes = (CustomDjangoModelPermissions,)
     serializer_class = VacationSerializer
-    queryset = Vacation.objects.all()
+    queryset = Vacation.objects.prefetch_related("substitute_users")
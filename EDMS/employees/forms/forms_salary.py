@@ -1,6 +1,9 @@
 from django import forms
+from django.urls import reverse_lazy
 from employees.models.models_salaries import Salary
 
+from EDMS.autocomplete import AutocompleteSelect
+
 
 class SalaryForm(forms.ModelForm):
     class Meta:
@@ -8,7 +11,7 @@ class SalaryForm(forms.ModelForm):
         fields = ["date", "user", "fee"]
         widgets = {
             "date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
-            "user": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
+            "user": AutocompleteSelect(attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-user")),
             "fee": forms.NumberInput(attrs={"class": "form-control"}),
         }
         labels = {"user": "Employee"}
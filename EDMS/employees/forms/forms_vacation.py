@@ -3,10 +3,13 @@ from typing import Dict, List, Union
 
 from django import forms
 from django.core.files.uploadedfile import UploadedFile
+from django.urls import reverse_lazy
 from employees.models.models_vacation import Vacation
 from employees.validators.validators_vacation import VacationValidator
 from users.models import User
 
+from EDMS.autocomplete import AutocompleteSelectMultiple
+
 
 class VacationForm(forms.ModelForm):
     leave_user_display = forms.CharField(
@@ -31,8 +34,8 @@ class VacationForm(forms.ModelForm):
             "start_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "end_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "leave_user": forms.HiddenInput(),
-            "substitute_users": forms.SelectMultiple(
-                attrs={"class": "form-control js-example-basic-multiple", "size": 3}
+            "substitute_users": AutocompleteSelectMultiple(
+                attrs={"class": "form-control", "size": 3}, url=reverse_lazy("autocomplete-user")
             ),
             "scan": forms.FileInput(),
             "included_days_off": forms.NumberInput(attrs={"class": "form-control"}),
@@ -48,6 +51,7 @@ class VacationForm(forms.ModelForm):
         initial_leave_user = kwargs.get("initial", {}).get("leave_user", None)
         if initial_leave_user is not None:
             self.fields["substitute_users"].queryset = User.objects.exclude(pk=kwargs["initial"]["leave_user"])
+            self.fields["substitute_users"].widget.exclude = [kwargs["initial"]["leave_user"]]
 
     def clean(self) -> Dict[str, Union[str | date | User | List[User] | UploadedFile | int]]:
         cleaned_data: Dict[str, Union[str | date | User | List[User] | UploadedFile | int]] = super().clean()
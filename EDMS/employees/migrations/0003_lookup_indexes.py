@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:28
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("employees", "0002_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="agreement",
+            index=models.Index(fields=["start_date"], name="agreement_start_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="agreement",
+            index=models.Index(fields=["end_date"], name="agreement_end_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="agreement",
+            index=models.Index(fields=["end_date_actual"], name="agreement_end_date_actual_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="salary",
+            index=models.Index(fields=["date"], name="salary_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="salary",
+            index=models.Index(fields=["user", "date"], name="salary_user_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="vacation",
+            index=models.Index(fields=["start_date"], name="vacation_start_date_idx"),
+        ),
+    ]
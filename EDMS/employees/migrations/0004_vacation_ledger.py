@@ -0,0 +1,96 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+FILL_VACATION_LEDGERS_SQL = [
+    """
+    INSERT INTO employees_vacationledger (user_id, year, granted, used, carried_over)
+    SELECT leave_user_id, EXTRACT(YEAR FROM start_date), 0, SUM(end_date - start_date - included_days_off + 1), 0
+    FROM employees_vacation
+    WHERE type = 'annual'
+    GROUP BY leave_user_id, EXTRACT(YEAR FROM start_date)
+    """,
+    """
+    INSERT INTO employees_vacationledger (user_id, year, granted, used, carried_over)
+    SELECT DISTINCT ON (agreement.user_id)
+        agreement.user_id,
+        EXTRACT(YEAR FROM CURRENT_DATE),
+        CEIL(
+            (
+                CASE
+                    WHEN EXTRACT(YEAR FROM agreement.end_date_actual) > EXTRACT(YEAR FROM CURRENT_DATE) THEN 12
+                    ELSE EXTRACT(MONTH FROM agreement.end_date_actual)
+                END
+                - CASE
+                    WHEN EXTRACT(YEAR FROM agreement.start_date) < EXTRACT(YEAR FROM CURRENT_DATE) THEN 1
+                    ELSE EXTRACT(MONTH FROM agreement.start_date)
+                END
+                + 1
+            ) * employee.vacation_days_per_year / 12.0
+        ),
+        0,
+        0
+    FROM employees_agreement agreement
+    JOIN users_user employee ON employee.id = agreement.user_id
+    WHERE agreement.type = 'employment contract' AND agreement.is_current
+    ORDER BY agreement.user_id, agreement.create_date DESC
+    ON CONFLICT (user_id, year) DO UPDATE SET granted = EXCLUDED.granted
+    """,
+    """
+    UPDATE users_user
+    SET vacation_left = COALESCE(
+        (
+            SELECT ledger.granted + ledger.carried_over - ledger.used
+            FROM employees_vacationledger ledger
+            WHERE ledger.user_id = users_user.id AND ledger.year = EXTRACT(YEAR FROM CURRENT_DATE)
+        ),
+        0
+    )
+    """,
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("employees", "0003_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VacationLedger",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("year", models.PositiveSmallIntegerField(help_text="Year of the vacation days.")),
+                (
+                    "granted",
+                    models.SmallIntegerField(default=0, help_text="Vacation days granted by the employment agreement."),
+                ),
+                (
+                    "used",
+                    models.SmallIntegerField(default=0, help_text="Days of annual vacations starting in the year."),
+                ),
+                (
+                    "carried_over",
+                    models.SmallIntegerField(default=0, help_text="Vacation days left from the previous year."),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="Employee owning the vacation days.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vacation_ledgers",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="vacationledger",
+            constraint=models.UniqueConstraint(fields=("user", "year"), name="vacation_ledger_user_year_unique"),
+        ),
+        migrations.RunSQL(sql=FILL_VACATION_LEDGERS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
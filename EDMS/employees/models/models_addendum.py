@@ -1,6 +1,6 @@
 from django.db import models
-from django.utils import timezone
 from employees.models.models_agreement import Agreement
+from employees.recompute import mark_dirty
 
 
 class Addendum(models.Model):
@@ -24,42 +24,19 @@ class Addendum(models.Model):
     def __str__(self):
         return f"Addendum #{self.name}"
 
-    def update_agreement_end_date(self):
-        """
-        Updates the end date of the related agreement to the end date of the latest addendum if it exists.
-        """
-        last_addendum = Addendum.objects.filter(agreement=self.agreement).order_by("create_date").last()
-        if last_addendum:
-            self.agreement.end_date_actual = last_addendum.end_date
-
-    def update_agreement_is_current(self):
-        """
-        Updates the 'is_current' status of the related agreement based on the current date.
-        """
-        if self.agreement.end_date_actual < timezone.now().date():
-            self.agreement.is_current = False
-        else:
-            self.agreement.is_current = True
-
     def save(self, *args, **kwargs):
         """
-        Saves the addendum and updates the related agreement's end date and current status.
+        Saves the addendum and recounts the related agreement's end date and current status when the transaction is
+        committed.
         """
         super().save(*args, **kwargs)
-        self.update_agreement_end_date()
-        self.update_agreement_is_current()
-        self.agreement.save()
+        mark_dirty(agreement_ids=[self.agreement_id])
 
     def delete(self, *args, **kwargs):
         """
-        Deletes the addendum and updates the related agreement's end date and current status.
+        Deletes the addendum and recounts the related agreement's end date and current status when the transaction
+        is committed.
         """
-        agreement = self.agreement
+        agreement_id = self.agreement_id
         super().delete(*args, **kwargs)
-        last_addendum = Addendum.objects.filter(agreement=agreement).order_by("create_date").last()
-        if last_addendum:
-            agreement.end_date_actual = last_addendum.end_date
-        else:
-            agreement.end_date_actual = agreement.end_date
-        self.update_agreement_is_current()
-        agreement.save()
+        mark_dirty(agreement_ids=[agreement_id])
@@ -1,9 +1,11 @@
 from math import ceil
+from typing import Iterable
 
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils import timezone
-from employees.models.models_vacation import Vacation
+from employees.models.models_vacation_ledger import VacationLedger
+from employees.recompute import mark_dirty
 
 User = get_user_model()
 
@@ -45,39 +47,43 @@ class Agreement(models.Model):
         default=True, help_text="This attribute tells if the agreement is current or not (maybe the agreement expired)."
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_date"], name="agreement_start_date_idx"),
+            models.Index(fields=["end_date"], name="agreement_end_date_idx"),
+            models.Index(fields=["end_date_actual"], name="agreement_end_date_actual_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.name}"
 
     def save(self, *args, **kwargs):
         """
         Update agreement end date and current status before saving.
-        Count current user vacation left.
         Save the agreement to the database.
+        Recount the agreement and the user vacation left when the transaction is committed.
         """
         self.set_end_date_actual()
         self.set_is_current()
-        self.count_vacation_left()
         super().save(*args, **kwargs)
+        mark_dirty(agreement_ids=[self.pk], user_ids=[self.user_id])
 
     def delete(self, *args, **kwargs):
         """
-        Set user vacation left as 0.
         Delete agreement.
+        Recount the user vacation left when the transaction is committed.
         """
-        self.user.vacation_left = 0
-        self.user.save()
+        user_id = self.user_id
         super().delete(*args, **kwargs)
+        mark_dirty(user_ids=[user_id])
 
     def set_end_date_actual(self) -> None:
         """
-        Set the actual end date of the agreement.
-        If there are no addenda or termination, use the agreement end date.
+        Set the actual end date of a new agreement as the agreement end date.
+        Addenda and termination of existing agreements are taken into account when the agreement is recounted.
         """
         if not self.pk:
             self.end_date_actual = self.end_date
-        else:
-            if not (self.addenda.exists() or hasattr(self, "termination")):
-                self.end_date_actual = self.end_date
 
     def set_is_current(self) -> None:
         """
@@ -89,9 +95,37 @@ class Agreement(models.Model):
         else:
             self.is_current = True
 
-    def count_vacation_left(self) -> None:
-        self.user.vacation_left = self.count_granted_vacation_from_agreement() - Vacation.count_used_vacation()
-        self.user.save()
+    @classmethod
+    def count_vacation_left_for_users(cls, user_ids: Iterable[int]) -> int:
+        """
+        Count vacation left of many users at once from their current employment agreements, with a fixed number of
+        queries. Users without a current employment agreement are granted no vacation.
+
+        Args:
+            user_ids (Iterable[int]): Users whose agreements changed.
+
+        Returns:
+            int: Number of updated users.
+        """
+        users = list(User.objects.filter(pk__in=set(user_ids)))
+        if not users:
+            return 0
+        current_employment_agreements = {
+            agreement.user_id: agreement
+            for agreement in cls.objects.filter(user__in=users, type=cls.EMPLOYMENT, is_current=True)
+            .order_by("user_id", "-create_date")
+            .distinct("user_id")
+        }
+        granted_by_user = {}
+        for user in users:
+            agreement = current_employment_agreements.get(user.pk)
+            granted_by_user[user] = 0
+            if agreement:
+                agreement.user = user
+                granted_by_user[user] = agreement.count_granted_vacation_from_agreement()
+        VacationLedger.set_granted_for_users(granted_by_user=granted_by_user)
+        User.objects.bulk_update(users, ["vacation_left"])
+        return len(users)
 
     def count_granted_vacation_from_agreement(self) -> int:
         """
@@ -18,3 +18,7 @@ class Salary(models.Model):
 
     class Meta:
         verbose_name_plural = "Salaries"
+        indexes = [
+            models.Index(fields=["date"], name="salary_date_idx"),
+            models.Index(fields=["user", "date"], name="salary_user_date_idx"),
+        ]
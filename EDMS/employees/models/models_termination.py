@@ -1,7 +1,6 @@
 from django.db import models
-from django.utils import timezone
-from employees.models.models_addendum import Addendum
 from employees.models.models_agreement import Agreement
+from employees.recompute import mark_dirty
 
 
 class Termination(models.Model):
@@ -18,53 +17,27 @@ class Termination(models.Model):
     def __str__(self) -> str:
         return f"Termination #{self.name}"
 
-    def update_agreement_end_date_actual(self):
-        """
-        Updates the agreement's actual end date based on the termination.
-        """
-        if self.agreement.termination:
-            self.agreement.end_date_actual = self.agreement.termination.end_date
-
-    def update_agreement_is_current(self):
-        """
-        Updates the agreement's current status based on the current date.
-        """
-        if self.agreement.end_date_actual < timezone.now().date():
-            self.agreement.is_current = False
-        else:
-            self.agreement.is_current = True
-
     def save(self, *args, **kwargs):
         """
-        Saves the termination,
-        updates related agreement details
-        and saves agreement.
+        Saves the termination
+        and recounts related agreement details when the transaction is committed.
 
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
         super().save(*args, **kwargs)
-        self.update_agreement_end_date_actual()
-        self.update_agreement_is_current()
-        self.agreement.save()
+        mark_dirty(agreement_ids=[self.agreement_id])
 
     def delete(self, *args, **kwargs):
         """
-        Deletes the termination,
-        updates the agreement's end date and status
-        and saves the agreement.
+        Deletes the termination
+        and recounts the agreement's end date and status when the transaction is committed.
 
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
-        agreement = self.agreement
+        agreement_id = self.agreement_id
         super().delete(*args, **kwargs)
-        last_addendum = Addendum.objects.filter(agreement=agreement).order_by("create_date").last()
-        if last_addendum:
-            agreement.end_date_actual = last_addendum.end_date
-        else:
-            agreement.end_date_actual = agreement.end_date
-        self.update_agreement_is_current()
-        agreement.save()
+        mark_dirty(agreement_ids=[agreement_id])
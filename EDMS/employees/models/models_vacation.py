@@ -1,5 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from employees.models.models_vacation_ledger import VacationLedger
+from employees.recompute import mark_dirty
 
 User = get_user_model()
 
@@ -40,53 +42,56 @@ class Vacation(models.Model):
         "included_days_off as 2 to count properly."
     )
 
+    class Meta:
+        indexes = [models.Index(fields=["start_date"], name="vacation_start_date_idx")]
+
     def save(self, *args, **kwargs) -> None:
         """
-        Saves the vacation record and updates the remaining vacation days for the employee.
+        Saves the vacation record, moves its days in the vacation ledger and recounts the remaining vacation days for
+        the employee when the transaction is committed.
 
         Args:
             *args: Additional arguments.
             **kwargs: Additional keyword arguments.
         """
+        previous_vacation = Vacation.objects.filter(pk=self.pk).first() if self.pk else None
         super().save(*args, **kwargs)
-        self.count_vacation_left()
+        if previous_vacation:
+            previous_vacation.add_used_days(sign=-1)
+        self.add_used_days(sign=1)
+        mark_dirty(user_ids=[self.leave_user_id, previous_vacation.leave_user_id if previous_vacation else None])
 
     def delete(self, *args, **kwargs) -> None:
         """
-        Deletes the vacation record and updates the remaining vacation days for the employee.
+        Deletes the vacation record, removes its days from the vacation ledger and recounts the remaining vacation
+        days for the employee when the transaction is committed.
 
         Args:
             *args: Additional arguments.
             **kwargs: Additional keyword arguments.
         """
         super().delete(*args, **kwargs)
-        self.count_vacation_left()
+        self.add_used_days(sign=-1)
+        mark_dirty(user_ids=[self.leave_user_id])
 
-    def count_vacation_left(self) -> None:
-        """
-        Calculates and updates the remaining vacation days for the employee.
+    def count_used_days(self) -> int:
         """
-        from employees.models.models_agreement import Agreement
+        Counts vacation days used by the vacation. Only annual vacations use vacation days.
 
-        agreement = self.leave_user.agreements.filter(type=Agreement.EMPLOYMENT).order_by("-create_date").first()
-        if agreement:
-            self.leave_user.vacation_left = (
-                agreement.count_granted_vacation_from_agreement() - self.count_used_vacation()
-            )
-        else:
-            self.leave_user.vacation_left = 0
-        self.leave_user.save()
+        Returns:
+            int: The number of used vacation days.
+        """
+        if self.type != Vacation.ANNUAL:
+            return 0
+        return (self.end_date - self.start_date).days - self.included_days_off + 1
 
-    @staticmethod
-    def count_used_vacation() -> int:
+    def add_used_days(self, sign: int) -> None:
         """
-        Counts the total number of vacation days used by all employees for annual vacations.
+        Adds (sign=1) or subtracts (sign=-1) days of the vacation in the ledger of the year of the vacation start.
 
-        Returns:
-            int: The total number of used vacation days.
+        Args:
+            sign (int): 1 to add the days, -1 to subtract them.
         """
-        used_vacation_days: int = 0
-        vacations = list(Vacation.objects.filter(type=Vacation.ANNUAL))
-        for vacation in vacations:
-            used_vacation_days += (vacation.end_date - vacation.start_date).days - vacation.included_days_off + 1
-        return used_vacation_days
+        used_days = self.count_used_days()
+        if used_days:
+            VacationLedger.add_used_days(user_id=self.leave_user_id, year=self.start_date.year, days=sign * used_days)
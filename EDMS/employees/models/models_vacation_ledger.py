@@ -0,0 +1,81 @@
+from typing import Dict
+
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.utils import timezone
+
+User = get_user_model()
+
+
+class VacationLedger(models.Model):
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="vacation_ledgers", help_text="Employee owning the vacation days."
+    )
+    year = models.PositiveSmallIntegerField(help_text="Year of the vacation days.")
+    granted = models.SmallIntegerField(default=0, help_text="Vacation days granted by the employment agreement.")
+    used = models.SmallIntegerField(default=0, help_text="Days of annual vacations starting in the year.")
+    carried_over = models.SmallIntegerField(default=0, help_text="Vacation days left from the previous year.")
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["user", "year"], name="vacation_ledger_user_year_unique")]
+
+    def __str__(self) -> str:
+        return f"Vacation ledger {self.year} of {self.user}"
+
+    @property
+    def balance(self) -> int:
+        """
+        Vacation days left in the year.
+
+        Returns:
+            int: Granted and carried over days minus used days.
+        """
+        return self.granted + self.carried_over - self.used
+
+    @property
+    def carry_over(self) -> int:
+        """
+        Vacation days carried over to the next year. Only a positive balance is carried over, days used over the
+        balance are not taken from the next year.
+
+        Returns:
+            int: The balance or 0 if it is negative.
+        """
+        return max(self.balance, 0)
+
+    @classmethod
+    def set_granted_for_users(cls, granted_by_user: Dict[User, int]) -> None:
+        """
+        Set vacation days granted to many users in the current year with one upsert and count vacation left of the
+        users. The users are not saved.
+
+        Args:
+            granted_by_user (Dict[User, int]): Vacation days granted to each user by the employment agreement.
+        """
+        year = timezone.now().year
+        cls.objects.bulk_create(
+            [cls(user=user, year=year, granted=granted) for user, granted in granted_by_user.items()],
+            update_conflicts=True,
+            unique_fields=["user", "year"],
+            update_fields=["granted"],
+        )
+        balances = {
+            ledger.user_id: ledger.balance for ledger in cls.objects.filter(user__in=granted_by_user, year=year)
+        }
+        for user in granted_by_user:
+            user.vacation_left = balances[user.pk]
+
+    @classmethod
+    def add_used_days(cls, user_id: int, year: int, days: int) -> None:
+        """
+        Add days of annual vacation to the ledger of the year, or subtract them if days are negative.
+
+        Args:
+            user_id (int): ID of the employee on vacation.
+            year (int): Year of the start of the vacation.
+            days (int): Number of vacation days.
+        """
+        with transaction.atomic():
+            ledger, _ = cls.objects.select_for_update().get_or_create(user_id=user_id, year=year)
+            ledger.used += days
+            ledger.save(update_fields=["used"])
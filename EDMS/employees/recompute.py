@@ -0,0 +1,133 @@
+from typing import Iterable, Optional, Set
+
+from django.db import transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+
+
+class DirtyObjects:
+    def __init__(self) -> None:
+        """
+        Agreements and users marked in one atomic block, waiting for recomputation after the commit. The sets belong
+        to the on_commit callback of the block, so they are discarded together with it if the block is rolled back.
+        """
+        self.agreement_ids: Set[int] = set()
+        self.user_ids: Set[int] = set()
+        self.is_recomputed = False
+
+    def recompute(self) -> None:
+        """
+        Recompute the marked objects. It is the on_commit callback of the block.
+        """
+        self.is_recomputed = True
+        recompute_dirty(agreement_ids=self.agreement_ids, user_ids=self.user_ids)
+
+
+def get_pending_dirty_objects(connection: BaseDatabaseWrapper) -> DirtyObjects:
+    """
+    Get the objects waiting for the commit of the current atomic block, or register a new callback for the block.
+    Callbacks of rolled back blocks and savepoints are removed by Django, so their objects are never found again.
+
+    Args:
+        connection (BaseDatabaseWrapper): Connection in an atomic block.
+
+    Returns:
+        DirtyObjects: Objects of the current atomic block.
+    """
+    savepoint_ids = set(connection.savepoint_ids)
+    for callback_savepoint_ids, callback, *_ in connection.run_on_commit:
+        dirty_objects = getattr(callback, "__self__", None)
+        if (
+            callback_savepoint_ids == savepoint_ids
+            and isinstance(dirty_objects, DirtyObjects)
+            and not dirty_objects.is_recomputed
+        ):
+            return dirty_objects
+    dirty_objects = DirtyObjects()
+    transaction.on_commit(dirty_objects.recompute)
+    return dirty_objects
+
+
+def mark_dirty(agreement_ids: Iterable[Optional[int]] = (), user_ids: Iterable[Optional[int]] = ()) -> None:
+    """
+    Mark agreements and users whose derived fields have to be recomputed when the current transaction is committed,
+    or at once outside of a transaction. Objects marked many times in an atomic block are recomputed once, by a single
+    callback registered for the block. If the block is rolled back, its marks are discarded.
+
+    Derived fields are end_date_actual and is_current of agreements and vacation_left of users.
+
+    Args:
+        agreement_ids (Iterable[Optional[int]]): Agreements with changed addenda, termination or dates.
+        user_ids (Iterable[Optional[int]]): Users with changed agreements or vacations.
+    """
+    connection = transaction.get_connection()
+    dirty_objects = get_pending_dirty_objects(connection=connection) if connection.in_atomic_block else DirtyObjects()
+    dirty_objects.agreement_ids.update(agreement_id for agreement_id in agreement_ids if agreement_id)
+    dirty_objects.user_ids.update(user_id for user_id in user_ids if user_id)
+    if not connection.in_atomic_block:
+        dirty_objects.recompute()
+
+
+def recompute_dirty(agreement_ids: Set[int], user_ids: Set[int]) -> None:
+    """
+    Recompute the agreements, then users of the agreements together with the users.
+
+    Args:
+        agreement_ids (Set[int]): Agreements to recompute.
+        user_ids (Set[int]): Users to recompute.
+    """
+    recompute_users(user_ids=user_ids | recompute_agreements(agreement_ids=agreement_ids))
+
+
+def recompute_agreements(agreement_ids: Set[int]) -> Set[int]:
+    """
+    Count again the actual end date and the current status of the agreements with one query and write the changed
+    ones with one bulk update. The actual end date is the end date of the termination, or of the last addendum, or
+    the end date of the agreement.
+
+    Args:
+        agreement_ids (Set[int]): Agreements to recompute.
+
+    Returns:
+        Set[int]: IDs of users of the agreements.
+    """
+    from employees.models.models_addendum import Addendum
+    from employees.models.models_agreement import Agreement
+
+    if not agreement_ids:
+        return set()
+    today = timezone.now().date()
+    agreements = list(
+        Agreement.objects.filter(pk__in=agreement_ids)
+        .annotate(
+            termination_end_date=F("termination__end_date"),
+            last_addendum_end_date=Subquery(
+                Addendum.objects.filter(agreement=OuterRef("pk")).order_by("-create_date", "-pk").values("end_date")[:1]
+            ),
+        )
+        .only("start_date", "end_date", "end_date_actual", "is_current", "user_id")
+    )
+    changed_agreements = []
+    for agreement in agreements:
+        end_date_actual = agreement.termination_end_date or agreement.last_addendum_end_date or agreement.end_date
+        is_current = agreement.start_date <= today <= end_date_actual
+        if (agreement.end_date_actual, agreement.is_current) != (end_date_actual, is_current):
+            agreement.end_date_actual = end_date_actual
+            agreement.is_current = is_current
+            changed_agreements.append(agreement)
+    Agreement.objects.bulk_update(changed_agreements, ["end_date_actual", "is_current"])
+    return {agreement.user_id for agreement in agreements if agreement.user_id}
+
+
+def recompute_users(user_ids: Set[int]) -> None:
+    """
+    Count again vacation left of the users from their current employment agreements and vacation ledgers.
+
+    Args:
+        user_ids (Set[int]): Users to recompute.
+    """
+    from employees.models.models_agreement import Agreement
+
+    if user_ids:
+        Agreement.count_vacation_left_for_users(user_ids=user_ids)
@@ -0,0 +1,4 @@
+from employees.tasks import (  # noqa: F401 register tasks in celery autodiscovery
+    tasks_agreement,
+    tasks_vacation,
+)
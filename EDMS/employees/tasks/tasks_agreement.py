@@ -1,44 +1,75 @@
+from typing import Dict, List, Optional
+
 from celery import shared_task
 from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
 from django.template.loader import render_to_string
 from django.utils import timezone
 from employees.models.models_agreement import Agreement
 
 
 @shared_task
-def set_agreement_is_current() -> None:
+def set_agreement_is_current() -> Dict[str, int]:
     """
     Sets the 'is_current' status of agreements based on their start and end dates.
 
-    This function updates the status of agreements that are starting today
-    or ended yesterday by calling helper functions.
+    Agreements starting today or ended yesterday are updated with set-based UPDATEs in one transaction, then vacation
+    left is counted once per user whose agreement changed.
+
+    Returns:
+        Dict[str, int]: Numbers of started and ended agreements and of updated users.
+    """
+    with transaction.atomic():
+        started_agreements_user_ids = set_agreement_is_current_for_starting_agreement()
+        ended_agreements_user_ids = set_agreement_is_current_for_ending_agreement()
+        updated_users = Agreement.count_vacation_left_for_users(
+            user_ids=started_agreements_user_ids + ended_agreements_user_ids
+        )
+    return {
+        "started_agreements": len(started_agreements_user_ids),
+        "ended_agreements": len(ended_agreements_user_ids),
+        "updated_users": updated_users,
+    }
+
+
+def set_agreement_is_current_for_ending_agreement() -> List[Optional[int]]:
     """
-    set_agreement_is_current_for_starting_agreement()
-    set_agreement_is_current_for_ending_agreement()
+    Sets 'is_current' to False for agreements that ended yesterday.
 
+    Returns:
+        List[Optional[int]]: IDs of users of the updated agreements.
+    """
+    agreements = Agreement.objects.filter(end_date_actual=timezone.now().date() - timezone.timedelta(days=1))
+    return update_is_current(agreements=agreements, is_current=False)
 
-def set_agreement_is_current_for_ending_agreement() -> None:
+
+def set_agreement_is_current_for_starting_agreement() -> List[Optional[int]]:
     """
-    Sets 'is_current' to False for agreements that ended yesterday.
+    Sets 'is_current' to True for agreements that start today and have not ended yet.
 
-    This function finds all agreements that ended yesterday
-    and marks them as no longer current.
+    Returns:
+        List[Optional[int]]: IDs of users of the updated agreements.
     """
-    for agreement in Agreement.objects.filter(end_date_actual=timezone.now().date() - timezone.timedelta(days=1)):
-        agreement.is_current = False
-        agreement.save()
+    today = timezone.now().date()
+    agreements = Agreement.objects.filter(start_date=today, end_date_actual__gte=today)
+    return update_is_current(agreements=agreements, is_current=True)
 
 
-def set_agreement_is_current_for_starting_agreement() -> None:
+def update_is_current(agreements: QuerySet[Agreement], is_current: bool) -> List[Optional[int]]:
     """
-    Sets 'is_current' to True for agreements that start today.
+    Sets 'is_current' of the agreements with one UPDATE, skipping agreements which already have the status.
+
+    Args:
+        agreements (QuerySet[Agreement]): Agreements to update.
+        is_current (bool): The new status.
 
-    This function finds all agreements that start today
-    and marks them as current.
+    Returns:
+        List[Optional[int]]: IDs of users of the updated agreements.
     """
-    for agreement in Agreement.objects.filter(start_date=timezone.now().date()):
-        agreement.is_current = True
-        agreement.save()
+    changed_agreements = dict(agreements.exclude(is_current=is_current).values_list("pk", "user_id"))
+    Agreement.objects.filter(pk__in=changed_agreements).update(is_current=is_current)
+    return list(changed_agreements.values())
 
 
 @shared_task
@@ -1,87 +1,144 @@
-from datetime import date
-from math import ceil
+from typing import Dict
 
 from celery import shared_task
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import (
+    Case,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Ceil, Coalesce, ExtractMonth, Greatest
 from django.template.loader import render_to_string
 from django.utils import timezone
 from employees.models.models_agreement import Agreement
 from employees.models.models_vacation import Vacation
+from employees.models.models_vacation_ledger import VacationLedger
 
 User = get_user_model()
 
+VACATION_GRANT_CHUNK_SIZE = 1000
 
-@shared_task
-def set_user_vacation_left() -> None:
-    """
-    Updates the remaining vacation days for each active user.
 
-    The function finds the current employment agreement for each user
-    and adds the new vacation days to the user's balance.
+@shared_task
+def set_user_vacation_left(chunk_size: int = VACATION_GRANT_CHUNK_SIZE) -> Dict[str, int]:
     """
-    for user in User.objects.filter(is_superuser=False, is_active=True):
-        try:
-            current_employment_agreement = user.agreements.get(type=Agreement.EMPLOYMENT, is_current=True)
-        except Agreement.DoesNotExist:
-            continue
-        add_new_vacation_days(user=user, current_employment_agreement=current_employment_agreement)
+    Opens the vacation ledgers of the current year for active users with a current employment agreement.
 
-
-def add_new_vacation_days(user: User, current_employment_agreement: Agreement) -> None:
-    """
-    Adds new vacation days to the user's remaining vacation days.
+    Users are joined to their latest current employment agreement in one query, which also counts the vacation granted
+    this year and the days left from the previous year. Ledgers are upserted and users updated in chunks, each in its
+    own transaction, so running the task again in the same year, e.g. after a crash, gives the same result.
 
     Args:
-        user (User): The user whose vacation days are being updated.
-        current_employment_agreement (Agreement): The user's current employment agreement.
+        chunk_size (int): Number of users written at once.
+
+    Returns:
+        Dict[str, int]: Number of users granted vacation.
     """
-    user.vacation_left += count_granted_vacation_from_agreement(
-        current_employment_agreement=current_employment_agreement, user=user
+    year = timezone.now().year
+    agreements = annotate_vacation_grant(
+        agreements=Agreement.objects.filter(
+            type=Agreement.EMPLOYMENT, is_current=True, user__is_superuser=False, user__is_active=True
+        ),
+        year=year,
     )
-    user.save()
-
-
-def count_granted_vacation_from_agreement(current_employment_agreement: Agreement, user: User) -> int:
+    granted_users = 0
+    last_user_id = 0
+    while True:
+        grants = list(
+            agreements.filter(user_id__gt=last_user_id)
+            .order_by("user_id", "-create_date")
+            .distinct("user_id")
+            .values_list("user_id", "granted_vacation", "carried_over_vacation", "used_vacation")[:chunk_size]
+        )
+        if not grants:
+            break
+        with transaction.atomic():
+            VacationLedger.objects.bulk_create(
+                [
+                    VacationLedger(user_id=user_id, year=year, granted=granted, carried_over=carried_over)
+                    for user_id, granted, carried_over, _ in grants
+                ],
+                update_conflicts=True,
+                unique_fields=["user", "year"],
+                update_fields=["granted", "carried_over"],
+            )
+            User.objects.bulk_update(
+                [
+                    User(pk=user_id, vacation_left=granted + carried_over - used)
+                    for user_id, granted, carried_over, used in grants
+                ],
+                ["vacation_left"],
+            )
+        granted_users += len(grants)
+        last_user_id = grants[-1][0]
+    return {"granted_users": granted_users}
+
+
+def annotate_vacation_grant(agreements: QuerySet[Agreement], year: int) -> QuerySet[Agreement]:
     """
-    Calculates the number of vacation days granted based on the employment agreement.
+    Annotates agreements with the vacation granted to their users in the year, the balance of the user's vacation
+    ledger of the previous year and the days already used in the year. Only a positive balance is carried over, see
+    VacationLedger.carry_over.
 
     Args:
-        current_employment_agreement (Agreement): The user's current employment agreement.
-        user (User): The user for whom the vacation days are being calculated.
+        agreements (QuerySet[Agreement]): Employment agreements.
+        year (int): Year of the grant.
 
     Returns:
-        int: The number of vacation days granted this year.
+        QuerySet[Agreement]: Agreements with granted_vacation, carried_over_vacation and used_vacation.
     """
     months_in_year = 12
-    work_months_current_year = count_work_months_current_year(
-        start_date=current_employment_agreement.start_date,
-        end_date_actual=current_employment_agreement.end_date_actual,
+    ledgers = VacationLedger.objects.filter(user=OuterRef("user_id"))
+    return agreements.annotate(
+        work_months=count_work_months_in_year(year=year),
+        granted_vacation=Cast(
+            Ceil(Cast(F("work_months") * F("user__vacation_days_per_year"), FloatField()) / months_in_year),
+            IntegerField(),
+        ),
+        carried_over_vacation=Greatest(
+            Coalesce(
+                Subquery(
+                    ledgers.filter(year=year - 1).values(
+                        balance=ExpressionWrapper(
+                            F("granted") + F("carried_over") - F("used"), output_field=IntegerField()
+                        )
+                    )
+                ),
+                0,
+            ),
+            0,
+        ),
+        used_vacation=Coalesce(Subquery(ledgers.filter(year=year).values("used")), 0),
     )
-    vacation_from_agreement = ceil(work_months_current_year * user.vacation_days_per_year / months_in_year)
-    return vacation_from_agreement
 
 
-def count_work_months_current_year(start_date: date, end_date_actual: date) -> int:
+def count_work_months_in_year(year: int) -> Case:
     """
-    Counts the number of months worked by the user in the current year.
+    Builds the expression counting the number of months of the agreement in the year.
 
     Args:
-        start_date (date): The start date of the employment agreement.
-        end_date_actual (date): The actual end date of the employment agreement.
+        year (int): The counted year.
 
     Returns:
-        int: The number of months worked in the current year.
+        Case: Months from the start month, or January if the agreement started earlier, to the end month, or December
+            if the agreement ends later.
     """
-    start_month = start_date.month
-    end_month = end_date_actual.month
-    if start_date.year < timezone.now().year:
-        january = 1
-        start_month = january
-    if end_date_actual.year > timezone.now().year:
-        december = 12
-        end_month = december
-    return end_month - start_month + 1
+    january = 1
+    december = 12
+    start_month = Case(When(start_date__year__lt=year, then=Value(january)), default=ExtractMonth("start_date"))
+    end_month = Case(
+        When(end_date_actual__year__gt=year, then=Value(december)), default=ExtractMonth("end_date_actual")
+    )
+    return ExpressionWrapper(end_month - start_month + 1, output_field=IntegerField())
 
 
 @shared_task
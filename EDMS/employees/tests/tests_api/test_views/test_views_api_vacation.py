@@ -215,3 +215,10 @@ class VacationApiTestCase(EDMSTestCase):
         self.client.post(reverse_lazy("vacation-list"), self.vacation_data)
         self.client.post(reverse_lazy("vacation-list"), self.vacation_data)
         self.assertRaises(serializers.ValidationError)
+
+    def test_number_of_queries_of_vacation_list_does_not_grow_with_vacations(self):
+        self.assertQueryBudget(
+            url=reverse_lazy("vacation-list"),
+            user=self.ceo,
+            create_rows=lambda count: VacationFactory.create_batch(count),
+        )
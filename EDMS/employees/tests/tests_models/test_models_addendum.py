@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from employees.factories.factories_addendum import AddendumFactory
 from employees.factories.factories_agreement import AgreementFactory
@@ -7,13 +9,15 @@ from employees.models.models_addendum import Addendum
 
 class ModelAddendumTests(TestCase):
     def setUp(self) -> None:
-        self.current_agreement = AgreementFactory.create(create_date=timezone.now().date() - timezone.timedelta(days=2))
-
-        self.not_current_agreement = AgreementFactory.create(
-            create_date=timezone.now().date() - timezone.timedelta(days=10),
-            start_date=timezone.now().date() - timezone.timedelta(days=10),
-            end_date=timezone.now().date() - timezone.timedelta(days=5),
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.current_agreement = AgreementFactory.create(
+                create_date=timezone.now().date() - timezone.timedelta(days=2)
+            )
+            self.not_current_agreement = AgreementFactory.create(
+                create_date=timezone.now().date() - timezone.timedelta(days=10),
+                start_date=timezone.now().date() - timezone.timedelta(days=10),
+                end_date=timezone.now().date() - timezone.timedelta(days=5),
+            )
 
         self.addendum_current = AddendumFactory.build(
             create_date=timezone.now().date() - timezone.timedelta(days=2),
@@ -35,32 +39,49 @@ class ModelAddendumTests(TestCase):
     def test_return_str(self):
         self.assertEqual(str(self.addendum_current), f"Addendum #{self.addendum_current.name}")
 
+    def commit(self, action, agreement) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            action()
+        agreement.refresh_from_db()
+
     def test_update_agreement_end_date_actual_when_addendum_save(self):
-        self.addendum_current.save()
+        self.commit(action=self.addendum_current.save, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.end_date_actual, self.addendum_current.end_date)
 
     def test_update_agreement_end_date_actual_when_addendum_delete(self):
-        self.addendum_current.save()
+        self.commit(action=self.addendum_current.save, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.end_date_actual, self.addendum_current.end_date)
-        self.addendum_current.delete()
+        self.commit(action=self.addendum_current.delete, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.end_date_actual, self.current_agreement.end_date)
 
     def test_set_agreement_is_current_as_true_when_addendum_delete(self):
-        self.addendum_current.save()
+        self.commit(action=self.addendum_current.save, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.is_current, True)
-        self.addendum_current.delete()
+        self.commit(action=self.addendum_current.delete, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.is_current, True)
 
     def test_set_agreement_is_current_as_false_when_addendum_delete(self):
-        self.addendum_not_current.save()
+        self.commit(action=self.addendum_not_current.save, agreement=self.not_current_agreement)
         self.assertEqual(self.not_current_agreement.is_current, True)
-        self.addendum_not_current.delete()
+        self.commit(action=self.addendum_not_current.delete, agreement=self.not_current_agreement)
         self.assertEqual(self.not_current_agreement.is_current, False)
 
     def test_set_agreement_end_date_actual_as_first_addendum_end_date_when_delete_second_addendum(self):
-        self.addendum_current.save()
+        self.commit(action=self.addendum_current.save, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.end_date_actual, self.addendum_current.end_date)
-        self.second_addendum.save()
+        self.commit(action=self.second_addendum.save, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.end_date_actual, self.second_addendum.end_date)
-        self.second_addendum.delete()
+        self.commit(action=self.second_addendum.delete, agreement=self.current_agreement)
         self.assertEqual(self.current_agreement.end_date_actual, self.addendum_current.end_date)
+
+    def test_recount_agreement_once_when_addenda_saved_in_transaction(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.addendum_current.save()
+            self.second_addendum.save()
+        with CaptureQueriesContext(connection) as queries:
+            for callback in callbacks:
+                callback()
+        agreement_updates = [query for query in queries if query["sql"].startswith('UPDATE "employees_agreement"')]
+        self.assertEqual(len(agreement_updates), 1)
+        self.current_agreement.refresh_from_db()
+        self.assertEqual(self.current_agreement.end_date_actual, self.second_addendum.end_date)
@@ -57,7 +57,9 @@ class ModelAgreementTests(TestCase):
         self.agreement.start_date = timezone.datetime(timezone.now().year, 1, 1).date()
         self.agreement.end_date = timezone.datetime(timezone.now().year, 12, 31).date()
         self.assertEqual(self.user.vacation_left, 0)
-        self.agreement.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agreement.save()
+        self.user.refresh_from_db()
         self.assertEqual(self.user.vacation_left, self.user.vacation_days_per_year)
 
     def test_count_user_vacation_left_when_create_agreement_different_than_employment_agreement(self):
@@ -65,7 +67,9 @@ class ModelAgreementTests(TestCase):
         self.agreement.end_date = timezone.datetime(timezone.now().year, 12, 31).date()
         self.assertEqual(self.user.vacation_left, 0)
         self.agreement.type = Agreement.COMMISSION
-        self.agreement.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agreement.save()
+        self.user.refresh_from_db()
         self.assertEqual(self.user.vacation_left, 0)
 
     def test_count_work_month(self):
@@ -8,31 +8,38 @@ from employees.models.models_termination import Termination
 
 class ModelTerminationTests(TestCase):
     def setUp(self) -> None:
-        self.agreement = AgreementFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agreement = AgreementFactory.create()
         self.termination = TerminationFactory.build(agreement=self.agreement)
 
     def test_return_string(self):
         self.assertEqual(str(self.termination), f"Termination #{self.termination.name}")
 
+    def commit(self, action) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            action()
+        self.agreement.refresh_from_db()
+
     def test_update_agreement_end_date_actual_to_termination_end_date_when_create_termination(self):
         self.assertEqual(self.agreement.end_date_actual, self.agreement.end_date)
-        self.termination.save()
+        self.commit(action=self.termination.save)
         self.assertEqual(self.agreement.end_date_actual, self.termination.end_date)
 
     def test_update_agreement_end_date_actual_to_addendum_end_date_when_addendum_exists_delete_termination(self):
         self.assertEqual(self.agreement.end_date_actual, self.agreement.end_date)
-        addendum = AddendumFactory.create(agreement=self.agreement)
+        addendum = AddendumFactory.build(agreement=self.agreement)
+        self.commit(action=addendum.save)
         self.assertEqual(self.agreement.end_date_actual, addendum.end_date)
-        self.termination.save()
+        self.commit(action=self.termination.save)
         self.assertEqual(self.agreement.end_date_actual, self.termination.end_date)
-        self.termination.delete()
+        self.commit(action=self.termination.delete)
         self.assertEqual(self.agreement.end_date_actual, addendum.end_date)
 
     def test_update_agreement_end_date_actual_to_agreement_end_date_if_addendum_not_exist_and_delete_termination(self):
         self.assertEqual(self.agreement.end_date_actual, self.agreement.end_date)
-        self.termination.save()
+        self.commit(action=self.termination.save)
         self.assertEqual(self.agreement.end_date_actual, self.termination.end_date)
-        self.termination.delete()
+        self.commit(action=self.termination.delete)
         self.assertEqual(self.agreement.end_date_actual, self.agreement.end_date)
 
     def test_set_agreement_is_current_as_true_when_agreement_end_date_actual_is_in_future(self):
@@ -52,11 +59,11 @@ class ModelTerminationTests(TestCase):
         self.agreement.start_date = year_back
         self.agreement.create_date = year_back
         self.agreement.end_date = tomorrow
-        self.agreement.save()
+        self.commit(action=self.agreement.save)
         self.termination.create_date = half_year_back
         self.termination.end_date = half_year_back
         self.assertTrue(self.agreement.is_current)
-        self.termination.save()
+        self.commit(action=self.termination.save)
         self.assertFalse(self.agreement.is_current)
 
     def test_save_termination(self):
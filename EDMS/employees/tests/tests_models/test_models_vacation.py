@@ -1,9 +1,12 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from employees.factories.factories_agreement import AgreementFactory
 from employees.factories.factories_vacation import VacationFactory
 from employees.models.models_agreement import Agreement
 from employees.models.models_vacation import Vacation
+from employees.models.models_vacation_ledger import VacationLedger
 from users.factories import UserFactory
 
 
@@ -31,26 +34,74 @@ class ModelVacationTests(TestCase):
         self.vacation.delete()
         self.assertEqual(count_vacations_before_delete - 1, Vacation.objects.count())
 
+    def commit(self, action) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            action()
+        self.leave_user.refresh_from_db()
+
     def test_count_leave_user_vacation_left_when_agreement_type_is_employment(self):
         self.assertEqual(self.leave_user.vacation_left, 0)
-        self.employment_agreement.save()
+        self.commit(action=self.employment_agreement.save)
         self.assertEqual(self.leave_user.vacation_left, self.leave_user.vacation_days_per_year)
 
     def test_count_leave_user_vacation_left_when_agreement_type_is_not_employment(self):
         self.assertEqual(self.leave_user.vacation_left, 0)
-        AgreementFactory.create(type=Agreement.COMMISSION, user=self.leave_user)
+        self.commit(action=lambda: AgreementFactory.create(type=Agreement.COMMISSION, user=self.leave_user))
         self.assertEqual(self.leave_user.vacation_left, 0)
 
     def test_count_leave_user_vacation_left_when_agreement_delete(self):
         self.assertEqual(self.leave_user.vacation_left, 0)
-        self.employment_agreement.save()
+        self.commit(action=self.employment_agreement.save)
         self.assertEqual(self.leave_user.vacation_left, 26)
-        self.employment_agreement.delete()
+        self.commit(action=self.employment_agreement.delete)
         self.assertEqual(self.leave_user.vacation_left, 0)
 
-    def test_count_used_vacation_when_vacation_type_is_annual(self):
+    def test_count_used_days_in_ledger_when_vacation_type_is_annual(self):
         self.vacation.save()
-        expected_used_vacation = (
-            (self.vacation.end_date - self.vacation.start_date).days - self.vacation.included_days_off + 1
+        ledger = VacationLedger.objects.get(user=self.leave_user, year=self.vacation.start_date.year)
+        self.assertEqual(ledger.used, self.vacation.count_used_days())
+        self.assertEqual(
+            self.vacation.count_used_days(),
+            (self.vacation.end_date - self.vacation.start_date).days - self.vacation.included_days_off + 1,
         )
-        self.assertEqual(self.vacation.count_used_vacation(), expected_used_vacation)
+
+    def test_move_used_days_in_ledger_when_vacation_changes(self):
+        self.vacation.save()
+        self.vacation.type = Vacation.SICK
+        self.vacation.save()
+        ledger = VacationLedger.objects.get(user=self.leave_user, year=self.vacation.start_date.year)
+        self.assertEqual(ledger.used, 0)
+        self.vacation.type = Vacation.ANNUAL
+        self.vacation.start_date -= timezone.timedelta(days=365)
+        self.vacation.end_date -= timezone.timedelta(days=365)
+        self.vacation.save()
+        previous_year_ledger = VacationLedger.objects.get(user=self.leave_user, year=self.vacation.start_date.year)
+        self.assertEqual(previous_year_ledger.used, self.vacation.count_used_days())
+
+    def test_remove_used_days_from_ledger_when_vacation_delete(self):
+        self.vacation.save()
+        self.vacation.delete()
+        ledger = VacationLedger.objects.get(user=self.leave_user, year=self.vacation.start_date.year)
+        self.assertEqual(ledger.used, 0)
+
+    def test_count_vacation_left_only_from_vacations_of_leave_user(self):
+        self.commit(action=self.employment_agreement.save)
+        self.commit(action=VacationFactory.create)
+        self.commit(action=self.vacation.save)
+        self.assertEqual(
+            self.leave_user.vacation_left, self.leave_user.vacation_days_per_year - self.vacation.count_used_days()
+        )
+
+    def test_number_of_queries_does_not_grow_with_vacations(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employment_agreement.save()
+            VacationFactory.create_batch(5)
+            self.vacation.save()
+        self.vacation.end_date += timezone.timedelta(days=1)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            self.vacation.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            VacationFactory.create_batch(5)
+        self.vacation.end_date += timezone.timedelta(days=1)
+        with self.assertNumQueries(len(queries)), self.captureOnCommitCallbacks(execute=True):
+            self.vacation.save()
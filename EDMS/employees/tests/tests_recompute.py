@@ -0,0 +1,79 @@
+from django.db import DatabaseError, connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from employees.factories.factories_addendum import AddendumFactory
+from employees.factories.factories_agreement import AgreementFactory
+from employees.factories.factories_termination import TerminationFactory
+from employees.factories.factories_vacation import VacationFactory
+from employees.models.models_agreement import Agreement
+from employees.recompute import mark_dirty, recompute_agreements
+from users.factories import UserFactory
+
+
+class RecomputeTests(TestCase):
+    def setUp(self) -> None:
+        self.user = UserFactory.create()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agreement = AgreementFactory.create(
+                user=self.user,
+                start_date=timezone.datetime(timezone.now().year, 1, 1).date(),
+                end_date=timezone.datetime(timezone.now().year, 12, 31).date(),
+            )
+
+    def test_end_date_actual_of_termination_precedes_addenda(self):
+        termination = TerminationFactory.create(agreement=self.agreement)
+        AddendumFactory.create(agreement=self.agreement, end_date=termination.end_date + timezone.timedelta(days=1))
+        recompute_agreements(agreement_ids={self.agreement.pk})
+        self.agreement.refresh_from_db()
+        self.assertEqual(self.agreement.end_date_actual, termination.end_date)
+
+    def test_recount_user_of_changed_agreement(self):
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.vacation_left, self.user.vacation_days_per_year)
+        with self.captureOnCommitCallbacks(execute=True):
+            TerminationFactory.create(agreement=self.agreement, end_date=timezone.now().date() - timezone.timedelta(1))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.vacation_left, 0)
+
+    def test_recount_once_objects_marked_many_times_in_transaction(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            AddendumFactory.create_batch(3, agreement=self.agreement)
+            VacationFactory.create_batch(3, leave_user=self.user)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(callbacks[0].__self__.agreement_ids, {self.agreement.pk})
+        self.assertEqual(callbacks[0].__self__.user_ids, {self.user.pk})
+        with CaptureQueriesContext(connection) as queries:
+            callbacks[0]()
+        user_updates = [query for query in queries if query["sql"].startswith('UPDATE "users_user"')]
+        self.assertEqual(len(user_updates), 1)
+
+    def test_discard_marks_of_rolled_back_block(self):
+        other_user = UserFactory.create()
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    mark_dirty(user_ids=[self.user.pk])
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+            mark_dirty(user_ids=[other_user.pk])
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(callbacks[0].__self__.user_ids, {other_user.pk})
+
+    def test_separate_marks_of_following_transactions(self):
+        with self.captureOnCommitCallbacks() as first_callbacks:
+            mark_dirty(user_ids=[self.user.pk])
+        with self.captureOnCommitCallbacks() as second_callbacks:
+            with transaction.atomic():
+                mark_dirty(agreement_ids=[self.agreement.pk])
+        self.assertEqual(first_callbacks[0].__self__.user_ids, {self.user.pk})
+        self.assertEqual(second_callbacks[0].__self__.agreement_ids, {self.agreement.pk})
+        self.assertFalse(second_callbacks[0].__self__.user_ids)
+
+    def test_skip_deleted_objects(self):
+        agreement_id = self.agreement.pk
+        Agreement.objects.filter(pk=agreement_id).delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_dirty(agreement_ids=[agreement_id, None], user_ids=[None])
+        self.assertFalse(Agreement.objects.filter(pk=agreement_id).exists())
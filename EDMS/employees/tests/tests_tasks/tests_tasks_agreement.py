@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.utils import timezone
 from employees.factories.factories_agreement import AgreementFactory
+from employees.models.models_agreement import Agreement
 from employees.tasks.tasks_agreement import set_agreement_is_current
 
 
@@ -26,3 +27,35 @@ class AgreementTasksTests(TestCase):
         set_agreement_is_current()
         self.agreement_ending_yesterday.refresh_from_db()
         self.assertFalse(self.agreement_ending_yesterday.is_current)
+
+    def test_report_updated_agreements_and_users(self):
+        Agreement.objects.filter(pk=self.agreement_starting_today.pk).update(is_current=False)
+        Agreement.objects.filter(pk=self.agreement_ending_yesterday.pk).update(is_current=True)
+        report = set_agreement_is_current()
+        self.assertEqual(report, {"started_agreements": 1, "ended_agreements": 1, "updated_users": 2})
+        self.assertEqual(
+            set_agreement_is_current(), {"started_agreements": 0, "ended_agreements": 0, "updated_users": 0}
+        )
+
+    def test_count_vacation_left_of_users_of_updated_agreements(self):
+        Agreement.objects.filter(pk=self.agreement_starting_today.pk).update(
+            is_current=False, type=Agreement.EMPLOYMENT
+        )
+        user = self.agreement_starting_today.user
+        user.vacation_left = 0
+        user.save()
+        set_agreement_is_current()
+        user.refresh_from_db()
+        self.agreement_starting_today.refresh_from_db()
+        self.assertEqual(user.vacation_left, self.agreement_starting_today.count_granted_vacation_from_agreement())
+        self.agreement_ending_yesterday.user.refresh_from_db()
+        self.assertEqual(self.agreement_ending_yesterday.user.vacation_left, 0)
+
+    def test_number_of_queries_does_not_grow_with_agreements(self):
+        today = timezone.now().date()
+        for _ in range(5):
+            AgreementFactory.create(start_date=today, end_date=today, end_date_actual=today)
+        Agreement.objects.update(is_current=False)
+        with self.assertNumQueries(10):
+            set_agreement_is_current()
+        self.assertEqual(Agreement.objects.filter(start_date=today, is_current=True).count(), 6)
@@ -1,10 +1,13 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from employees.factories.factories_agreement import AgreementFactory
 from employees.factories.factories_vacation import VacationFactory
+from employees.models.models_agreement import Agreement
+from employees.models.models_vacation_ledger import VacationLedger
 from employees.tasks.tasks_vacation import (
-    count_granted_vacation_from_agreement,
-    count_work_months_current_year,
+    annotate_vacation_grant,
     set_user_vacation_left,
 )
 from users.factories import UserFactory
@@ -18,7 +21,8 @@ class VacationTasksTest(TestCase):
         one_week_ahead = today + timezone.timedelta(days=7)
         two_week_ahead = today + timezone.timedelta(days=14)
 
-        self.user = UserFactory.create(vacation_days_per_year=20)
+        self.year = today.year
+        self.user = UserFactory.create(vacation_days_per_year=20, is_active=True)
         self.agreement = AgreementFactory.create(
             create_date=today, start_date=month_back, end_date=ahead_date, end_date_actual=ahead_date, user=self.user
         )
@@ -26,33 +30,99 @@ class VacationTasksTest(TestCase):
             start_date=one_week_ahead, end_date=two_week_ahead, leave_user=self.user, included_days_off=2
         )
 
+    def annotate_agreement(self, agreement: Agreement) -> Agreement:
+        return annotate_vacation_grant(agreements=Agreement.objects.filter(pk=agreement.pk), year=self.year).get()
+
     def test_set_user_vacation_left(self):
         initial_vacation_left = self.user.vacation_left
+        VacationLedger.objects.filter(user=self.user).update(year=self.year - 1)
         set_user_vacation_left()
         self.user.refresh_from_db()
         self.assertGreater(self.user.vacation_left, initial_vacation_left)
 
-    def test_count_granted_vacation(self):
-        granted_vacation = count_granted_vacation_from_agreement(
-            current_employment_agreement=self.agreement, user=self.user
+    def test_carry_over_vacation_left_from_previous_year(self):
+        VacationLedger.objects.filter(user=self.user).update(year=self.year - 1, granted=20)
+        previous_ledger = VacationLedger.objects.get(user=self.user, year=self.year - 1)
+        self.assertGreater(previous_ledger.balance, 0)
+        self.assertEqual(set_user_vacation_left(), {"granted_users": 1})
+        ledger = VacationLedger.objects.get(user=self.user, year=self.year)
+        self.assertEqual(ledger.carried_over, previous_ledger.balance)
+        self.assertEqual(ledger.granted, self.agreement.count_granted_vacation_from_agreement())
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.vacation_left, ledger.balance)
+
+    def test_do_not_carry_over_negative_balance_from_previous_year(self):
+        VacationLedger.objects.filter(user=self.user).update(year=self.year - 1, used=100)
+        previous_ledger = VacationLedger.objects.get(user=self.user, year=self.year - 1)
+        self.assertLess(previous_ledger.balance, 0)
+        self.assertEqual(self.annotate_agreement(agreement=self.agreement).carried_over_vacation, 0)
+        set_user_vacation_left()
+        ledger = VacationLedger.objects.get(user=self.user, year=self.year)
+        self.assertEqual(ledger.carried_over, previous_ledger.carry_over)
+        self.assertEqual(ledger.carried_over, 0)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.vacation_left, ledger.balance)
+
+    def test_subtract_vacation_already_used_in_year(self):
+        set_user_vacation_left()
+        self.user.refresh_from_db()
+        self.assertEqual(
+            self.user.vacation_left,
+            self.agreement.count_granted_vacation_from_agreement() - self.vacation.count_used_days(),
         )
-        self.assertGreater(granted_vacation, 0)
+
+    def test_set_user_vacation_left_again_in_same_year(self):
+        VacationLedger.objects.filter(user=self.user).update(year=self.year - 1)
+        set_user_vacation_left()
+        self.user.refresh_from_db()
+        vacation_left = self.user.vacation_left
+        set_user_vacation_left()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.vacation_left, vacation_left)
+        self.assertEqual(VacationLedger.objects.filter(user=self.user, year=self.year).count(), 1)
+
+    def test_skip_users_without_current_employment_agreement(self):
+        commission_user = UserFactory.create(is_active=True)
+        AgreementFactory.create(user=commission_user, type=Agreement.COMMISSION)
+        superuser = UserFactory.create(is_active=True, is_superuser=True)
+        AgreementFactory.create(user=superuser)
+        self.assertEqual(set_user_vacation_left(), {"granted_users": 1})
+
+    def test_write_users_in_chunks(self):
+        for _ in range(4):
+            AgreementFactory.create(user=UserFactory.create(is_active=True))
+        VacationLedger.objects.all().delete()
+        self.assertEqual(set_user_vacation_left(chunk_size=2), {"granted_users": 5})
+        self.assertEqual(VacationLedger.objects.filter(year=self.year).count(), 5)
+
+    def test_number_of_queries_does_not_grow_with_users(self):
+        with CaptureQueriesContext(connection) as queries:
+            set_user_vacation_left()
+        for _ in range(5):
+            AgreementFactory.create(user=UserFactory.create(is_active=True))
+        with self.assertNumQueries(len(queries)):
+            set_user_vacation_left()
+
+    def test_count_granted_vacation(self):
+        agreement = self.annotate_agreement(agreement=self.agreement)
+        self.assertGreater(agreement.granted_vacation, 0)
+        self.assertEqual(agreement.granted_vacation, self.agreement.count_granted_vacation_from_agreement())
 
     def test_count_work_months_partial_year(self):
-        start_date = timezone.datetime(2024, 5, 1).date()
-        end_date_actual = timezone.datetime(2024, 12, 31).date()
-        work_months = count_work_months_current_year(start_date=start_date, end_date_actual=end_date_actual)
-        self.assertEqual(work_months, 8)
+        agreement = AgreementFactory.create(
+            start_date=timezone.datetime(self.year, 5, 1).date(), end_date=timezone.datetime(self.year, 12, 31).date()
+        )
+        self.assertEqual(self.annotate_agreement(agreement=agreement).work_months, 8)
 
     def test_count_work_months_full_year(self):
-        start_date = timezone.datetime(2024, 1, 1).date()
-        end_date_actual = timezone.datetime(2024, 12, 31).date()
-        work_months = count_work_months_current_year(start_date=start_date, end_date_actual=end_date_actual)
-        self.assertEqual(work_months, 12)
+        agreement = AgreementFactory.create(
+            start_date=timezone.datetime(self.year, 1, 1).date(), end_date=timezone.datetime(self.year, 12, 31).date()
+        )
+        self.assertEqual(self.annotate_agreement(agreement=agreement).work_months, 12)
 
     def test_start_date_in_previous_year(self):
-        current_year = timezone.now().year
-        start_date = timezone.datetime(current_year - 1, 11, 1)
-        end_date_actual = timezone.datetime(current_year, 5, 31)
-        result = count_work_months_current_year(start_date, end_date_actual)
-        self.assertEqual(result, 5)
+        agreement = AgreementFactory.create(
+            start_date=timezone.datetime(self.year - 1, 11, 1).date(),
+            end_date=timezone.datetime(self.year, 5, 31).date(),
+        )
+        self.assertEqual(self.annotate_agreement(agreement=agreement).work_months, 5)
@@ -1,7 +1,12 @@
 from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
+from django.contrib.auth.models import Group
 from django.urls import reverse_lazy
+from employees.factories.factories_addendum import AddendumFactory
+from employees.factories.factories_agreement import AgreementFactory
+from employees.factories.factories_termination import TerminationFactory
+from employees.factories.factories_vacation import VacationFactory
 from users.factories import UserFactory
 
 
@@ -45,3 +50,15 @@ class EmployeeDetailViewTests(EDMSTestCase):
         response = self.client.get(self.view_url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, self.template_name)
+
+    def test_number_of_queries_does_not_grow_with_related_rows(self):
+        self.employee.groups.add(*Group.objects.all())
+
+        def create_rows(count: int) -> None:
+            for agreement in AgreementFactory.create_batch(count, user=self.employee):
+                TerminationFactory.create(agreement=agreement)
+                AddendumFactory.create(agreement=agreement)
+            for _ in range(count):
+                VacationFactory.create(leave_user=self.employee, substitute_users=UserFactory.create_batch(2))
+
+        self.assertQueryBudget(url=self.view_url, user=self.ceo, create_rows=create_rows)
@@ -79,3 +79,11 @@ class EmployeeListViewTests(EDMSTestCase):
             first_name__exact=self.employee.first_name, last_name__exact=self.employee.last_name
         ).count()
         self.assertEqual(len(response.context["users"]), expected_value)
+
+    def test_number_of_queries_does_not_grow_with_employees(self):
+        User.objects.exclude(pk__in=[self.accountant.pk, self.ceo.pk, self.hr.pk, self.manager.pk]).delete()
+        self.assertQueryBudget(
+            url=self.view_url,
+            user=self.ceo,
+            create_rows=lambda count: UserFactory.create_batch(count),
+        )
@@ -0,0 +1,59 @@
+from http import HTTPStatus
+
+from common_tests.EDMSTestCase import EDMSTestCase
+from django.urls import reverse_lazy
+from users.factories import UserFactory
+
+
+class EmployeePlotViewTests(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.employee = UserFactory.create()
+        self.view_url = reverse_lazy("plot-employee", kwargs={"pk": self.employee.pk})
+        self.own_plot_url = reverse_lazy("plot-employee", kwargs={"pk": self.manager.pk})
+        self.login_redirect_url = f"{reverse_lazy('login')}?next={self.view_url}"
+
+    def test_redirect_to_login_page_when_not_authenticated_user_execute_get_method(self):
+        response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertRedirects(response, self.login_redirect_url)
+
+    def test_return_plot_when_logged_user_group_ceos_execute_get_method(self):
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, "plotly-graph-div")
+
+    def test_return_own_plot_when_logged_user_group_managers_execute_get_method(self):
+        login = self.client.login(email=self.manager.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.own_plot_url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, "plotly-graph-div")
+
+    def test_return_forbidden_when_logged_user_group_managers_execute_get_method_for_other_user(self):
+        login = self.client.login(email=self.manager.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_return_forbidden_when_logged_user_group_accountants_execute_get_method(self):
+        login = self.client.login(email=self.accountant.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_return_forbidden_when_logged_user_group_hrs_execute_get_method(self):
+        login = self.client.login(email=self.hr.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_plot_is_not_rendered_inline_in_detail_view(self):
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(reverse_lazy("detail-employee", kwargs={"pk": self.employee.pk}))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotContains(response, "plotly-graph-div")
+        self.assertContains(response, self.view_url)
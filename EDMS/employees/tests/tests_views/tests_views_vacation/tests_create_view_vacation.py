@@ -16,7 +16,8 @@ class VacationCreateViewTests(EDMSTestCase):
         self.template_name = "employees/vacations/vacation_create.html"
         self.vacation = VacationFactory.build()
         substitute_users = UserFactory.create_batch(2)
-        AgreementFactory.create(user=leave_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            AgreementFactory.create(user=leave_user)
         self.vacation_data = {
             "type": self.vacation.type,
             "start_date": self.vacation.start_date,
@@ -12,7 +12,8 @@ class VacationUpdateViewTests(EDMSTestCase):
     def setUp(self) -> None:
         super().setUp()
         leave_user = UserFactory.create()
-        AgreementFactory.create(user=leave_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            AgreementFactory.create(user=leave_user)
         substitute_users = UserFactory.create_batch(2)
         self.vacation = VacationFactory(leave_user=leave_user, substitute_users=substitute_users)
         self.view_url = reverse_lazy("update-vacation", kwargs={"pk": self.vacation.pk})
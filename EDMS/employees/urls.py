@@ -22,7 +22,9 @@ from .views.views_agreement import (
 from .views.views_employee import (
     EmployeeDetailView,
     EmployeeListView,
+    EmployeePlotView,
     EmployeeUpdateView,
+    UserAutocompleteView,
 )
 from .views.views_group import GroupUpdateView
 from .views.views_password import CustomPasswordChangeView
@@ -55,6 +57,7 @@ router.register("api/vacations", VacationModelViewSet)
 
 urlpatterns = [
     path("employees/<int:pk>/", EmployeeDetailView.as_view(), name="detail-employee"),
+    path("employees/<int:pk>/plot/", EmployeePlotView.as_view(), name="plot-employee"),
     path(
         "employees/<int:pk>/update/",
         EmployeeUpdateView.as_view(),
@@ -91,6 +94,7 @@ urlpatterns = [
         name="delete-agreement",
     ),
     path("employees/", EmployeeListView.as_view(), name="list-employee"),
+    path("employees/autocomplete/", UserAutocompleteView.as_view(), name="autocomplete-user"),
     path(
         "employees/<int:pk>/create-vacation/",
         VacationCreateView.as_view(),
@@ -4,6 +4,7 @@ from dashboards.plots import render_plot_for_user_group
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.db.models import QuerySet
+from django.http import HttpResponse, HttpResponseForbidden
 from django.urls import reverse
 from django.views.generic import DetailView, ListView, UpdateView
 from employees.filters import UserFilterSet
@@ -11,6 +12,9 @@ from employees.forms.forms_contact import ContactForm
 from employees.models.models_addendum import Addendum
 from employees.models.models_termination import Termination
 
+from EDMS.autocomplete import AutocompleteView
+from EDMS.pagination import KeysetPaginationMixin
+
 User = get_user_model()
 
 
@@ -27,10 +31,10 @@ class EmployeeDetailView(PermissionRequiredMixin, DetailView, LoginRequiredMixin
             **kwargs: Additional keyword arguments.
 
         Returns:
-            dict: Context data including plots, agreements, terminations, addenda, and vacations.
+            dict: Context data including agreements, terminations, addenda, and vacations.
+            The plot is loaded by the browser from EmployeePlotView after the page is rendered.
         """
         context = super().get_context_data(**kwargs)
-        context["plot"] = render_plot_for_user_group(user=self.object)
         context["agreements"] = self.object.agreements.all()
         context["terminations"] = Termination.objects.filter(agreement__user__id=self.kwargs["pk"]).select_related(
             "agreement"
@@ -40,6 +44,30 @@ class EmployeeDetailView(PermissionRequiredMixin, DetailView, LoginRequiredMixin
         return context
 
 
+class EmployeePlotView(PermissionRequiredMixin, DetailView, LoginRequiredMixin):
+    permission_required = "users.view_user"
+    model = User
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        """
+        Return the HTML of the employee plot, requested by the employee detail page after it is rendered.
+        Ceos can see the plot of every employee, managers only their own plot.
+
+        Args:
+            request (HttpRequest): The request object.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            HttpResponse | HttpResponseForbidden: The HTML of the plot or a forbidden response.
+        """
+        self.object = self.get_object()
+        user_groups = set(request.user.groups.values_list("name", flat=True))
+        if "ceos" in user_groups or ("managers" in user_groups and self.object == request.user):
+            return HttpResponse(render_plot_for_user_group(user=self.object))
+        return HttpResponseForbidden()
+
+
 class EmployeeUpdateView(PermissionRequiredMixin, UpdateView, LoginRequiredMixin):
     permission_required = "users.change_user"
     model = User
@@ -50,7 +78,7 @@ class EmployeeUpdateView(PermissionRequiredMixin, UpdateView, LoginRequiredMixin
         return reverse("detail-employee", kwargs={"pk": self.object.pk})
 
 
-class EmployeeListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
+class EmployeeListView(PermissionRequiredMixin, KeysetPaginationMixin, ListView, LoginRequiredMixin):
     permission_required = "users.view_user"
     queryset = User.objects.all()
     template_name = "employees/employees/employee_list.html"
@@ -74,3 +102,10 @@ class EmployeeListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
         context = super().get_context_data(*args, **kwargs)
         context["filter_form"] = self.filter_set.form
         return context
+
+
+class UserAutocompleteView(AutocompleteView):
+    permission_required = "users.view_user"
+    model = User
+    search_fields = ["first_name", "last_name", "email"]
+    ordering = ["first_name", "last_name", "pk"]
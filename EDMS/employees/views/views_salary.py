@@ -14,6 +14,8 @@ from employees.filters import SalaryFilterSet
 from employees.forms.forms_salary import SalaryForm
 from employees.models.models_salaries import Salary
 
+from EDMS.pagination import KeysetPaginationMixin
+
 
 class SalaryCreateView(PermissionRequiredMixin, CreateView, LoginRequiredMixin):
     permission_required = "employees.add_salary"
@@ -48,7 +50,7 @@ class SalaryDeleteView(PermissionRequiredMixin, DeleteView, LoginRequiredMixin):
     success_url = reverse_lazy("list-salary")
 
 
-class SalaryListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
+class SalaryListView(PermissionRequiredMixin, KeysetPaginationMixin, ListView, LoginRequiredMixin):
     permission_required = "employees.view_salary"
     model = Salary
     ordering = "id"
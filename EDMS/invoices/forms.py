@@ -3,6 +3,9 @@ from decimal import Decimal
 from typing import Dict, List, Union
 
 from django import forms
+from django.urls import reverse_lazy
+
+from EDMS.autocomplete import AutocompleteSelect
 
 from .models import Company, Invoice
 from .validators import InvoiceValidator
@@ -14,8 +17,8 @@ class InvoiceForm(forms.ModelForm):
         fields = "__all__"
         widgets = {
             "name": forms.TextInput(attrs={"class": "form-control"}),
-            "seller": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
-            "buyer": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
+            "seller": AutocompleteSelect(attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-company")),
+            "buyer": AutocompleteSelect(attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-company")),
             "net_price": forms.NumberInput(attrs={"class": "form-control"}),
             "vat": forms.NumberInput(attrs={"class": "form-control"}),
             "gross": forms.NumberInput(attrs={"class": "form-control"}),
@@ -24,7 +27,9 @@ class InvoiceForm(forms.ModelForm):
             "payment_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "type": forms.Select(attrs={"class": "form-control"}),
             "scan": forms.FileInput(attrs={"class": "form-input"}),
-            "linked_invoice": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
+            "linked_invoice": AutocompleteSelect(
+                attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-invoice")
+            ),
             "is_paid": forms.CheckboxInput(attrs={"class": "form-check-input ml-2"}),
         }
 
@@ -32,6 +37,8 @@ class InvoiceForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         if self.instance:
             self.fields["linked_invoice"].queryset = Invoice.objects.exclude(pk=self.instance.pk)
+            if self.instance.pk:
+                self.fields["linked_invoice"].widget.exclude = [self.instance.pk]
 
     def clean(self) -> Dict[str, Union[Decimal | date | Company]]:
         cleaned_data: Dict[str, Union[Decimal | date | Company]] = super().clean()
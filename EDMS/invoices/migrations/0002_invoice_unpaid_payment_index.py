@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:28
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("invoices", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="invoice",
+            index=models.Index(
+                condition=models.Q(("is_paid", False)), fields=["payment_date"], name="invoice_unpaid_payment_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FILL_ROOT_INVOICES_SQL = """
+WITH RECURSIVE tree (id, root_id, path) AS (
+    SELECT id, NULL::bigint, ARRAY[id]
+    FROM invoices_invoice
+    WHERE linked_invoice_id IS NULL
+    UNION ALL
+    SELECT child.id, COALESCE(tree.root_id, tree.id), tree.path || child.id
+    FROM invoices_invoice child
+    JOIN tree ON child.linked_invoice_id = tree.id
+    WHERE NOT child.id = ANY(tree.path)
+)
+UPDATE invoices_invoice
+SET root_invoice_id = tree.root_id
+FROM tree
+WHERE invoices_invoice.id = tree.id AND tree.root_id IS NOT NULL
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("invoices", "0002_invoice_unpaid_payment_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="invoice",
+            name="root_invoice",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text=(
+                    "The first invoice of the family of linked invoices. It is empty for the first invoice itself."
+                ),
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="family_invoices",
+                to="invoices.invoice",
+            ),
+        ),
+        migrations.RunSQL(sql=FILL_ROOT_INVOICES_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -1,8 +1,32 @@
+from collections import defaultdict
 from decimal import Decimal
+from typing import Any, Iterable, List
 
 from companies.models import Company
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connection, models
+from django.db.models import DEFERRED, Case, F, Q, QuerySet, Value, When
+from django.db.models.functions import Coalesce
+
+UPDATE_ROOT_INVOICES_SQL = """
+WITH RECURSIVE tree (id, root_id, path) AS (
+    SELECT invoice.id,
+           CASE WHEN invoice.linked_invoice_id IS NULL THEN NULL ELSE COALESCE(linked.root_invoice_id, linked.id) END,
+           ARRAY[invoice.id]
+    FROM invoices_invoice invoice
+    LEFT JOIN invoices_invoice linked ON linked.id = invoice.linked_invoice_id
+    WHERE invoice.id = ANY(%s)
+    UNION ALL
+    SELECT child.id, COALESCE(tree.root_id, tree.id), tree.path || child.id
+    FROM invoices_invoice child
+    JOIN tree ON child.linked_invoice_id = tree.id
+    WHERE NOT child.id = ANY(tree.path)
+)
+UPDATE invoices_invoice
+SET root_invoice_id = tree.root_id
+FROM tree
+WHERE invoices_invoice.id = tree.id AND invoices_invoice.root_invoice_id IS DISTINCT FROM tree.root_id
+"""
 
 
 class Invoice(models.Model):
@@ -56,10 +80,168 @@ class Invoice(models.Model):
         blank=True,
         help_text="An invoice connected with the invoice, e.g. correcting invoice to original.",
     )
+    root_invoice = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="family_invoices",
+        help_text="The first invoice of the family of linked invoices. It is empty for the first invoice itself.",
+    )
     scan = models.FileField(upload_to="invoices/", help_text="Physical version of the document.")
     is_paid = models.BooleanField(
         default=False, help_text="It tells us if the invoice has been already paid or not yet."
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["payment_date"], condition=models.Q(is_paid=False), name="invoice_unpaid_payment_idx")
+        ]
+
     def __str__(self):
         return f"{self.name}"
+
+    @classmethod
+    def from_db(cls, db: str, field_names: List[str], values: List[Any]) -> "Invoice":
+        """
+        Load the invoice and remember its stored linked invoice, so save can tell if the link changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._stored_linked_invoice_id = dict(zip(field_names, values)).get("linked_invoice_id", DEFERRED)
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs) -> None:
+        """
+        Reload the invoice and remember its reloaded linked invoice as the stored one.
+        """
+        super().refresh_from_db(*args, **kwargs)
+        fields = kwargs.get("fields")
+        if fields is None or {"linked_invoice", "linked_invoice_id"} & set(fields):
+            self._stored_linked_invoice_id = self.linked_invoice_id
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the invoice with the root of its family. If the invoice was linked to another invoice, roots of the
+        invoices linked to it, at any depth, are updated too. Roots are not counted again if the link did not change.
+        """
+        update_fields = kwargs.get("update_fields")
+        is_new = self._state.adding
+        if (update_fields is not None and "linked_invoice" not in update_fields) or not (
+            is_new or self.has_linked_invoice_changed()
+        ):
+            super().save(*args, **kwargs)
+            return
+        self.root_invoice_id = self.linked_invoice.get_root_invoice_id() if self.linked_invoice else None
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "root_invoice"}
+        super().save(*args, **kwargs)
+        self._stored_linked_invoice_id = self.linked_invoice_id
+        if not is_new:
+            Invoice.update_root_invoices(invoice_ids=[self.pk])
+
+    def has_linked_invoice_changed(self) -> bool:
+        """
+        Check if the linked invoice differs from the stored one. An invoice not loaded from the database, or loaded
+        without the link, is treated as changed.
+
+        Returns:
+            bool: True if the link changed or is not known.
+        """
+        return self.linked_invoice_id != getattr(self, "_stored_linked_invoice_id", DEFERRED)
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the invoice. Invoices linked to it become roots of their own families.
+        """
+        linked_invoice_ids = list(Invoice.objects.filter(linked_invoice=self).values_list("pk", flat=True))
+        result = super().delete(*args, **kwargs)
+        Invoice.update_root_invoices(invoice_ids=linked_invoice_ids)
+        return result
+
+    def get_root_invoice_id(self) -> int:
+        return self.root_invoice_id or self.pk
+
+    def get_family(self) -> QuerySet["Invoice"]:
+        """
+        Get the whole family of the invoice, e.g. original, its duplicates and proformas, corrections and further
+        corrections, with one indexed query.
+
+        Returns:
+            QuerySet[Invoice]: The root invoice and all invoices linked to it at any depth.
+        """
+        return Invoice.get_families(invoices=[self])
+
+    def get_descendants(self) -> List["Invoice"]:
+        """
+        Get invoices linked to the invoice at any depth. The family is fetched with one query and walked in memory.
+
+        Returns:
+            List[Invoice]: Linked invoices, closer ones first.
+        """
+        children_by_linked_invoice_id = defaultdict(list)
+        for invoice in self.get_family():
+            children_by_linked_invoice_id[invoice.linked_invoice_id].append(invoice)
+        descendants = []
+        visited_ids = {self.pk}
+        parent_ids = [self.pk]
+        while parent_ids:
+            children = [
+                child
+                for parent_id in parent_ids
+                for child in children_by_linked_invoice_id[parent_id]
+                if child.pk not in visited_ids
+            ]
+            visited_ids.update(child.pk for child in children)
+            descendants.extend(children)
+            parent_ids = [child.pk for child in children]
+        return descendants
+
+    @classmethod
+    def get_families(cls, invoices: Iterable["Invoice"]) -> QuerySet["Invoice"]:
+        """
+        Get whole families of the invoices with one indexed query.
+
+        Args:
+            invoices (Iterable[Invoice]): Invoices from any place in their families.
+
+        Returns:
+            QuerySet[Invoice]: Root invoices and all invoices linked to them at any depth, ordered by primary key.
+        """
+        root_ids = {invoice.get_root_invoice_id() for invoice in invoices}
+        return cls.objects.filter(Q(pk__in=root_ids) | Q(root_invoice_id__in=root_ids)).order_by("pk")
+
+    @classmethod
+    def update_root_invoices(cls, invoice_ids: Iterable[int]) -> None:
+        """
+        Set roots of the invoices from the invoices they are linked to and propagate them to all invoices linked to
+        them at any depth, with one recursive query.
+
+        Args:
+            invoice_ids (Iterable[int]): Invoices whose links changed.
+        """
+        invoice_ids = list(invoice_ids)
+        if invoice_ids:
+            with connection.cursor() as cursor:
+                cursor.execute(UPDATE_ROOT_INVOICES_SQL, [invoice_ids])
+
+    @classmethod
+    def get_counted_net_price(cls) -> Case:
+        """
+        Build an expression with the net price the invoice adds to the order balance.
+        Original and duplicate invoices without linked invoice count with their net price, correcting invoices count
+        with the difference between their net price and the net price of the corrected invoice, other invoices
+        (e.g. proforma) do not count.
+
+        Returns:
+            Case: Expression which can be summed over invoices in the database.
+        """
+        return Case(
+            When(type__in=[cls.ORIGINAL, cls.DUPLICATE], linked_invoice__isnull=True, then=F("net_price")),
+            When(
+                type=cls.CORRECTING,
+                then=F("net_price") - Coalesce(F("linked_invoice__net_price"), Value(Decimal(0))),
+            ),
+            default=Value(Decimal(0)),
+            output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        )
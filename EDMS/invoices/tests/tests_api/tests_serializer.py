@@ -21,6 +21,7 @@ class InvoiceSerializerTests(TestCase):
             "payment_date": self.invoice.payment_date.strftime("%Y-%m-%d"),
             "type": self.invoice.type,
             "linked_invoice": None,
+            "root_invoice": None,
             "scan": self.invoice.scan.url,
             "is_paid": self.invoice.is_paid,
         }
@@ -1,6 +1,11 @@
+from typing import List, Optional
+
 from companies.factories import CompanyFactory
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from invoices.factories import InvoiceFactory
+from invoices.models import Invoice
 
 
 class InvoiceTests(TestCase):
@@ -11,3 +16,63 @@ class InvoiceTests(TestCase):
 
     def test_str_method(self):
         self.assertEqual(str(self.invoice), f"{self.invoice.name}")
+
+
+class InvoiceFamilyTests(TestCase):
+    def setUp(self) -> None:
+        self.original = InvoiceFactory.create()
+        self.duplicate = InvoiceFactory.create(type=Invoice.DUPLICATE, linked_invoice=self.original)
+        self.correcting = InvoiceFactory.create(type=Invoice.CORRECTING, linked_invoice=self.duplicate)
+        self.further_correcting = InvoiceFactory.create(type=Invoice.CORRECTING, linked_invoice=self.correcting)
+        self.other_original = InvoiceFactory.create()
+
+    def assertRootInvoices(self, invoices: List[Invoice], root_invoice: Optional[Invoice]) -> None:
+        for invoice in invoices:
+            invoice.refresh_from_db()
+            self.assertEqual(invoice.root_invoice, root_invoice)
+
+    def test_set_root_invoice_at_any_depth(self):
+        self.assertRootInvoices(invoices=[self.original, self.other_original], root_invoice=None)
+        self.assertRootInvoices(
+            invoices=[self.duplicate, self.correcting, self.further_correcting], root_invoice=self.original
+        )
+
+    def test_get_family_with_one_query(self):
+        expected_family = [self.original, self.duplicate, self.correcting, self.further_correcting]
+        with self.assertNumQueries(1):
+            self.assertEqual(list(self.further_correcting.get_family()), expected_family)
+        with self.assertNumQueries(1):
+            self.assertEqual(list(Invoice.get_families(invoices=[self.correcting, self.original])), expected_family)
+
+    def test_get_descendants(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.duplicate.get_descendants(), [self.correcting, self.further_correcting])
+        self.assertEqual(self.further_correcting.get_descendants(), [])
+
+    def test_move_linked_invoices_to_new_family(self):
+        self.duplicate.linked_invoice = self.other_original
+        self.duplicate.save()
+        self.assertRootInvoices(invoices=[self.original], root_invoice=None)
+        self.assertRootInvoices(
+            invoices=[self.duplicate, self.correcting, self.further_correcting], root_invoice=self.other_original
+        )
+
+    def test_make_linked_invoices_roots_when_invoice_is_deleted(self):
+        self.duplicate.delete()
+        self.assertRootInvoices(invoices=[self.original, self.correcting], root_invoice=None)
+        self.assertRootInvoices(invoices=[self.further_correcting], root_invoice=self.correcting)
+
+    def test_update_roots_only_when_link_changes(self):
+        invoice = Invoice.objects.get(pk=self.correcting.pk)
+        invoice.net_price += 1
+        with CaptureQueriesContext(connection) as queries:
+            invoice.save()
+        self.assertFalse(any("WITH RECURSIVE" in query["sql"] for query in queries))
+        invoice.linked_invoice = self.other_original
+        with CaptureQueriesContext(connection) as queries:
+            invoice.save()
+        self.assertEqual(len([query for query in queries if "WITH RECURSIVE" in query["sql"]]), 1)
+        self.assertRootInvoices(invoices=[self.correcting, self.further_correcting], root_invoice=self.other_original)
+        with CaptureQueriesContext(connection) as queries:
+            invoice.save()
+        self.assertFalse(any("WITH RECURSIVE" in query["sql"] for query in queries))
@@ -119,3 +119,17 @@ class InvoiceDetailViewTests(EDMSTestCase):
         response = self.client.get(self.view_url)
         self.assertEqual(list(response.context["order_from_income_invoice"]), [])
         self.assertEqual(list(response.context["order_from_cost_invoice"]), [order])
+
+    def test_number_of_queries_does_not_grow_with_child_invoices_and_orders(self):
+        def create_rows(count: int) -> None:
+            InvoiceFactory.create_batch(
+                count,
+                seller=self.my_company,
+                buyer=self.customer_company,
+                type=Invoice.CORRECTING,
+                linked_invoice=self.invoice,
+            )
+            for order in OrderFactory.create_batch(count, company=self.customer_company):
+                order.income_invoice.add(self.invoice)
+
+        self.assertQueryBudget(url=self.view_url, user=self.ceo, create_rows=create_rows)
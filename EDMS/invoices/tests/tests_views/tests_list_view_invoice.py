@@ -2,6 +2,7 @@ from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
 from django.contrib.auth import get_user_model
+from django.test import override_settings
 from django.urls import reverse_lazy
 from django.utils import timezone
 from invoices.factories import InvoiceFactory
@@ -101,3 +102,58 @@ class InvoiceListViewTests(EDMSTestCase):
         self.assertIn(self.invoice_paid, filtered_qs)
         self.assertIn(self.invoice_unpaid_future, filtered_qs)
         self.assertIn(self.invoice_unpaid_past, filtered_qs)
+
+    def test_number_of_queries_does_not_grow_with_invoices(self):
+        Invoice.objects.all().delete()
+        self.assertQueryBudget(
+            url=self.view_url,
+            user=self.ceo,
+            create_rows=lambda count: InvoiceFactory.create_batch(count),
+        )
+
+    def test_browse_pages_with_cursors(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.view_url)
+        page = response.context["page_obj"]
+        self.assertContains(response, f"?after={page.next_cursor}&amp;")
+        response = self.client.get(self.view_url, data={"after": page.next_cursor})
+        self.assertTrue(response.context["is_keyset_page"])
+        expected_invoices = list(Invoice.objects.order_by("create_date", "pk")[10:])
+        self.assertEqual(list(response.context["invoices"]), expected_invoices)
+        self.assertFalse(response.context["page_obj"].has_next())
+        response = self.client.get(self.view_url, data={"before": response.context["page_obj"].previous_cursor})
+        self.assertEqual(len(response.context["invoices"]), 10)
+        self.assertFalse(response.context["page_obj"].has_previous())
+
+    def test_return_404_for_invalid_cursor(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.view_url, data={"after": "invalid"})
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_keep_filter_params_in_pagination_links(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.view_url, data={"name": "", "seller__name": "", "page": 1})
+        self.assertEqual(response.context["filter_params"], "name=&seller__name=")
+        self.assertContains(response, "?page=2&amp;name=&amp;seller__name=")
+
+    def test_elide_page_range(self):
+        InvoiceFactory.create_batch(100)
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.view_url, data={"page": 6})
+        page_range = list(response.context["page_range"])
+        ellipsis = response.context["paginator"].ELLIPSIS
+        self.assertEqual(page_range, [1, ellipsis, 4, 5, 6, 7, 8, ellipsis, 12])
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_show_estimated_count_of_large_list(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.view_url, data={"create_date__gt": "2000-01-01"})
+        self.assertTrue(response.context["paginator"].is_count_estimated)
+        self.assertContains(response, "of about")
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_show_exact_count_of_list_shorter_than_page(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.view_url, data={"name": self.invoice.name})
+        self.assertFalse(response.context["paginator"].is_count_estimated)
+        self.assertContains(response, "of 1 entries")
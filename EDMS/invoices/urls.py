@@ -1,6 +1,7 @@
 from django.urls import include, path
 from invoices.api.views_api_invoice import InvoiceModelViewSet
 from invoices.views import (
+    InvoiceAutocompleteView,
     InvoiceCreateView,
     InvoiceDeleteView,
     InvoiceDetailView,
@@ -16,6 +17,7 @@ urlpatterns = [
     path("invoices/create/", InvoiceCreateView.as_view(), name="create-invoice"),
     path("invoices/<int:pk>/", InvoiceDetailView.as_view(), name="detail-invoice"),
     path("invoices/", InvoiceListView.as_view(), name="list-invoice"),
+    path("invoices/autocomplete/", InvoiceAutocompleteView.as_view(), name="autocomplete-invoice"),
     path("invoices/<int:pk>/update", InvoiceUpdateView.as_view(), name="update-invoice"),
     path("invoices/<int:pk>/delete/", InvoiceDeleteView.as_view(), name="delete-invoice"),
     path("", include(router.urls)),
@@ -16,6 +16,9 @@ from invoices.forms import InvoiceForm
 from invoices.models import Invoice
 from orders.models import Order
 
+from EDMS.autocomplete import AutocompleteView
+from EDMS.pagination import KeysetPaginationMixin
+
 
 class InvoiceCreateView(PermissionRequiredMixin, CreateView, LoginRequiredMixin):
     permission_required = "invoices.add_invoice"
@@ -41,18 +44,18 @@ class InvoiceDetailView(PermissionRequiredMixin, DetailView, LoginRequiredMixin)
 
     def get_child_invoices(self) -> Optional[List[Invoice]]:
         """
-        If invoice type is original or duplicate find and return all linked invoices to it.
+        If invoice type is original or duplicate find and return all invoices linked to it at any depth.
 
         Return:
-            List[Invoice]: family of invoices(main invoice and all linked invoices to it)
+            List[Invoice]: invoices linked to the invoice, e.g. duplicates, proformas, corrections and their corrections
         """
         child_invoices = None
         if self.object.type in [Invoice.ORIGINAL, Invoice.DUPLICATE]:
-            child_invoices = Invoice.objects.filter(linked_invoice=self.object)
+            child_invoices = self.object.get_descendants()
         return child_invoices
 
 
-class InvoiceListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
+class InvoiceListView(PermissionRequiredMixin, KeysetPaginationMixin, ListView, LoginRequiredMixin):
     permission_required = "invoices.view_invoice"
     template_name = "invoices/list_invoice.html"
     queryset = Invoice.objects.all()
@@ -130,3 +133,10 @@ class InvoiceDeleteView(PermissionRequiredMixin, DeleteView, LoginRequiredMixin)
     model = Invoice
     template_name = "invoices/delete_invoice.html"
     success_url = reverse_lazy("list-invoice")
+
+
+class InvoiceAutocompleteView(AutocompleteView):
+    permission_required = "invoices.view_invoice"
+    model = Invoice
+    search_fields = ["name"]
+    ordering = ["-create_date", "-pk"]
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Order, Protocol
+from .models import Order, OrderCounter, Protocol
 
 
 class CustomOrderAdmin(admin.ModelAdmin):
@@ -20,5 +20,10 @@ class CustomProtocolAdmin(admin.ModelAdmin):
     list_display = ["name", "create_date", "user", "order"]
 
 
+class CustomOrderCounterAdmin(admin.ModelAdmin):
+    list_display = ["company", "year", "month", "value"]
+
+
 admin.site.register(Order, CustomOrderAdmin)
+admin.site.register(OrderCounter, CustomOrderCounterAdmin)
 admin.site.register(Protocol, CustomProtocolAdmin)
@@ -8,4 +8,4 @@ from EDMS.custom_django_model_permissions import CustomDjangoModelPermissions
 class OrderModelViewSet(ModelViewSet):
     permission_classes = (CustomDjangoModelPermissions,)
     serializer_class = OrderSerializer
-    queryset = Order.objects.all()
+    queryset = Order.objects.prefetch_related("income_invoice", "cost_invoice")
@@ -60,6 +60,62 @@ class OrderFilter(django_filters.FilterSet):
         widget=forms.DateInput(attrs={"class": "form-control", "type": "date"}),
     )
 
+    income_net__gt = django_filters.NumberFilter(
+        field_name="income_net",
+        label="Income from",
+        lookup_expr="gte",
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    income_net__lt = django_filters.NumberFilter(
+        field_name="income_net",
+        label="Income to",
+        lookup_expr="lte",
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    cost_net__gt = django_filters.NumberFilter(
+        field_name="cost_net",
+        label="Cost from",
+        lookup_expr="gte",
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    cost_net__lt = django_filters.NumberFilter(
+        field_name="cost_net",
+        label="Cost to",
+        lookup_expr="lte",
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    balance__gt = django_filters.NumberFilter(
+        field_name="balance",
+        label="Balance from",
+        lookup_expr="gte",
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    balance__lt = django_filters.NumberFilter(
+        field_name="balance",
+        label="Balance to",
+        lookup_expr="lte",
+        widget=forms.NumberInput(attrs={"class": "form-control"}),
+    )
+    ordering = django_filters.OrderingFilter(
+        fields=(
+            ("create_date", "create_date"),
+            ("end_date", "end_date"),
+            ("payment", "payment"),
+            ("income_net", "income_net"),
+            ("cost_net", "cost_net"),
+            ("balance", "balance"),
+        ),
+        field_labels={
+            "create_date": "Create date",
+            "end_date": "End date",
+            "payment": "Payment",
+            "income_net": "Income",
+            "cost_net": "Cost",
+            "balance": "Balance",
+        },
+        label="Sort by",
+    )
+
     class Meta:
         model = Order
         fields = [
@@ -72,4 +128,15 @@ class OrderFilter(django_filters.FilterSet):
             "create_date__lt",
             "start_date",
             "end_date",
+            "income_net__gt",
+            "income_net__lt",
+            "cost_net__gt",
+            "cost_net__lt",
+            "balance__gt",
+            "balance__lt",
+            "ordering",
         ]
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.form.fields["ordering"].widget.attrs["class"] = "form-control"
@@ -2,34 +2,57 @@ from typing import List
 
 from django import forms
 from django.db.models import QuerySet
+from django.urls import reverse
 from invoices.models import Invoice
 from orders.models import Order
 
+from EDMS.autocomplete import AutocompleteSelectMultiple
+
 
 class ManageInvoicesForm(forms.ModelForm):
+    INVOICE_FIELD_NAMES = ("income_invoice", "cost_invoice")
+
     class Meta:
         model = Order
         fields = ["cost_invoice", "income_invoice"]
         widgets = {
-            "cost_invoice": forms.SelectMultiple(attrs={"class": "form-control js-example-basic-multiple", "size": 3}),
-            "income_invoice": forms.SelectMultiple(
-                attrs={"class": "form-control js-example-basic-multiple", "size": 3}
-            ),
+            "cost_invoice": AutocompleteSelectMultiple(attrs={"class": "form-control", "size": 3}),
+            "income_invoice": AutocompleteSelectMultiple(attrs={"class": "form-control", "size": 3}),
         }
 
     def __init__(self, *args, **kwargs):
         """
-        Initializes the form and sets the queryset for income and cost invoices.
+        Initializes the form and sets the queryset for income and cost invoices. Only the selected invoices are
+        rendered, the others are searched in the autocomplete endpoints. Chosen invoices are validated against the
+        querysets.
 
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
         """
         super().__init__(*args, **kwargs)
-        self.fields["income_invoice"].queryset = Invoice.objects.filter(
-            seller__is_mine=True, buyer=self.instance.company
-        )
-        self.fields["cost_invoice"].queryset = Invoice.objects.filter(buyer__is_mine=True)
+        for field_name in self.INVOICE_FIELD_NAMES:
+            self.fields[field_name].queryset = self.get_invoice_queryset(field_name=field_name, order=self.instance)
+            self.fields[field_name].widget.url = reverse(
+                f"autocomplete-{field_name.replace('_', '-')}", kwargs={"pk": self.instance.pk}
+            )
+
+    @staticmethod
+    def get_invoice_queryset(field_name: str, order: Order) -> QuerySet[Invoice]:
+        """
+        Get invoices which can be added to the order as income or cost invoices.
+
+        Args:
+            field_name (str): "income_invoice" or "cost_invoice".
+            order (Order): The order.
+
+        Returns:
+            QuerySet[Invoice]: Invoices sold by my company to the company of the order for income invoices or bought
+            by my company for cost invoices.
+        """
+        if field_name == "income_invoice":
+            return Invoice.objects.filter(seller__is_mine=True, buyer=order.company)
+        return Invoice.objects.filter(buyer__is_mine=True)
 
     def save(self, commit=True) -> Order:
         """
@@ -57,7 +80,7 @@ class ManageInvoicesForm(forms.ModelForm):
     @staticmethod
     def get_all_connected_invoices(invoices: QuerySet[Invoice]) -> List[Invoice]:
         """
-        Retrieves all invoices linked to the given invoices.
+        Retrieves whole families of the given invoices, at any depth, with one query.
 
         Args:
             invoices (QuerySet[Invoice]): The initial set of invoices.
@@ -65,6 +88,4 @@ class ManageInvoicesForm(forms.ModelForm):
         Returns:
             List[Invoice]: A list of all related invoices.
         """
-        linked_invoices = Invoice.objects.filter(linked_invoice__in=invoices)
-        all_invoices = list(invoices) + list(linked_invoices)
-        return all_invoices
+        return list(Invoice.get_families(invoices=invoices))
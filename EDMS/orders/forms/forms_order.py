@@ -5,12 +5,15 @@ from typing import Any, Dict, List, Union
 from companies.models import Company
 from contracts.models import Contract
 from django import forms
+from django.urls import reverse_lazy
 from orders.models import Order, Protocol
 from orders.validators.validators_order import (
     OrderCreateValidator,
     OrderUpdateValidator,
 )
 
+from EDMS.autocomplete import AutocompleteSelect
+
 
 class OrderCreateForm(forms.ModelForm):
     class Meta:
@@ -26,12 +29,12 @@ class OrderCreateForm(forms.ModelForm):
         ]
         widgets = {
             "payment": forms.NumberInput(attrs={"class": "form-control"}),
-            "company": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
+            "company": AutocompleteSelect(attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-company")),
             "description": forms.Textarea(attrs={"class": "form-control"}),
             "start_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "create_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
             "end_date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
-            "contract": forms.Select(attrs={"class": "form-control js-example-basic-single"}),
+            "contract": AutocompleteSelect(attrs={"class": "form-control"}, url=reverse_lazy("autocomplete-contract")),
         }
 
     def clean(self) -> Dict[str, Any]:
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:58
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def set_order_counters(apps, schema_editor):
+    Order = apps.get_model("orders", "Order")
+    OrderCounter = apps.get_model("orders", "OrderCounter")
+    pattern = re.compile(r"-(\d+)/")
+    counters = {}
+    for company_id, create_date, name in Order.objects.filter(company__isnull=False).values_list(
+        "company_id", "create_date", "name"
+    ):
+        match = pattern.search(name)
+        if not match:
+            continue
+        key = (company_id, create_date.year, create_date.month)
+        counters[key] = max(counters.get(key, 0), int(match.group(1)))
+    OrderCounter.objects.bulk_create(
+        [
+            OrderCounter(company_id=company_id, year=year, month=month, value=value)
+            for (company_id, year, month), value in counters.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("companies", "0001_initial"),
+        ("orders", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderCounter",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("year", models.PositiveSmallIntegerField(help_text="Year of the order creation date.")),
+                ("month", models.PositiveSmallIntegerField(help_text="Month of the order creation date.")),
+                ("value", models.PositiveIntegerField(default=0, help_text="The last number given to an order.")),
+                (
+                    "company",
+                    models.ForeignKey(
+                        help_text="The company to which the orders are provided.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_counters",
+                        to="companies.company",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="ordercounter",
+            constraint=models.UniqueConstraint(
+                fields=("company", "year", "month"), name="unique_order_counter_company_month"
+            ),
+        ),
+        migrations.RunPython(set_order_counters, migrations.RunPython.noop),
+    ]
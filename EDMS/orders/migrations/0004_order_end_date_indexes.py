@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:28
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("orders", "0003_order_counter"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(fields=["end_date"], name="order_end_date_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(fields=["user", "end_date"], name="order_user_end_date_idx"),
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:30
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+FILL_ORDER_BALANCE_SQL = [
+    """
+    WITH invoice_value AS (
+        SELECT
+            invoice.id,
+            CASE
+                WHEN invoice.type IN ('original', 'duplicate') AND invoice.linked_invoice_id IS NULL
+                    THEN invoice.net_price
+                WHEN invoice.type = 'correcting' THEN invoice.net_price - COALESCE(linked_invoice.net_price, 0)
+                ELSE 0
+            END AS value
+        FROM invoices_invoice invoice
+        LEFT JOIN invoices_invoice linked_invoice ON linked_invoice.id = invoice.linked_invoice_id
+    ),
+    sums AS (
+        SELECT
+            ord.id,
+            COALESCE(
+                (
+                    SELECT SUM(invoice_value.value)
+                    FROM orders_order_income_invoice link
+                    JOIN invoice_value ON invoice_value.id = link.invoice_id
+                    WHERE link.order_id = ord.id
+                ),
+                0
+            ) AS income_net,
+            COALESCE(
+                (
+                    SELECT SUM(invoice_value.value)
+                    FROM orders_order_cost_invoice link
+                    JOIN invoice_value ON invoice_value.id = link.invoice_id
+                    WHERE link.order_id = ord.id
+                ),
+                0
+            ) AS cost_net
+        FROM orders_order ord
+    )
+    UPDATE orders_order ord
+    SET income_net = sums.income_net, cost_net = sums.cost_net, balance = sums.income_net - sums.cost_net
+    FROM sums
+    WHERE sums.id = ord.id AND (sums.income_net <> 0 OR sums.cost_net <> 0)
+    """,
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("invoices", "0001_initial"),
+        ("orders", "0004_order_end_date_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="income_net",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=Decimal("0"),
+                editable=False,
+                help_text="Counted net price of the income invoices, kept by OrderQuerySet.refresh_balances.",
+                max_digits=14,
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="cost_net",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=Decimal("0"),
+                editable=False,
+                help_text="Counted net price of the cost invoices, kept by OrderQuerySet.refresh_balances.",
+                max_digits=14,
+            ),
+        ),
+        migrations.AddField(
+            model_name="order",
+            name="balance",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=Decimal("0"),
+                editable=False,
+                help_text="Income net minus cost net, kept by OrderQuerySet.refresh_balances.",
+                max_digits=14,
+            ),
+        ),
+        migrations.RunSQL(sql=FILL_ORDER_BALANCE_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
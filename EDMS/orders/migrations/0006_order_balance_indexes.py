@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:31
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("orders", "0005_order_balance"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(fields=["income_net"], name="order_income_net_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(fields=["cost_net"], name="order_cost_net_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(fields=["balance"], name="order_balance_idx"),
+        ),
+    ]
@@ -1,21 +1,84 @@
-import re
+from collections import defaultdict
 from decimal import Decimal
+from typing import Dict, Iterable, List, Tuple
 
 from companies.models import Company
 from contracts.models import Contract
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connection, models
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from invoices.models import Invoice
 
 User = get_user_model()
 
+ALLOCATE_ORDER_NUMBERS_SQL = """
+INSERT INTO orders_ordercounter (company_id, year, month, value)
+SELECT * FROM unnest(%s::integer[], %s::integer[], %s::integer[], %s::integer[])
+ON CONFLICT (company_id, year, month) DO UPDATE SET value = orders_ordercounter.value + EXCLUDED.value
+RETURNING company_id, year, month, value
+"""
+
+
+class OrderQuerySet(models.QuerySet):
+    def refresh_balances(self) -> int:
+        """
+        Count income_net, cost_net and balance of the orders again from their invoices and store them with a single
+        UPDATE. Correcting invoices replace the net price of the invoices they correct, see
+        Invoice.get_counted_net_price.
+
+        Returns:
+            int: Number of updated orders.
+        """
+        income_net = self.sum_invoices_net_price(order_lookup="order_from_income_invoice")
+        cost_net = self.sum_invoices_net_price(order_lookup="order_from_cost_invoice")
+        return self.update(income_net=income_net, cost_net=cost_net, balance=income_net - cost_net)
+
+    @staticmethod
+    def sum_invoices_net_price(order_lookup: str) -> Coalesce:
+        """
+        Build a subquery summing the counted net price of the invoices linked with the order.
+
+        Args:
+            order_lookup (str): Lookup from the invoice to the order, e.g. order_from_income_invoice.
+
+        Returns:
+            Coalesce: Sum of the counted net prices, 0 if the order has no invoices.
+        """
+        output_field = DecimalField(max_digits=14, decimal_places=2)
+        invoices = (
+            Invoice.objects.filter(**{order_lookup: OuterRef("pk")})
+            .order_by()
+            .values(order_lookup)
+            .annotate(total=Sum(Invoice.get_counted_net_price()))
+            .values("total")
+        )
+        return Coalesce(Subquery(invoices, output_field=output_field), Value(Decimal(0)), output_field=output_field)
+
+    def bulk_create(self, objs: Iterable["Order"], *args, **kwargs) -> List["Order"]:
+        """
+        Insert orders in bulk. New orders get their names from blocks of numbers allocated per company and month.
+
+        Args:
+            objs (Iterable[Order]): Orders to insert.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            List[Order]: Inserted orders.
+        """
+        objs = list(objs)
+        Order.set_names(orders=[order for order in objs if not order.pk])
+        return super().bulk_create(objs, *args, **kwargs)
+
 
 class Order(models.Model):
     OPEN = "open"
     INVOICING = "invoicing"
     CLOSED = "closed"
     STATUS_CHOICES = [(OPEN, "open"), (INVOICING, "invoicing"), (CLOSED, "closed")]
+    BALANCE_FIELDS = ["income_net", "cost_net", "balance"]
 
     name = models.CharField(max_length=15, help_text="Order name, e.g. PLAY-01/01/2024")
     payment = models.DecimalField(
@@ -59,6 +122,38 @@ class Order(models.Model):
     description = models.TextField(
         blank=True, help_text="Description of the order - some necessary information to help complete the order."
     )
+    income_net = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal(0),
+        editable=False,
+        help_text="Counted net price of the income invoices, kept by OrderQuerySet.refresh_balances.",
+    )
+    cost_net = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal(0),
+        editable=False,
+        help_text="Counted net price of the cost invoices, kept by OrderQuerySet.refresh_balances.",
+    )
+    balance = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal(0),
+        editable=False,
+        help_text="Income net minus cost net, kept by OrderQuerySet.refresh_balances.",
+    )
+
+    objects = OrderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["end_date"], name="order_end_date_idx"),
+            models.Index(fields=["user", "end_date"], name="order_user_end_date_idx"),
+            models.Index(fields=["income_net"], name="order_income_net_idx"),
+            models.Index(fields=["cost_net"], name="order_cost_net_idx"),
+            models.Index(fields=["balance"], name="order_balance_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name}"
@@ -66,36 +161,129 @@ class Order(models.Model):
     def save(self, *args, **kwargs) -> None:
         """
         Saves the order instance. Sets the order name if it's a new order.
+        Balance fields of an existing order are not saved, because invoices can change them in the database after
+        the instance was read. They are written only by OrderQuerySet.refresh_balances.
         """
         if not self.pk:
-            # current_month = timezone.now().strftime("%m")
-            # current_year = timezone.now().strftime("%Y")
             counter = self.declare_counter(current_month=self.create_date.month, current_year=self.create_date.year)
-            self.name = f"{self.company.shortcut}-{counter}/{self.create_date.month}/{self.create_date.year}"
+            self.name = self.get_name(counter=counter)
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.BALANCE_FIELDS
+            ]
         super().save(*args, **kwargs)
 
     def declare_counter(self, current_month: int, current_year: int) -> int:
         """
-        Calculates the counter for the order number based on existing orders.
+        Allocates the next order number of the company in the month.
 
         Args:
-            current_month (int): The current month as a string.
-            current_year (int): The current year as a string.
+            current_month (int): The month of the order creation date.
+            current_year (int): The year of the order creation date.
 
         Returns:
             int: The new counter value.
         """
-        counter = 1
-        last_order = Order.objects.filter(
-            create_date__month=current_month,
-            create_date__year=current_year,
-            company=self.company,
-        ).last()
-        if last_order:
-            pattern = re.compile(r"-(\d+)/")
-            match = pattern.search(last_order.name)
-            counter = int(match.group(1)) + 1
-        return counter
+        return OrderCounter.allocate(company_id=self.company_id, year=current_year, month=current_month)
+
+    def get_name(self, counter: int) -> str:
+        """
+        Builds the order name, e.g. PLAY-1/1/2024.
+
+        Args:
+            counter (int): The order number of the company in the month.
+
+        Returns:
+            str: The order name.
+        """
+        return f"{self.company.shortcut}-{counter}/{self.create_date.month}/{self.create_date.year}"
+
+    @staticmethod
+    def set_names(orders: List["Order"]) -> None:
+        """
+        Sets names of new orders, allocating one block of numbers per company and month.
+
+        Args:
+            orders (List[Order]): New orders.
+        """
+        orders_per_counter = defaultdict(list)
+        for order in orders:
+            orders_per_counter[(order.company_id, order.create_date.year, order.create_date.month)].append(order)
+        first_counters = OrderCounter.allocate_blocks(
+            counts={key: len(counter_orders) for key, counter_orders in orders_per_counter.items()}
+        )
+        for key, counter_orders in orders_per_counter.items():
+            for counter, order in enumerate(counter_orders, start=first_counters[key]):
+                order.name = order.get_name(counter=counter)
+
+
+class OrderCounter(models.Model):
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        related_name="order_counters",
+        help_text="The company to which the orders are provided.",
+    )
+    year = models.PositiveSmallIntegerField(help_text="Year of the order creation date.")
+    month = models.PositiveSmallIntegerField(help_text="Month of the order creation date.")
+    value = models.PositiveIntegerField(default=0, help_text="The last number given to an order.")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["company", "year", "month"], name="unique_order_counter_company_month")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.company_id}: {self.month}/{self.year} - {self.value}"
+
+    @classmethod
+    def allocate(cls, company_id: int, year: int, month: int, count: int = 1) -> int:
+        """
+        Allocates a block of order numbers of the company in the month with one upsert.
+        The counter row is locked until the end of the transaction, so concurrent allocations never overlap.
+
+        Args:
+            company_id (int): ID of the company.
+            year (int): Year of the order creation date.
+            month (int): Month of the order creation date.
+            count (int): Number of order numbers to allocate.
+
+        Returns:
+            int: The first allocated number, the block ends at the first number + count - 1.
+        """
+        return cls.allocate_blocks(counts={(company_id, year, month): count})[(company_id, year, month)]
+
+    @classmethod
+    def allocate_blocks(cls, counts: Dict[Tuple[int, int, int], int]) -> Dict[Tuple[int, int, int], int]:
+        """
+        Allocates blocks of order numbers of many companies and months with one upsert, which creates missing counter
+        rows and adds the counts to the existing ones. Counter rows are locked in the order of their keys until the
+        end of the transaction, so concurrent allocations never overlap nor deadlock.
+
+        Args:
+            counts (Dict[Tuple[int, int, int], int]): Company ID, year and month as keys and number of order numbers
+                to allocate as values.
+
+        Returns:
+            Dict[Tuple[int, int, int], int]: The same keys and the first allocated numbers as values.
+        """
+        if not counts:
+            return {}
+        keys = sorted(counts)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                ALLOCATE_ORDER_NUMBERS_SQL,
+                [
+                    [company_id for company_id, _, _ in keys],
+                    [year for _, year, _ in keys],
+                    [month for _, _, month in keys],
+                    [counts[key] for key in keys],
+                ],
+            )
+            last_values = {(company_id, year, month): value for company_id, year, month, value in cursor.fetchall()}
+        return {key: last_values[key] - counts[key] + 1 for key in keys}
 
 
 class Protocol(models.Model):
@@ -23,6 +23,9 @@ class InvoiceSerializerTests(TestCase):
             "start_date": self.order.start_date.strftime("%Y-%m-%d"),
             "end_date": self.order.end_date.strftime("%Y-%m-%d"),
             "description": self.order.description,
+            "income_net": f"{self.order.income_net:.2f}",
+            "cost_net": f"{self.order.cost_net:.2f}",
+            "balance": f"{self.order.balance:.2f}",
         }
 
     def test_object_serialization(self):
@@ -6,6 +6,7 @@ from companies.factories import CompanyFactory
 from contracts.factories import ContractFactory
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
+from invoices.factories import InvoiceFactory
 from orders.factories import OrderFactory
 from orders.models import Order
 from rest_framework import serializers
@@ -235,3 +236,11 @@ class OrderApiTestCase(EDMSTestCase):
         self.client.post(self.list_url, self.order_create_data)
         self.client.post(self.list_url, self.order_create_data)
         self.assertRaises(serializers.ValidationError)
+
+    def test_number_of_queries_of_order_list_does_not_grow_with_orders(self):
+        def create_rows(count: int) -> None:
+            for order in OrderFactory.create_batch(count):
+                order.income_invoice.add(InvoiceFactory.create())
+                order.cost_invoice.add(InvoiceFactory.create())
+
+        self.assertQueryBudget(url=reverse_lazy("order-list"), user=self.ceo, create_rows=create_rows)
@@ -86,3 +86,24 @@ class ManageInvoicesFormTests(TestCase):
         all_cost_invoices = form.get_all_connected_invoices(invoices=cost_invoices)
         expected_value = list(Invoice.objects.filter(buyer=self.my_company, seller=self.outside_company))
         self.assertEqual(list(all_cost_invoices), expected_value)
+
+    def test_render_only_selected_invoices(self):
+        self.order.income_invoice.add(self.income_invoice_original)
+        form = ManageInvoicesForm(instance=self.order)
+        rendered_income_invoices = str(form["income_invoice"])
+        rendered_cost_invoices = str(form["cost_invoice"])
+        self.assertIn(f'value="{self.income_invoice_original.pk}" selected', rendered_income_invoices)
+        self.assertNotIn(f'value="{self.income_invoice_duplicate.pk}"', rendered_income_invoices)
+        self.assertNotIn("<option", rendered_cost_invoices)
+        self.assertIn(
+            f'data-autocomplete-url="/orders/{self.order.pk}/manage-invoices/cost-invoices/"', rendered_cost_invoices
+        )
+
+    def test_form_invalid_when_invoice_is_not_allowed(self):
+        form = ManageInvoicesForm(
+            instance=self.order,
+            data={"cost_invoice": [self.income_invoice_original.pk], "income_invoice": [self.cost_invoice_original.pk]},
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("cost_invoice", form.errors)
+        self.assertIn("income_invoice", form.errors)
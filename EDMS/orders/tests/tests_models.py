@@ -1,7 +1,14 @@
+from decimal import Decimal
+
+from companies.factories import CompanyFactory
 from contracts.factories import ContractFactory
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from invoices.factories import InvoiceFactory
+from invoices.models import Invoice
 from orders.factories import OrderFactory, ProtocolFactory
-from orders.models import Order
+from orders.models import Order, OrderCounter
 from users.factories import UserFactory
 
 
@@ -23,12 +30,139 @@ class OrderTests(TestCase):
         self.assertEqual(str(self.order), self.order.name)
 
     def test_save_method(self):
-        counter = Order.declare_counter(
-            self.order, current_month=self.order.create_date.month, current_year=self.order.create_date.year
-        )
         self.order.save()
         self.assertEqual(
             self.order.name,
-            f"{self.contract.company.shortcut}-{counter}/{self.order.create_date.month}/"
-            f"{self.order.create_date.year}",
+            f"{self.contract.company.shortcut}-1/{self.order.create_date.month}/{self.order.create_date.year}",
+        )
+
+    def test_save_method_gives_next_number_of_company_in_month(self):
+        self.order.save()
+        next_order = OrderFactory.create(company=self.contract.company, create_date=self.order.create_date)
+        self.assertEqual(
+            next_order.name,
+            f"{self.contract.company.shortcut}-2/{self.order.create_date.month}/{self.order.create_date.year}",
+        )
+
+    def test_save_method_does_not_change_name_of_existing_order(self):
+        self.order.save()
+        name = self.order.name
+        self.order.description = "Changed"
+        self.order.save()
+        self.assertEqual(self.order.name, name)
+
+    def test_bulk_create_allocates_block_of_numbers(self):
+        self.order.save()
+        orders = OrderFactory.build_batch(
+            3, company=self.contract.company, contract=self.contract, create_date=self.order.create_date
+        )
+        for order in orders:
+            order.user.save()
+        with self.assertNumQueries(2):
+            Order.objects.bulk_create(orders)
+        self.assertEqual(
+            [order.name.split("/")[0] for order in orders],
+            [f"{self.contract.company.shortcut}-{counter}" for counter in [2, 3, 4]],
+        )
+
+
+class OrderCounterTests(TestCase):
+    def setUp(self) -> None:
+        self.company = CompanyFactory.create()
+
+    def test_allocate_single_number(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1), 1)
+        with self.assertNumQueries(1):
+            self.assertEqual(OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1), 2)
+
+    def test_allocate_block_of_numbers(self):
+        self.assertEqual(OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1, count=10), 1)
+        self.assertEqual(OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1), 11)
+
+    def test_allocate_counts_separately_per_month_and_company(self):
+        OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1, count=5)
+        self.assertEqual(OrderCounter.allocate(company_id=self.company.pk, year=2024, month=2), 1)
+        self.assertEqual(OrderCounter.allocate(company_id=CompanyFactory.create().pk, year=2024, month=1), 1)
+
+    def test_allocate_blocks(self):
+        other_company = CompanyFactory.create()
+        OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1, count=3)
+        with self.assertNumQueries(1):
+            first_values = OrderCounter.allocate_blocks(
+                counts={(self.company.pk, 2024, 1): 2, (self.company.pk, 2024, 2): 5, (other_company.pk, 2024, 1): 1}
+            )
+        self.assertEqual(
+            first_values,
+            {(self.company.pk, 2024, 1): 4, (self.company.pk, 2024, 2): 1, (other_company.pk, 2024, 1): 1},
+        )
+        self.assertEqual(OrderCounter.allocate(company_id=self.company.pk, year=2024, month=2), 6)
+
+    def test_allocate_does_not_query_orders(self):
+        OrderFactory.create(company=self.company)
+        with CaptureQueriesContext(connection) as context:
+            OrderCounter.allocate(company_id=self.company.pk, year=2024, month=1)
+        self.assertFalse(any('orders_order"' in query["sql"] for query in context.captured_queries))
+
+
+class OrderQuerySetTests(TestCase):
+    def setUp(self) -> None:
+        self.my_company = CompanyFactory.create(is_mine=True)
+        self.order = OrderFactory.create()
+        self.income_invoice = InvoiceFactory.create(
+            seller=self.my_company, buyer=self.order.company, net_price=Decimal(6000)
+        )
+        self.cost_invoice = InvoiceFactory.create(
+            seller=self.order.company, buyer=self.my_company, net_price=Decimal(1000)
         )
+        self.order.income_invoice.add(self.income_invoice)
+        self.order.cost_invoice.add(self.cost_invoice)
+
+    def test_balance_when_order_has_no_invoices(self):
+        order = OrderFactory.create()
+        self.assertEqual(order.income_net, Decimal(0))
+        self.assertEqual(order.cost_net, Decimal(0))
+        self.assertEqual(order.balance, Decimal(0))
+
+    def test_balance_is_stored_when_invoices_are_added(self):
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.income_net, Decimal(6000))
+        self.assertEqual(self.order.cost_net, Decimal(1000))
+        self.assertEqual(self.order.balance, Decimal(5000))
+
+    def test_balance_when_order_has_correcting_and_proforma_invoices(self):
+        correcting_invoice = InvoiceFactory.create(
+            seller=self.my_company,
+            buyer=self.order.company,
+            type=Invoice.CORRECTING,
+            linked_invoice=self.income_invoice,
+            net_price=Decimal(5500),
+        )
+        proforma_invoice = InvoiceFactory.create(
+            seller=self.order.company, buyer=self.my_company, type=Invoice.PROFORMA
+        )
+        self.order.income_invoice.add(correcting_invoice)
+        self.order.cost_invoice.add(proforma_invoice)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.income_net, Decimal(5500))
+        self.assertEqual(self.order.cost_net, Decimal(1000))
+        self.assertEqual(self.order.balance, Decimal(4500))
+
+    def test_refresh_balances_restores_stale_balances(self):
+        Order.objects.update(income_net=0, cost_net=0, balance=0)
+        for _ in range(5):
+            order = OrderFactory.create()
+            order.income_invoice.add(InvoiceFactory.create(seller=self.my_company, buyer=order.company))
+        with self.assertNumQueries(1):
+            updated_rows = Order.objects.all().refresh_balances()
+        self.assertEqual(updated_rows, 6)
+        self.assertEqual(Order.objects.get(pk=self.order.pk).balance, Decimal(5000))
+
+    def test_save_does_not_overwrite_stored_balance(self):
+        stale_order = Order.objects.get(pk=self.order.pk)
+        self.order.income_invoice.remove(self.income_invoice)
+        stale_order.description = "Changed description"
+        stale_order.save()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.description, "Changed description")
+        self.assertEqual(self.order.balance, Decimal(-1000))
@@ -7,7 +7,7 @@ from contracts.factories import ContractFactory
 from django.urls import reverse_lazy
 from invoices.factories import InvoiceFactory
 from invoices.models import Invoice
-from orders.factories import OrderFactory
+from orders.factories import OrderFactory, ProtocolFactory
 
 
 class OrderDetailViewTests(EDMSTestCase):
@@ -81,3 +81,23 @@ class OrderDetailViewTests(EDMSTestCase):
         response = self.client.get(self.view_url)
         expected_value = Decimal(5999)
         self.assertEqual(response.context["cost_invoices_net_price_sum"], expected_value)
+
+    def test_number_of_queries_does_not_grow_with_invoices_and_protocols(self):
+        my_company = CompanyFactory.create(is_mine=True)
+
+        def create_rows(count: int) -> None:
+            for _ in range(count):
+                income_invoice = InvoiceFactory.create(seller=my_company, buyer=self.order.company)
+                self.order.income_invoice.add(
+                    income_invoice,
+                    InvoiceFactory.create(
+                        seller=my_company,
+                        buyer=self.order.company,
+                        type=Invoice.CORRECTING,
+                        linked_invoice=income_invoice,
+                    ),
+                )
+                self.order.cost_invoice.add(InvoiceFactory.create(buyer=my_company))
+            ProtocolFactory.create_batch(count, order=self.order)
+
+        self.assertQueryBudget(url=self.view_url, user=self.ceo, create_rows=create_rows)
@@ -0,0 +1,68 @@
+from http import HTTPStatus
+
+from common_tests.EDMSTestCase import EDMSTestCase
+from companies.factories import CompanyFactory
+from django.urls import reverse_lazy
+from invoices.factories import InvoiceFactory
+from orders.factories import OrderFactory
+from orders.views.views_orders import OrderInvoiceAutocompleteView
+
+
+class OrderInvoiceAutocompleteViewTests(EDMSTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        my_company = CompanyFactory.create(is_mine=True)
+        company = CompanyFactory.create()
+        self.order = OrderFactory.create(company=company)
+        self.income_invoice = InvoiceFactory.create(name="FV/1/2024", seller=my_company, buyer=company)
+        self.other_income_invoice = InvoiceFactory.create(name="FV/2/2024", seller=my_company, buyer=company)
+        self.cost_invoice = InvoiceFactory.create(name="FV/3/2024", seller=company, buyer=my_company)
+        InvoiceFactory.create(seller=CompanyFactory.create(), buyer=company)
+        self.income_url = reverse_lazy("autocomplete-income-invoice", kwargs={"pk": self.order.pk})
+        self.cost_url = reverse_lazy("autocomplete-cost-invoice", kwargs={"pk": self.order.pk})
+
+    def test_redirect_to_login_page_when_not_authenticated_user_execute_get_method(self):
+        response = self.client.get(self.income_url)
+        self.assertRedirects(response, f"{reverse_lazy('login')}?next={self.income_url}")
+
+    def test_deny_search_when_logged_user_group_accountants_execute_get_method(self):
+        self.client.force_login(self.accountant)
+        response = self.client.get(self.income_url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_return_only_allowed_invoices(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(self.income_url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {"id": self.other_income_invoice.pk, "text": self.other_income_invoice.name},
+                {"id": self.income_invoice.pk, "text": self.income_invoice.name},
+            ],
+        )
+        response = self.client.get(self.cost_url)
+        self.assertEqual(response.json()["results"], [{"id": self.cost_invoice.pk, "text": self.cost_invoice.name}])
+
+    def test_search_invoices_by_name(self):
+        self.client.force_login(self.manager)
+        response = self.client.get(self.income_url, data={"term": "fv/2"})
+        self.assertEqual(
+            response.json()["results"], [{"id": self.other_income_invoice.pk, "text": self.other_income_invoice.name}]
+        )
+
+    def test_paginate_results(self):
+        self.client.force_login(self.ceo)
+        OrderInvoiceAutocompleteView.paginate_by = 1
+        self.addCleanup(setattr, OrderInvoiceAutocompleteView, "paginate_by", 20)
+        first_page = self.client.get(self.income_url).json()
+        second_page = self.client.get(self.income_url, data={"page": 2}).json()
+        self.assertEqual(first_page["results"], [{"id": self.other_income_invoice.pk, "text": "FV/2/2024"}])
+        self.assertTrue(first_page["pagination"]["more"])
+        self.assertEqual(second_page["results"], [{"id": self.income_invoice.pk, "text": "FV/1/2024"}])
+        self.assertFalse(second_page["pagination"]["more"])
+
+    def test_return_404_for_not_existing_order(self):
+        self.client.force_login(self.ceo)
+        response = self.client.get(reverse_lazy("autocomplete-income-invoice", kwargs={"pk": self.order.pk + 1}))
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
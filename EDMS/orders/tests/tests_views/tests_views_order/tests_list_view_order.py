@@ -1,8 +1,13 @@
+from decimal import Decimal
 from http import HTTPStatus
 
 from common_tests.EDMSTestCase import EDMSTestCase
+from companies.factories import CompanyFactory
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
+from invoices.factories import InvoiceFactory
 from orders.factories import OrderFactory
 from orders.models import Order
 
@@ -81,3 +86,61 @@ class OrderListViewTests(EDMSTestCase):
         expected_value = Order.objects.filter(name=self.order.name).count()
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(len(response.context["orders"]), expected_value)
+
+    def test_filter_by_balance(self):
+        my_company = CompanyFactory.create(is_mine=True)
+        losing_order = self.orders[1]
+        losing_order.cost_invoice.add(
+            InvoiceFactory.create(seller=losing_order.company, buyer=my_company, net_price=Decimal(1000))
+        )
+        earning_order = self.orders[2]
+        earning_order.income_invoice.add(
+            InvoiceFactory.create(seller=my_company, buyer=earning_order.company, net_price=Decimal(1000))
+        )
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url, data={"balance__lt": "-0.01"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(list(response.context["orders"]), [losing_order])
+        self.assertEqual(response.context["orders"][0].balance, Decimal(-1000))
+        response = self.client.get(self.view_url, data={"income_net__gt": "1"})
+        self.assertEqual(list(response.context["orders"]), [earning_order])
+
+    def test_ordering_by_balance(self):
+        my_company = CompanyFactory.create(is_mine=True)
+        for net_price, order in zip([3000, 1000, 2000], self.orders):
+            order.income_invoice.add(
+                InvoiceFactory.create(seller=my_company, buyer=order.company, net_price=Decimal(net_price))
+            )
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url, data={"ordering": "-balance"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        balances = [order.balance for order in response.context["orders"]]
+        self.assertEqual(balances[:3], [Decimal(3000), Decimal(2000), Decimal(1000)])
+        self.assertEqual(balances, sorted(balances, reverse=True))
+
+    def test_filter_and_ordering_by_balance_use_stored_columns(self):
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.view_url, data={"balance__gt": "-1", "ordering": "-balance"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        order_queries = [query["sql"] for query in context.captured_queries if 'FROM "orders_order"' in query["sql"]]
+        self.assertTrue(order_queries)
+        self.assertFalse(any("invoices_invoice" in sql for sql in order_queries))
+
+    def test_pagination_keeps_filter_params(self):
+        login = self.client.login(email=self.ceo.email, password=self.password)
+        self.assertTrue(login)
+        response = self.client.get(self.view_url, data={"ordering": "-balance", "page": 1})
+        self.assertEqual(response.context["filter_params"], "ordering=-balance")
+        self.assertContains(response, "?page=2&amp;ordering=-balance")
+
+    def test_number_of_queries_does_not_grow_with_orders(self):
+        Order.objects.all().delete()
+        self.assertQueryBudget(
+            url=self.view_url,
+            user=self.ceo,
+            create_rows=lambda count: OrderFactory.create_batch(count),
+        )
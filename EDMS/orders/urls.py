@@ -5,6 +5,7 @@ from orders.views.views_orders import (
     OrderCreateView,
     OrderDeleteView,
     OrderDetailView,
+    OrderInvoiceAutocompleteView,
     OrderListView,
     OrderManageInvoices,
     OrderUpdateView,
@@ -26,6 +27,16 @@ urlpatterns = [
         OrderManageInvoices.as_view(),
         name="manage-invoice",
     ),
+    path(
+        "orders/<int:pk>/manage-invoices/income-invoices/",
+        OrderInvoiceAutocompleteView.as_view(field_name="income_invoice"),
+        name="autocomplete-income-invoice",
+    ),
+    path(
+        "orders/<int:pk>/manage-invoices/cost-invoices/",
+        OrderInvoiceAutocompleteView.as_view(field_name="cost_invoice"),
+        name="autocomplete-cost-invoice",
+    ),
     path("orders/<int:pk>/delete/", OrderDeleteView.as_view(), name="delete-order"),
     path(
         "orders/<int:pk>/add-protocol/",
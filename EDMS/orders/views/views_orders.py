@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict
 
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.db.models import QuerySet
 from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
 from django.urls import reverse, reverse_lazy
 from django.views.generic import (
     CreateView,
@@ -17,6 +18,9 @@ from orders.forms.forms_manage_invoices import ManageInvoicesForm
 from orders.forms.forms_order import OrderCreateForm, OrderUpdateForm
 from orders.models import Order
 
+from EDMS.autocomplete import AutocompleteView
+from EDMS.pagination import KeysetPaginationMixin
+
 
 class OrderCreateView(PermissionRequiredMixin, CreateView, LoginRequiredMixin):
     permission_required = "orders.add_order"
@@ -46,14 +50,9 @@ class OrderDetailView(PermissionRequiredMixin, DetailView, LoginRequiredMixin):
         cost_invoices = self.object.cost_invoice.select_related("linked_invoice")
         context["cost_invoices"] = cost_invoices
 
-        income_invoices_net_price_sum = self.count_invoices_sum(income_invoices)
-        context["income_invoices_net_price_sum"] = income_invoices_net_price_sum
-
-        cost_invoices_net_price_sum = self.count_invoices_sum(cost_invoices)
-        context["cost_invoices_net_price_sum"] = cost_invoices_net_price_sum
-
-        order_balance = income_invoices_net_price_sum - cost_invoices_net_price_sum
-        context["order_balance"] = order_balance
+        context["income_invoices_net_price_sum"] = self.object.income_net
+        context["cost_invoices_net_price_sum"] = self.object.cost_net
+        context["order_balance"] = self.object.balance
 
         protocols = self.object.protocols.select_related("user").all()
         context["protocols"] = protocols
@@ -61,26 +60,6 @@ class OrderDetailView(PermissionRequiredMixin, DetailView, LoginRequiredMixin):
         context["contract"] = self.object.contract
         return context
 
-    @staticmethod
-    def count_invoices_sum(invoices: List[Union[Invoice | None]]) -> int:
-        """
-        Calculates the total net price of a list of invoices.
-
-        Args:
-            invoices (List[Union[Invoice | None]]): A list of invoices to calculate the sum from.
-
-        Returns:
-            int: The total net price after considering invoice types and linked invoices.
-        """
-        sum_net_price = 0
-        for invoice in invoices:
-            if invoice.type in [Invoice.ORIGINAL, Invoice.DUPLICATE] and invoice.linked_invoice is None:
-                sum_net_price += invoice.net_price
-            elif invoice.type == Invoice.CORRECTING:
-                sum_net_price -= invoice.linked_invoice.net_price
-                sum_net_price += invoice.net_price
-        return sum_net_price
-
 
 class OrderUpdateView(PermissionRequiredMixin, UpdateView, LoginRequiredMixin):
     permission_required = "orders.change_order"
@@ -92,10 +71,10 @@ class OrderUpdateView(PermissionRequiredMixin, UpdateView, LoginRequiredMixin):
         return reverse("detail-order", kwargs={"pk": self.object.pk})
 
 
-class OrderListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
+class OrderListView(PermissionRequiredMixin, KeysetPaginationMixin, ListView, LoginRequiredMixin):
     permission_required = "orders.view_order"
     template_name = "orders/orders/list_order.html"
-    queryset = Order.objects.get_queryset().order_by("id")
+    queryset = Order.objects.order_by("id")
     paginate_by = 10
     context_object_name = "orders"
     filter = None
@@ -111,6 +90,8 @@ class OrderListView(PermissionRequiredMixin, ListView, LoginRequiredMixin):
         queryset = super().get_queryset()
         self.filter = OrderFilter(self.request.GET, queryset=self.queryset)
         queryset = self.filter.qs
+        if self.filter.form.cleaned_data.get("ordering"):
+            queryset = queryset.order_by(*queryset.query.order_by, "id")
         queryset = queryset.select_related("user")
         queryset = queryset.select_related("company")
         return queryset
@@ -136,3 +117,18 @@ class OrderManageInvoices(PermissionRequiredMixin, UpdateView, LoginRequiredMixi
 
     def get_success_url(self) -> str:
         return reverse("detail-order", kwargs={"pk": self.object.pk})
+
+
+class OrderInvoiceAutocompleteView(AutocompleteView):
+    """
+    Searches invoices which ManageInvoicesForm accepts for the order as income or cost invoices.
+    """
+
+    permission_required = "orders.change_order"
+    field_name = "cost_invoice"
+    search_fields = ["name"]
+    ordering = ["-create_date", "-pk"]
+
+    def get_queryset(self) -> QuerySet[Invoice]:
+        order = get_object_or_404(Order, pk=self.kwargs["pk"])
+        return ManageInvoicesForm.get_invoice_queryset(field_name=self.field_name, order=order)
@@ -10,4 +10,4 @@ User = get_user_model()
 class UserModelViewSet(ModelViewSet):
     permission_classes = (CustomDjangoModelPermissions,)
     serializer_class = UserSerializer
-    queryset = User.objects.all()
+    queryset = User.objects.prefetch_related("groups", "user_permissions")
@@ -3,7 +3,9 @@ from typing import Any, Dict
 from celery import shared_task
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import PasswordResetForm
+from django.db.models import Exists, OuterRef
 from django.shortcuts import get_object_or_404
+from employees.models.models_agreement import Agreement
 
 User = get_user_model()
 
@@ -62,17 +64,22 @@ def send_mail_reset_password(
 
 
 @shared_task
-def set_user_is_active_to_false() -> None:
+def set_user_is_active_to_false(dry_run: bool = False) -> Dict[str, int]:
     """
     Set inactive status for users who do not have current agreements.
 
+    Active users other than superusers are deactivated with one UPDATE filtered by a NOT EXISTS subquery on current
+    agreements, so the task takes one query however many users there are.
+
     Args:
-        None
+        dry_run (bool): If True, only count the users who would be deactivated.
 
     Returns:
-        None
+        Dict[str, int]: Number of deactivated users, or of users who would be deactivated in the dry run.
     """
-    for user in User.objects.filter(is_superuser=False):
-        if not user.agreements.filter(is_current=True).exists():
-            user.is_active = False
-            user.save()
+    users = User.objects.filter(is_superuser=False, is_active=True).exclude(
+        Exists(Agreement.objects.filter(user_id=OuterRef("pk"), is_current=True))
+    )
+    if dry_run:
+        return {"deactivated_users": users.count()}
+    return {"deactivated_users": users.update(is_active=False)}
@@ -211,3 +211,10 @@ class UserApiTestCase(EDMSTestCase):
         response = self.client.delete(self.detail_url)
         self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
         self.assertEqual(User.objects.count(), count_object_before_response)
+
+    def test_number_of_queries_of_user_list_does_not_grow_with_users(self):
+        self.assertQueryBudget(
+            url=reverse_lazy("user-list"),
+            user=self.ceo,
+            create_rows=lambda count: UserFactory.create_batch(count),
+        )
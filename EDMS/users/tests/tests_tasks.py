@@ -1,5 +1,6 @@
 from django.test import TestCase
 from employees.factories.factories_agreement import AgreementFactory
+from employees.models.models_agreement import Agreement
 from users.factories import UserFactory
 from users.tasks import set_user_is_active_to_false
 
@@ -24,3 +25,25 @@ class SetUserIsActiveToFalseTest(TestCase):
         set_user_is_active_to_false()
         self.superuser.refresh_from_db()
         self.assertTrue(self.superuser.is_active)
+
+    def test_user_is_deactivated_if_only_past_agreements_exist(self):
+        agreement = AgreementFactory.create(user=self.user)
+        Agreement.objects.filter(pk=agreement.pk).update(is_current=False)
+        set_user_is_active_to_false()
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+
+    def test_report_number_of_deactivated_users(self):
+        UserFactory.create_batch(2, is_superuser=False)
+        self.assertEqual(set_user_is_active_to_false(), {"deactivated_users": 3})
+        self.assertEqual(set_user_is_active_to_false(), {"deactivated_users": 0})
+
+    def test_dry_run_does_not_deactivate_users(self):
+        self.assertEqual(set_user_is_active_to_false(dry_run=True), {"deactivated_users": 1})
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_active)
+
+    def test_number_of_queries_does_not_grow_with_users(self):
+        UserFactory.create_batch(5, is_superuser=False)
+        with self.assertNumQueries(1):
+            set_user_is_active_to_false()